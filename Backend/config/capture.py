@@ -0,0 +1,199 @@
+# config/capture.py
+
+"""
+API 요청 샘플 기록 미들웨어
+
+운영 트래픽의 접근 패턴을 오프라인에서 재현(replay_requests 명령)할 수 있도록
+/api/ 요청 중 REQUEST_CAPTURE_SAMPLE_RATE 비율만 골라 JSONL 파일에 한 줄씩 기록합니다.
+
+- 기록 항목: 시각, 메서드, 경로, 쿼리 문자열, JSON 본문, 익명화한 사용자, 응답 상태, 처리 시간
+- 사용자는 SECRET_KEY로 만든 HMAC 값으로만 남기므로 같은 사용자의 요청끼리 묶을 수는 있지만
+  누구인지는 알 수 없습니다. 비밀번호와 토큰 필드는 본문에서 가립니다.
+- 파일은 워커마다 따로 쓰며(requests-<pid>.jsonl) REQUEST_CAPTURE_MAX_BYTES를 넘으면
+  REQUEST_CAPTURE_BACKUP_COUNT개까지 돌려 가며 보관합니다. (RotatingFileHandler)
+"""
+
+import hashlib
+import hmac
+import json
+import logging
+import os
+import random
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+DEFAULT_SAMPLE_RATE = 0.0
+DEFAULT_PATH_PREFIX = "/api/"
+DEFAULT_MAX_BODY_BYTES = 16 * 1024
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 10
+REDACTED_FIELDS = frozenset({"password", "password2", "refresh", "access", "token"})
+REDACTED = "***"
+
+
+class CaptureWriter:
+    """한 워커의 기록 파일. 여러 스레드가 함께 써도 줄이 섞이지 않습니다."""
+
+    def __init__(self, directory: Path, max_bytes: int, backup_count: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"requests-{os.getpid()}.jsonl"
+        self._handler = RotatingFileHandler(
+            self.path,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+        self._handler.setFormatter(logging.Formatter("%(message)s"))
+
+    def write(self, record: dict) -> None:
+        line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        self._handler.handle(logging.LogRecord("capture", logging.INFO, "", 0, line, None, None))
+
+    def close(self) -> None:
+        self._handler.close()
+
+
+class RequestCaptureMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, "REQUEST_CAPTURE_SAMPLE_RATE", DEFAULT_SAMPLE_RATE)
+        self.path_prefix = getattr(settings, "REQUEST_CAPTURE_PATH_PREFIX", DEFAULT_PATH_PREFIX)
+        self.max_body_bytes = getattr(
+            settings, "REQUEST_CAPTURE_MAX_BODY_BYTES", DEFAULT_MAX_BODY_BYTES
+        )
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        if not self.should_capture(request):
+            return self.get_response(request)
+        # 뷰가 본문 스트림을 읽기 전에 복사해 둡니다.
+        body = self.capture_body(request)
+        started = time.monotonic()
+        response = self.get_response(request)
+        get_writer().write(self.build_record(request, response, body, started))
+        return response
+
+    async def __acall__(self, request):
+        if not self.should_capture(request):
+            return await self.get_response(request)
+        body = self.capture_body(request)
+        started = time.monotonic()
+        response = await self.get_response(request)
+        # 파일 쓰기(회전 포함)가 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        record = self.build_record(request, response, body, started)
+        await sync_to_async(get_writer().write, thread_sensitive=False)(record)
+        return response
+
+    def should_capture(self, request) -> bool:
+        return (
+            self.sample_rate > 0
+            and request.path.startswith(self.path_prefix)
+            and random.random() < self.sample_rate
+        )
+
+    def capture_body(self, request):
+        if request.content_type != "application/json":
+            return None
+        length = int(request.headers.get("Content-Length") or 0)
+        if not length or length > self.max_body_bytes:
+            return None
+        try:
+            return redact(json.loads(request.body))
+        except ValueError:
+            return None
+
+    def build_record(self, request, response, body, started: float) -> dict:
+        # DRF가 인증한 사용자는 뷰를 실행한 뒤에야 request.user에 들어 있습니다.
+        user = getattr(request, "user", None)
+        return {
+            "ts": round(time.time(), 3),
+            "method": request.method,
+            "path": request.path,
+            "query": request.META.get("QUERY_STRING", ""),
+            "body": body,
+            "user": anonymize_user(user.pk) if user and user.is_authenticated else None,
+            "status": response.status_code,
+            "duration_ms": round((time.monotonic() - started) * 1000, 3),
+        }
+
+
+def redact(value):
+    """JSON 값에서 비밀번호/토큰 필드를 가립니다."""
+    if isinstance(value, dict):
+        return {
+            key: REDACTED if key in REDACTED_FIELDS else redact(item) for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+def anonymize_user(user_id) -> str:
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(), str(user_id).encode(), hashlib.sha256
+    ).hexdigest()
+    return digest[:16]
+
+
+def read_capture(paths) -> list[dict]:
+    """기록 파일들을 읽어 시각 순으로 정렬한 요청 목록을 반환합니다."""
+    records = []
+    for path in paths:
+        with open(path, encoding="utf-8") as capture:
+            records.extend(json.loads(line) for line in capture if line.strip())
+    records.sort(key=lambda record: record["ts"])
+    return records
+
+
+_writer: CaptureWriter | None = None
+_writer_lock = threading.Lock()
+
+
+def get_writer() -> CaptureWriter:
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = CaptureWriter(
+                    Path(
+                        getattr(
+                            settings,
+                            "REQUEST_CAPTURE_DIR",
+                            settings.BASE_DIR / "logs/requests",
+                        )
+                    ),
+                    max_bytes=getattr(settings, "REQUEST_CAPTURE_MAX_BYTES", DEFAULT_MAX_BYTES),
+                    backup_count=getattr(
+                        settings, "REQUEST_CAPTURE_BACKUP_COUNT", DEFAULT_BACKUP_COUNT
+                    ),
+                )
+    return _writer
+
+
+def reset() -> None:
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            _writer.close()
+        _writer = None
+
+
+@receiver(setting_changed, dispatch_uid="config.capture.setting_changed")
+def _on_setting_changed(sender, setting, **kwargs):
+    if setting.startswith("REQUEST_CAPTURE"):
+        reset()
@@ -0,0 +1,172 @@
+# config/db_router.py
+
+"""
+읽기 전용 복제본(replica) 라우팅
+
+- 쓰기는 항상 primary(default)로 보냅니다.
+- 읽기는 ReplicaReadMixin을 사용하는 읽기 전용 API에서만 복제본으로 보냅니다.
+- 예약/취소 직후의 사용자는 REPLICA_PIN_SECONDS 동안 primary에 고정되어
+  자신이 방금 쓴 데이터를 바로 읽을 수 있습니다. (read-your-writes)
+  다음 읽기는 다른 워커가 받을 수 있으므로 고정 여부는 워커들이 함께 쓰는
+  REPLICA_PIN_CACHE 캐시에 둡니다.
+- 복제 지연이 REPLICA_MAX_LAG_SECONDS를 넘는 복제본은 선택하지 않습니다.
+"""
+
+import contextvars
+import logging
+import random
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+PRIMARY_DATABASE = "default"
+
+# 현재 요청에서 읽기 쿼리를 보낼 DB 별칭. None이면 primary를 사용합니다.
+_read_database: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "read_database", default=None
+)
+
+# 복제본별 (측정 시각, 지연 초) 캐시. 워커마다 따로 유지됩니다.
+_lag_cache: dict[str, tuple[float, float]] = {}
+_lag_lock = threading.Lock()
+
+
+class PrimaryReplicaRouter:
+    """요청 컨텍스트에 지정된 DB로 읽기를 보내고, 쓰기는 primary로 보내는 라우터"""
+
+    def db_for_read(self, model, **hints):
+        return get_read_database() or PRIMARY_DATABASE
+
+    def db_for_write(self, model, **hints):
+        return PRIMARY_DATABASE
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # primary와 복제본은 같은 데이터를 가지므로 서로 간의 관계를 허용합니다.
+        databases = {PRIMARY_DATABASE, *get_replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return None
+
+
+class ReplicaReadMixin:
+    """
+    읽기 전용 APIView에 섞어 사용합니다.
+    인증이 끝난 뒤 사용자를 기준으로 읽기 DB를 고르고, 응답이 완성되면 원래대로 되돌립니다.
+    """
+
+    _read_database_token: contextvars.Token | None = None
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._read_database_token = _read_database.set(choose_read_database(request.user))
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self._read_database_token is not None:
+            _read_database.reset(self._read_database_token)
+            self._read_database_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
+def get_read_database() -> str | None:
+    """현재 요청에서 선택된 읽기 DB. 선택되지 않았으면 None"""
+    return _read_database.get()
+
+
+def get_replicas() -> list[str]:
+    return list(getattr(settings, "DATABASE_REPLICAS", []))
+
+
+def pin_to_primary(user) -> None:
+    """쓰기 직후의 사용자를 일정 시간 동안 primary에서 읽도록 고정합니다."""
+    if not getattr(user, "is_authenticated", False) or not get_replicas():
+        return
+    _pin_cache().set(_pin_key(user), True, timeout=getattr(settings, "REPLICA_PIN_SECONDS", 5))
+
+
+def is_pinned_to_primary(user) -> bool:
+    if not getattr(user, "is_authenticated", False):
+        return False
+    return bool(_pin_cache().get(_pin_key(user)))
+
+
+def _pin_cache():
+    return caches[getattr(settings, "REPLICA_PIN_CACHE", "default")]
+
+
+def choose_read_database(user) -> str:
+    """
+    읽기 DB를 선택합니다.
+    primary에 고정된 사용자이거나, 허용 지연 이내의 복제본이 없으면 primary를 반환합니다.
+    """
+    replicas = get_replicas()
+    if not replicas or is_pinned_to_primary(user):
+        return PRIMARY_DATABASE
+
+    max_lag = getattr(settings, "REPLICA_MAX_LAG_SECONDS", 2.0)
+    healthy = [alias for alias in replicas if replica_lag(alias) <= max_lag]
+    if not healthy:
+        return PRIMARY_DATABASE
+    return random.choice(healthy)
+
+
+def replica_lag(alias: str) -> float:
+    """
+    복제본의 지연 시간(초)을 반환합니다.
+    매 요청마다 측정하지 않도록 REPLICA_LAG_CHECK_INTERVAL 동안 결과를 재사용합니다.
+    """
+    interval = getattr(settings, "REPLICA_LAG_CHECK_INTERVAL", 1.0)
+    now = time.monotonic()
+    cached = _lag_cache.get(alias)
+    if cached is not None and now - cached[0] < interval:
+        return cached[1]
+
+    with _lag_lock:
+        cached = _lag_cache.get(alias)
+        if cached is not None and now - cached[0] < interval:
+            return cached[1]
+        lag = measure_replica_lag(alias)
+        _lag_cache[alias] = (now, lag)
+        return lag
+
+
+def measure_replica_lag(alias: str) -> float:
+    """
+    복제본에 직접 지연 시간을 질의합니다.
+    측정할 수 없는 복제본(복제 중단, 연결 실패)은 무한대 지연으로 간주하여 제외합니다.
+    """
+    connection = connections[alias]
+    if connection.vendor != "mysql":
+        # SQLite 등 복제 상태를 제공하지 않는 백엔드는 지연이 없다고 봅니다.
+        return 0.0
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW REPLICA STATUS")
+            row = cursor.fetchone()
+            columns = [col[0] for col in cursor.description or []]
+    except DatabaseError:
+        logger.warning("Could not measure replication lag for %s", alias, exc_info=True)
+        return float("inf")
+
+    if row is None:
+        # 복제 설정이 없는 서버(예: primary 자체를 가리키는 경우)
+        return 0.0
+    status = dict(zip(columns, row))
+    seconds = status.get("Seconds_Behind_Source", status.get("Seconds_Behind_Master"))
+    return float("inf") if seconds is None else float(seconds)
+
+
+def reset_lag_cache() -> None:
+    _lag_cache.clear()
+
+
+def _pin_key(user) -> str:
+    return f"replica-pin:{user.pk}"
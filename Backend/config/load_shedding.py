@@ -0,0 +1,224 @@
+# config/load_shedding.py
+
+"""
+적응형 부하 차단(load shedding) 미들웨어
+
+DB가 느려지면 워커 안에 요청이 쌓여 모든 요청이 시간 초과로 끝납니다.
+이 미들웨어는 워커별로 동시에 처리 중인 요청 수를 세고, 허용치를 넘는 요청은
+뷰를 실행하기 전에 503과 Retry-After로 바로 거절합니다.
+
+- 허용치(limit)는 적응형입니다. 요청의 처리 시간이 LOAD_SHEDDING_TARGET_DELAY_MS를 넘으면
+  줄이고(곱셈 감소), 목표 안에 들어오면 조금씩 늘립니다(덧셈 증가). (AIMD)
+- 앞단 프록시가 X-Request-Start 헤더를 넣는 배포에서는 LOAD_SHEDDING_TRUST_REQUEST_START로
+  프록시 대기 시간을 대신 쓸 수 있습니다. 클라이언트가 직접 보낸 헤더를 믿으면 누구나 큰 대기
+  시간을 보내 limit을 하한까지 줄일 수 있으므로, 프록시가 이 헤더를 덮어쓸 때만 켭니다.
+- 엔드포인트마다 우선순위 등급이 있어, 등급별로 limit의 일정 비율까지만 쓸 수 있습니다.
+  혼잡해지면 낮은 등급(회원가입 등)부터 거절되고 예약은 마지막까지 처리됩니다.
+- 롱 폴링처럼 대부분의 시간을 기다리며 보내는 엔드포인트는 제외합니다. (exempt)
+- 현재 limit과 등급별 처리 중/거절 수는 /api/seats/metrics/에서 볼 수 있습니다. (snapshot)
+"""
+
+import math
+import threading
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import JsonResponse
+from django.urls import Resolver404, resolve
+
+CRITICAL = "critical"
+NORMAL = "normal"
+LOW = "low"
+EXEMPT = "exempt"
+
+# 등급별로 사용할 수 있는 limit의 비율
+CLASS_SHARES = {CRITICAL: 1.0, NORMAL: 0.8, LOW: 0.5}
+# 등급별 Retry-After 배수. 낮은 등급일수록 더 늦게 다시 시도하게 합니다.
+RETRY_AFTER_FACTORS = {CRITICAL: 1, NORMAL: 2, LOW: 4}
+
+DEFAULT_PRIORITIES = {
+    "seat-reserve": CRITICAL,
+    "seat-reserve-best-available": CRITICAL,
+    "seat-reserve-any": CRITICAL,
+    "seat-cancel": CRITICAL,
+    "seat-list": NORMAL,
+    "seat-availability": NORMAL,
+    "seat-layout": NORMAL,
+    "seat-layout-content": NORMAL,
+    "my-reservations": NORMAL,
+    "my-reservation-history": NORMAL,
+    "login": NORMAL,
+    "logout": NORMAL,
+    "seat-changes": EXEMPT,
+    "signup": LOW,
+    "seat-export": LOW,
+}
+DEFAULT_MAX_IN_FLIGHT = 64
+DEFAULT_MIN_IN_FLIGHT = 4
+DEFAULT_TARGET_DELAY_MS = 200.0
+# limit을 줄인 뒤 다음 감소까지 기다리는 시간(초). 한 번의 혼잡에 연달아 줄어들지 않게 합니다.
+DECREASE_INTERVAL = 0.5
+DECREASE_FACTOR = 0.9
+
+
+class AdaptiveLimiter:
+    """워커 하나의 동시 처리 허용치와 등급별 처리 중인 요청 수"""
+
+    def __init__(
+        self,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        min_in_flight: int = DEFAULT_MIN_IN_FLIGHT,
+        target_delay: float = DEFAULT_TARGET_DELAY_MS / 1000,
+        clock=time.monotonic,
+    ):
+        self.max_in_flight = max_in_flight
+        self.min_in_flight = min(min_in_flight, max_in_flight)
+        self.target_delay = target_delay
+        self.clock = clock
+        self.limit = float(max_in_flight)
+        self.in_flight = 0
+        self.in_flight_by_class = {name: 0 for name in CLASS_SHARES}
+        self.shed_by_class = {name: 0 for name in CLASS_SHARES}
+        self._decreased_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def try_acquire(self, priority: str) -> bool:
+        with self._lock:
+            if self.in_flight >= self.limit * CLASS_SHARES[priority]:
+                self.shed_by_class[priority] += 1
+                return False
+            self.in_flight += 1
+            self.in_flight_by_class[priority] += 1
+            return True
+
+    def release(self, priority: str, delay: float) -> None:
+        """요청을 마치고, 그 요청의 대기(또는 처리) 시간으로 limit을 조정합니다."""
+        with self._lock:
+            self.in_flight -= 1
+            self.in_flight_by_class[priority] -= 1
+            if delay > self.target_delay:
+                now = self.clock()
+                if now - self._decreased_at >= DECREASE_INTERVAL:
+                    self._decreased_at = now
+                    self.limit = max(self.min_in_flight, self.limit * DECREASE_FACTOR)
+            else:
+                self.limit = min(self.max_in_flight, self.limit + 1 / self.limit)
+
+    def retry_after(self, priority: str) -> int:
+        # limit이 많이 줄어들었을수록(혼잡할수록) 더 늦게 다시 시도하게 합니다.
+        pressure = self.max_in_flight / max(self.limit, 1)
+        return max(1, math.ceil(pressure * RETRY_AFTER_FACTORS[priority]))
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": dict(self.in_flight_by_class),
+                "shed": dict(self.shed_by_class),
+            }
+
+
+class LoadSheddingMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = getattr(settings, "LOAD_SHEDDING_ENABLED", True)
+        self.priorities = getattr(settings, "LOAD_SHEDDING_PRIORITIES", DEFAULT_PRIORITIES)
+        self.default_priority = getattr(settings, "LOAD_SHEDDING_DEFAULT_PRIORITY", NORMAL)
+        self.limiter = AdaptiveLimiter(
+            max_in_flight=getattr(settings, "LOAD_SHEDDING_MAX_IN_FLIGHT", DEFAULT_MAX_IN_FLIGHT),
+            min_in_flight=getattr(settings, "LOAD_SHEDDING_MIN_IN_FLIGHT", DEFAULT_MIN_IN_FLIGHT),
+            target_delay=getattr(settings, "LOAD_SHEDDING_TARGET_DELAY_MS", DEFAULT_TARGET_DELAY_MS)
+            / 1000,
+        )
+        self.trust_request_start = getattr(settings, "LOAD_SHEDDING_TRUST_REQUEST_START", False)
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+        global _limiter
+        _limiter = self.limiter
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        priority = self.priority_for(request)
+        if priority == EXEMPT or not self.enabled:
+            return self.get_response(request)
+        if not self.limiter.try_acquire(priority):
+            return self.reject(priority)
+
+        started = time.monotonic()
+        try:
+            return self.get_response(request)
+        finally:
+            self.limiter.release(priority, self.delay_for(request, started))
+
+    async def __acall__(self, request):
+        priority = self.priority_for(request)
+        if priority == EXEMPT or not self.enabled:
+            return await self.get_response(request)
+        if not self.limiter.try_acquire(priority):
+            return self.reject(priority)
+
+        started = time.monotonic()
+        try:
+            return await self.get_response(request)
+        finally:
+            self.limiter.release(priority, self.delay_for(request, started))
+
+    def priority_for(self, request) -> str:
+        try:
+            url_name = resolve(request.path_info).url_name
+        except Resolver404:
+            return self.default_priority
+        return self.priorities.get(url_name, self.default_priority)
+
+    def delay_for(self, request, started: float) -> float:
+        """
+        이 요청의 처리 시간을 혼잡 신호로 씁니다.
+        LOAD_SHEDDING_TRUST_REQUEST_START이면 프록시 대기 시간(X-Request-Start)을 우선합니다.
+        """
+        if self.trust_request_start:
+            queued = queue_delay(request.headers.get("X-Request-Start"))
+            if queued is not None:
+                return queued
+        return time.monotonic() - started
+
+    def reject(self, priority: str) -> JsonResponse:
+        response = JsonResponse(
+            {"error": "요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요."},
+            status=503,
+        )
+        response["Retry-After"] = str(self.limiter.retry_after(priority))
+        return response
+
+
+# 이 프로세스의 미들웨어가 쓰는 limiter (metrics API에서 조회)
+_limiter: AdaptiveLimiter | None = None
+
+
+def snapshot() -> dict | None:
+    """현재 워커의 limit과 등급별 처리 중/거절 요청 수. 미들웨어가 없으면 None입니다."""
+    limiter = _limiter
+    return limiter.snapshot() if limiter is not None else None
+
+
+def queue_delay(header: str | None, now: float | None = None) -> float | None:
+    """
+    X-Request-Start 헤더(nginx: "t=1700000000.123", 밀리/마이크로초 정수 포함)로
+    프록시가 요청을 받은 뒤 지금까지 기다린 시간(초)을 계산합니다.
+    """
+    if not header:
+        return None
+    try:
+        started = float(header.removeprefix("t="))
+    except ValueError:
+        return None
+    # 단위를 자릿수로 판단합니다. (초 10자리, 밀리초 13자리, 마이크로초 16자리)
+    while started > 1e11:
+        started /= 1000
+    now = time.time() if now is None else now
+    return max(0.0, now - started)
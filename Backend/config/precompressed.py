@@ -0,0 +1,119 @@
+# config/precompressed.py
+
+"""
+미리 압축해 둔 응답 본문
+
+자주 요청되지만 가끔만 바뀌는 응답(OpenAPI 스키마, 좌석 배치도 스냅샷)을 한 번만 직렬화/압축해 두고,
+요청의 Accept-Encoding에 맞는 본문을 강한 ETag와 함께 그대로 돌려줍니다.
+brotli 패키지(requirements.txt)가 설치되어 있으면 br 인코딩도 함께 만듭니다.
+"""
+
+import gzip
+import hashlib
+from dataclasses import dataclass
+
+from django.http import HttpResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
+from django.utils.http import parse_etags
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+IDENTITY = "identity"
+# q 값이 같으면 앞의 인코딩을 고릅니다.
+PREFERRED_ENCODINGS = ("br", "gzip")
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q 값}으로 바꿉니다. (q가 없으면 1, 잘못된 q는 0)"""
+    accepted = {}
+    for item in header.split(","):
+        name, _, params = item.partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        accepted[name] = quality
+    return accepted
+
+
+@dataclass(frozen=True)
+class PrecompressedBody:
+    content_type: str
+    digest: str
+    encodings: dict[str, bytes]
+
+    @classmethod
+    def build(cls, body: bytes, content_type: str) -> "PrecompressedBody":
+        encodings = {
+            IDENTITY: body,
+            "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+        }
+        if brotli is not None:
+            encodings["br"] = brotli.compress(body)
+        return cls(
+            content_type=content_type,
+            digest=hashlib.sha256(body).hexdigest()[:32],
+            encodings=encodings,
+        )
+
+    @property
+    def body(self) -> bytes:
+        return self.encodings[IDENTITY]
+
+    def choose_encoding(self, accept_encoding: str) -> str:
+        """
+        q 값이 가장 높은 압축 인코딩을 고릅니다.
+        q=0인 인코딩은 받지 않는다는 뜻이므로 제외하고, 고를 것이 없으면 identity를 씁니다.
+        """
+        accepted = parse_accept_encoding(accept_encoding)
+        chosen, chosen_quality = IDENTITY, 0.0
+        for encoding in PREFERRED_ENCODINGS:
+            quality = accepted.get(encoding, accepted.get("*", 0.0))
+            if encoding in self.encodings and quality > chosen_quality:
+                chosen, chosen_quality = encoding, quality
+        return chosen
+
+    def etag_for(self, encoding: str) -> str:
+        # 인코딩마다 본문 바이트가 다르므로 강한 ETag도 인코딩별로 구분합니다.
+        if encoding == IDENTITY:
+            return f'"{self.digest}"'
+        return f'"{self.digest}-{encoding}"'
+
+    def negotiate(self, request) -> tuple[str, str, bool]:
+        """
+        요청에 맞는 (인코딩, ETag, 304 여부)를 고릅니다.
+        If-None-Match가 같은 ETag를 가지고 있으면 본문 없이 304로 응답하면 됩니다.
+        """
+        encoding = self.choose_encoding(request.headers.get("Accept-Encoding", ""))
+        etag = self.etag_for(encoding)
+        if_none_match = parse_etags(request.headers.get("If-None-Match", ""))
+        return encoding, etag, etag in if_none_match or "*" in if_none_match
+
+    def apply_headers(self, response, encoding: str, etag: str, cache_control: str):
+        response["ETag"] = etag
+        response["Cache-Control"] = cache_control
+        if encoding != IDENTITY and response.status_code != 304:
+            response["Content-Encoding"] = encoding
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+    def response(self, request, cache_control: str = "no-cache") -> HttpResponse:
+        """요청에 맞는 인코딩의 본문으로 응답합니다."""
+        encoding, etag, not_modified = self.negotiate(request)
+        if not_modified:
+            response = HttpResponseNotModified()
+        else:
+            body = self.encodings[encoding]
+            response = HttpResponse(body, content_type=self.content_type)
+            response["Content-Length"] = str(len(body))
+        self.apply_headers(response, encoding, etag, cache_control)
+        return response
@@ -0,0 +1,177 @@
+# config/replay.py
+
+"""
+기록한 요청(config/capture.py) 재현
+
+기록 파일의 요청을 원래 간격(speed배로 빠르게)대로 대상 서버에 다시 보내고,
+엔드포인트별로 기록 당시와 재현한 처리 시간을 비교합니다.
+요청은 concurrency개의 스레드가 나누어 보내며, 스레드가 모두 바쁘면 예정 시각보다 늦게
+보내므로 그 지연(lag)도 함께 집계합니다.
+
+기록에는 비밀번호와 토큰이 가려져 있으므로 인증 엔드포인트(회원가입/로그인/로그아웃)는 재현하지
+않고, 로그인했던 요청에는 미리 발급한 토큰(provision_users --tokens-out)을 붙입니다.
+기록의 익명화한 사용자마다 토큰을 하나씩 배정하므로 같은 사용자의 요청은 같은 토큰으로 보냅니다.
+"""
+
+import json
+import math
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from django.urls import Resolver404, resolve
+
+# 기록에서 비밀번호/토큰이 가려져 재현할 수 없는 엔드포인트 (URL 이름)
+AUTH_URL_NAMES = frozenset({"signup", "login", "logout"})
+
+
+@dataclass(frozen=True)
+class ReplayResult:
+    record: dict
+    status: int | None
+    duration_ms: float
+    lag_ms: float
+    error: str | None = None
+
+
+def replay(
+    records: list[dict],
+    base_url: str,
+    *,
+    speed: float = 1.0,
+    concurrency: int = 8,
+    tokens: list[str] | None = None,
+    timeout: float = 30.0,
+) -> list[ReplayResult]:
+    """
+    records를 base_url로 보냅니다. speed가 0이면 간격 없이 가능한 한 빨리 보냅니다.
+    tokens가 있으면 기록 당시 로그인했던 요청에 사용자별로 배정한 Bearer 토큰을 붙입니다.
+    """
+    if not records:
+        return []
+    first = records[0]["ts"]
+    started = time.monotonic()
+    user_tokens = assign_tokens(records, tokens or [])
+
+    def send(record: dict, scheduled: float) -> ReplayResult:
+        lag = max(0.0, time.monotonic() - scheduled)
+        return _send(record, base_url, user_tokens.get(record.get("user")), timeout, lag)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = []
+        for record in records:
+            scheduled = started
+            if speed > 0:
+                scheduled += (record["ts"] - first) / speed
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(send, record, scheduled))
+        return [future.result() for future in futures]
+
+
+def _send(record, base_url, token, timeout, lag) -> ReplayResult:
+    url = base_url.rstrip("/") + record["path"]
+    if record.get("query"):
+        url += "?" + record["query"]
+    headers = {"Accept": "application/json"}
+    data = None
+    if record.get("body") is not None:
+        data = json.dumps(record["body"]).encode()
+        headers["Content-Type"] = "application/json"
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    request = urllib.request.Request(url, data=data, headers=headers, method=record["method"])
+
+    started = time.monotonic()
+    status = error = None
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as exc:
+        exc.read()
+        status = exc.code
+    except (urllib.error.URLError, TimeoutError, ConnectionError) as exc:
+        error = str(getattr(exc, "reason", exc))
+    return ReplayResult(
+        record=record,
+        status=status,
+        duration_ms=(time.monotonic() - started) * 1000,
+        lag_ms=lag * 1000,
+        error=error,
+    )
+
+
+def is_auth_request(record: dict) -> bool:
+    try:
+        return resolve(record["path"]).url_name in AUTH_URL_NAMES
+    except Resolver404:
+        return False
+
+
+def read_tokens(path) -> list[str]:
+    """provision_users --tokens-out으로 저장한 JSONL에서 access 토큰 목록을 읽습니다."""
+    with open(path, encoding="utf-8") as token_file:
+        return [json.loads(line)["access"] for line in token_file if line.strip()]
+
+
+def assign_tokens(records: list[dict], tokens: list[str]) -> dict[str, str]:
+    """
+    기록의 익명화한 사용자마다 처음 나온 순서대로 토큰을 하나씩 배정합니다.
+    사용자가 토큰보다 많으면 토큰을 돌려 가며 씁니다.
+    """
+    if not tokens:
+        return {}
+    users = dict.fromkeys(record["user"] for record in records if record.get("user"))
+    return {user: tokens[index % len(tokens)] for index, user in enumerate(users)}
+
+
+def endpoint_name(record: dict) -> str:
+    """URL 이름(없으면 경로)으로 엔드포인트를 묶습니다. (좌석 번호 등 경로 변수 제외)"""
+    try:
+        name = resolve(record["path"]).url_name
+    except Resolver404:
+        name = None
+    return f"{record['method']} {name or record['path']}"
+
+
+def summarize(results: list[ReplayResult]) -> list[dict]:
+    """엔드포인트별 기록/재현 처리 시간(p50, p95)과 차이, 상태 코드 불일치, 오류 수"""
+    groups: dict[str, list[ReplayResult]] = defaultdict(list)
+    for result in results:
+        groups[endpoint_name(result.record)].append(result)
+
+    rows = []
+    for endpoint, group in sorted(groups.items()):
+        captured = sorted(result.record["duration_ms"] for result in group)
+        replayed = sorted(result.duration_ms for result in group)
+        rows.append(
+            {
+                "endpoint": endpoint,
+                "count": len(group),
+                "captured_p50": percentile(captured, 50),
+                "captured_p95": percentile(captured, 95),
+                "replayed_p50": percentile(replayed, 50),
+                "replayed_p95": percentile(replayed, 95),
+                "delta_p50": percentile(replayed, 50) - percentile(captured, 50),
+                "status_mismatches": sum(
+                    result.error is None and result.status != result.record["status"]
+                    for result in group
+                ),
+                "errors": sum(result.error is not None for result in group),
+                "max_lag": max(result.lag_ms for result in group),
+            }
+        )
+    return rows
+
+
+def percentile(values: list[float], percent: float) -> float:
+    """정렬된 values의 nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(values)))
+    return values[rank - 1]
@@ -0,0 +1,103 @@
+# config/schema.py
+
+"""
+OpenAPI 스키마 캐시 (API_DOCS_ENABLED일 때만 사용)
+
+SpectacularAPIView는 요청마다 모든 뷰를 훑어 스키마를 새로 만들고, Swagger/Redoc은
+페이지를 열 때마다 스키마를 받아 갑니다. 여기서는 스키마를 한 번만 만들어
+compact JSON과 미리 압축한 본문, 강한 ETag로 보관해 두고 그대로 응답합니다.
+
+- 빌드 시: `python manage.py build_api_schema`가 API_SCHEMA_FILE에 저장합니다.
+- 실행 시: 파일이 있으면 읽고, 없으면 첫 요청 때 생성합니다.
+
+뷰는 drf_spectacular 대신 이 모듈의 extend_schema/OpenApiExample을 씁니다.
+API 문서를 끄면 아무것도 하지 않는 대체 구현이므로 워커가 drf_spectacular를 불러오지 않습니다.
+"""
+
+import json
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.views import View
+
+from .precompressed import PrecompressedBody
+
+if getattr(settings, "API_DOCS_ENABLED", False):
+    from drf_spectacular.utils import OpenApiExample, extend_schema
+else:
+
+    def extend_schema(*args, **kwargs):
+        """API 문서를 끄면 뷰를 그대로 반환하는 데코레이터"""
+
+        def decorator(view):
+            return view
+
+        return decorator
+
+    class OpenApiExample:
+        """API 문서를 끄면 사용하지 않는 예시"""
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+
+CONTENT_TYPE = "application/vnd.oai.openapi+json"
+
+_schema: PrecompressedBody | None = None
+_lock = threading.Lock()
+
+
+def generate_schema() -> bytes:
+    """모든 뷰를 훑어 OpenAPI 스키마를 compact JSON으로 만듭니다."""
+    # drf_spectacular는 스키마를 실제로 만들 때만 불러옵니다.
+    from drf_spectacular.renderers import OpenApiJsonRenderer
+    from drf_spectacular.settings import spectacular_settings
+
+    generator = spectacular_settings.DEFAULT_GENERATOR_CLASS()
+    schema = generator.get_schema(request=None, public=True)
+    # 렌더러는 들여쓰기를 넣으므로 공백 없는 JSON으로 다시 직렬화합니다.
+    rendered = OpenApiJsonRenderer().render(schema, renderer_context={})
+    return json.dumps(json.loads(rendered), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def get_schema_file() -> Path | None:
+    path = getattr(settings, "API_SCHEMA_FILE", None)
+    return Path(path) if path else None
+
+
+def write_schema_file(path: Path | None = None) -> Path:
+    """스키마를 생성해 파일로 저장합니다. (빌드/배포 단계에서 실행)"""
+    path = path or get_schema_file()
+    if path is None:
+        raise ValueError("API_SCHEMA_FILE이 설정되어 있지 않습니다.")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(generate_schema())
+    return path
+
+
+def get_schema() -> PrecompressedBody:
+    global _schema
+    if _schema is None:
+        with _lock:
+            if _schema is None:
+                path = get_schema_file()
+                if path is not None and path.exists():
+                    body = path.read_bytes()
+                else:
+                    body = generate_schema()
+                _schema = PrecompressedBody.build(body, CONTENT_TYPE)
+    return _schema
+
+
+def reset_schema() -> None:
+    global _schema
+    with _lock:
+        _schema = None
+
+
+class SchemaView(View):
+    """캐시된 OpenAPI 스키마를 반환합니다. (SpectacularAPIView 대체)"""
+
+    def get(self, request, *args, **kwargs):
+        return get_schema().response(request)
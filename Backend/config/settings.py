@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from config.sqlite import sqlite_database
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -28,6 +30,12 @@ DEBUG = True
 
 ALLOWED_HOSTS = ["*"]
 
+# API 문서(Swagger/Redoc) 사용 여부. 끄면 워커가 drf_spectacular를 불러오지 않습니다.
+API_DOCS_ENABLED = os.getenv("API_DOCS_ENABLED", "true").lower() == "true"
+# build_api_schema 명령으로 미리 만들어 둔 OpenAPI 스키마 파일 (없으면 첫 요청 때 생성)
+# 빌드 산출물이므로 소스와 섞이지 않게 build/ 아래에 둡니다. (.gitignore에 포함)
+API_SCHEMA_FILE = os.getenv("API_SCHEMA_FILE", str(BASE_DIR / "build/openapi.json"))
+
 
 # Application definition
 
@@ -40,7 +48,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "rest_framework_simplejwt",
-    "drf_spectacular",
+    *(["drf_spectacular"] if API_DOCS_ENABLED else []),
     "corsheaders",
     "seats",
     "users",
@@ -48,10 +56,12 @@ INSTALLED_APPS = [
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        # 로그아웃으로 폐기된 토큰을 거부하는 JWTAuthentication
+        "users.authentication.RevocableJWTAuthentication",
     ),
-    "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
+if API_DOCS_ENABLED:
+    REST_FRAMEWORK["DEFAULT_SCHEMA_CLASS"] = "drf_spectacular.openapi.AutoSchema"
 
 SPECTACULAR_SETTINGS = {
     "TITLE": "Ticket Reservation API",
@@ -65,6 +75,10 @@ SPECTACULAR_SETTINGS = {
 
 MIDDLEWARE = [
     "corsheaders.middleware.CorsMiddleware",
+    # 거절된 요청까지 들어온 그대로 기록하도록 부하 차단보다 앞에 둡니다.
+    "config.capture.RequestCaptureMiddleware",
+    # 혼잡할 때 거절하는 응답에도 CORS 헤더가 붙도록 CorsMiddleware 바로 다음에 둡니다.
+    "config.load_shedding.LoadSheddingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -87,9 +101,7 @@ DATABASES = {
         "ENGINE": "django.db.backends.mysql",
         "NAME": os.getenv("DB_NAME", "ticket_db"),  # 환경 변수가 없으면 기본값 사용
         "USER": os.getenv("DB_USER", "user"),  # 환경 변수가 없으면 기본값 사용
-        "PASSWORD": os.getenv(
-            "DB_PASSWORD", "password"
-        ),  # 환경 변수가 없으면 기본값 사용
+        "PASSWORD": os.getenv("DB_PASSWORD", "password"),  # 환경 변수가 없으면 기본값 사용
         "HOST": os.getenv("DB_HOST", "db"),
         "PORT": os.getenv("DB_PORT", "3306"),
         "OPTIONS": {"init_command": "SET sql_mode='STRICT_TRANS_TABLES'"},
@@ -103,6 +115,228 @@ DATABASES["default"]["TEST"] = {
     "PASSWORD": os.getenv("DB_PASSWORD", "password"),
 }
 
+# 단일 서버 배포용 SQLite 프로필 (config/sqlite.py)
+# DB_ENGINE=sqlite이면 MySQL 대신 SQLITE_NAME 파일을 WAL, BEGIN IMMEDIATE로 사용합니다.
+# SQLITE_BUSY_TIMEOUT은 다른 쓰기를 기다리는 최대 시간(초)입니다.
+if os.getenv("DB_ENGINE", "mysql") == "sqlite":
+    DATABASES = {
+        "default": sqlite_database(
+            os.getenv("SQLITE_NAME", str(BASE_DIR / "db.sqlite3")),
+            busy_timeout=float(os.getenv("SQLITE_BUSY_TIMEOUT", "20")),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", "NORMAL"),
+        )
+    }
+
+# 읽기 전용 복제본(replica) 설정
+# DB_REPLICA_HOSTS에 쉼표로 구분된 호스트를 지정하면 replica_1, replica_2, ... 로 등록됩니다.
+# 복제본은 primary와 같은 계정/DB 이름을 사용하며, 테스트 시에는 primary를 그대로 사용합니다.
+DATABASE_REPLICAS = []
+for _index, _host in enumerate(filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")), start=1):
+    DATABASES[f"replica_{_index}"] = {
+        **DATABASES["default"],
+        "HOST": _host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(f"replica_{_index}")
+
+# 좌석 샤드 라우터는 좌석 인스턴스를 소유 샤드로 보내야 하므로 먼저 등록합니다.
+DATABASE_ROUTERS = [
+    "seats.sharding.SeatShardRouter",
+    "config.db_router.PrimaryReplicaRouter",
+]
+
+# 예약/취소 직후 사용자를 primary에 고정하는 시간(초)
+REPLICA_PIN_SECONDS = int(os.getenv("REPLICA_PIN_SECONDS", "5"))
+# 고정 여부를 보관하는 캐시. 쓴 워커와 다음 읽기를 받는 워커가 다를 수 있으므로 워커들이 함께
+# 쓰는 백엔드여야 read-your-writes가 보장됩니다. (아래 CACHES의 "replica_pins")
+REPLICA_PIN_CACHE = "replica_pins"
+# 이 값보다 지연된 복제본은 읽기 대상에서 제외합니다.
+REPLICA_MAX_LAG_SECONDS = float(os.getenv("REPLICA_MAX_LAG_SECONDS", "2"))
+# 복제 지연 측정 결과를 재사용하는 시간(초)
+REPLICA_LAG_CHECK_INTERVAL = float(os.getenv("REPLICA_LAG_CHECK_INTERVAL", "1"))
+
+# 캐시 설정
+# "reservations"는 내 예약 목록 캐시(users/reservation_cache.py)가 사용합니다.
+# 기본값 file은 RESERVATIONS_CACHE_LOCATION 디렉터리를 워커들이 함께 쓰므로 한 워커의 무효화가
+# 모든 워커에 바로 반영됩니다. (대신 조회마다 파일을 읽습니다)
+# RESERVATIONS_CACHE_BACKEND=locmem은 파일 I/O가 없지만 무효화가 변경한 워커에만 적용되어,
+# 다른 워커는 MY_RESERVATIONS_CACHE_TIMEOUT 동안 이전 목록을 응답합니다.
+# 그래서 locmem의 기본 보관 시간은 2초로 짧게 둡니다.
+# "metrics"는 워커별 초당 시계열을 합치는 데 사용합니다. (seats/timeseries.py)
+# 워커별 캐시(locmem)에서는 조회를 받은 워커의 값만 보이므로 기본값이 redis입니다.
+# "replica_pins"는 쓰기 직후 사용자의 primary 고정(config/db_router.py)에 사용합니다.
+# 워커별 캐시(locmem)에서는 다른 워커가 고정을 보지 못해 지연된 복제본을 읽을 수 있으므로
+# 기본값이 file입니다. 서버가 여러 대라면 REPLICA_PIN_CACHE_LOCATION을 함께 쓰는 경로로 둡니다.
+# "seatmap"은 좌석 배치도 스냅샷(seats/seatmap.py)의 공유 본문, 생성 잠금, 공유 버전에 사용합니다.
+# 잠금과 버전은 add/incr가 원자적이어야 하므로 redis(또는 memcached, 프로세스 하나라면 locmem)만
+# 쓸 수 있습니다. (file은 시스템 체크 seats.E001에서 거부합니다)
+# 워커별 캐시(locmem)에서는 다른 워커가 버전과 본문을 보지 못하므로 기본값이 redis입니다.
+_CACHE_BACKENDS = {
+    "locmem": "django.core.cache.backends.locmem.LocMemCache",
+    "file": "django.core.cache.backends.filebased.FileBasedCache",
+    "redis": "django.core.cache.backends.redis.RedisCache",
+}
+# redis 백엔드를 쓰는 캐시의 LOCATION 기본값
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+
+def _cache_location(backend: str, path: str) -> str:
+    """redis 백엔드는 REDIS_URL을, 그 밖의 백엔드는 주어진 디렉터리 경로를 LOCATION으로 씁니다."""
+    return REDIS_URL if backend == "redis" else path
+
+
+_METRICS_CACHE_BACKEND = os.getenv("METRICS_CACHE_BACKEND", "redis")
+_SEATMAP_CACHE_BACKEND = os.getenv("SEATMAP_CACHE_BACKEND", "redis")
+_RESERVATIONS_CACHE_BACKEND = os.getenv("RESERVATIONS_CACHE_BACKEND", "file")
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+    "reservations": {
+        "BACKEND": _CACHE_BACKENDS[_RESERVATIONS_CACHE_BACKEND],
+        "LOCATION": os.getenv("RESERVATIONS_CACHE_LOCATION", "/tmp/ticket-reservations-cache"),
+        "TIMEOUT": None,
+        "OPTIONS": {"MAX_ENTRIES": 100000},
+    },
+    "metrics": {
+        "BACKEND": _CACHE_BACKENDS[_METRICS_CACHE_BACKEND],
+        "LOCATION": os.getenv(
+            "METRICS_CACHE_LOCATION",
+            _cache_location(_METRICS_CACHE_BACKEND, "/tmp/ticket-metrics-cache"),
+        ),
+    },
+    "seatmap": {
+        "BACKEND": _CACHE_BACKENDS[_SEATMAP_CACHE_BACKEND],
+        "LOCATION": os.getenv(
+            "SEATMAP_CACHE_LOCATION",
+            _cache_location(_SEATMAP_CACHE_BACKEND, "/tmp/ticket-seatmap-cache"),
+        ),
+    },
+    "replica_pins": {
+        "BACKEND": _CACHE_BACKENDS[os.getenv("REPLICA_PIN_CACHE_BACKEND", "file")],
+        "LOCATION": os.getenv("REPLICA_PIN_CACHE_LOCATION", "/tmp/ticket-replica-pin-cache"),
+    },
+}
+MY_RESERVATIONS_CACHE = "reservations"
+# 내 예약 목록을 캐시에 보관하는 시간(초). 워커별 캐시(locmem)에서는 다른 워커의 변경이
+# 이만큼 늦게 보이므로 기본값을 짧게 둡니다. 복제본에서 읽은 목록은
+# REPLICA_MAX_LAG_SECONDS 동안만 보관합니다.
+MY_RESERVATIONS_CACHE_TIMEOUT = float(
+    os.getenv(
+        "MY_RESERVATIONS_CACHE_TIMEOUT",
+        "2" if _RESERVATIONS_CACHE_BACKEND == "locmem" else "60",
+    )
+)
+
+# 토큰 폐기(로그아웃) 설정 (users/revocation.py)
+# 워커별 블룸 필터에 담을 폐기 토큰 수와 오탐률. 오탐된 토큰만 DB에서 확인합니다.
+TOKEN_REVOCATION_CAPACITY = int(os.getenv("TOKEN_REVOCATION_CAPACITY", "100000"))
+TOKEN_REVOCATION_FALSE_POSITIVE_RATE = float(
+    os.getenv("TOKEN_REVOCATION_FALSE_POSITIVE_RATE", "0.001")
+)
+# 다른 워커에서 폐기한 토큰을 가져오는 주기(초). 폐기는 최대 이만큼 늦게 적용됩니다.
+TOKEN_REVOCATION_SYNC_INTERVAL = float(os.getenv("TOKEN_REVOCATION_SYNC_INTERVAL", "1"))
+# 만료된 폐기 기록을 정리하고 필터를 다시 만드는 주기(초)
+TOKEN_REVOCATION_REBUILD_INTERVAL = float(os.getenv("TOKEN_REVOCATION_REBUILD_INTERVAL", "3600"))
+
+# 초당 예약/충돌/실패/취소 시계열 설정 (seats/timeseries.py)
+# 보관하는 초 수(링 버퍼 칸 수)와, 워커별 값을 공유 캐시에 올리는 주기(초)
+SEAT_TIMESERIES_WINDOW = int(os.getenv("SEAT_TIMESERIES_WINDOW", "300"))
+SEAT_TIMESERIES_PUBLISH_INTERVAL = float(os.getenv("SEAT_TIMESERIES_PUBLISH_INTERVAL", "1"))
+SEAT_TIMESERIES_CACHE = "metrics"
+
+# 부하 차단 설정 (config/load_shedding.py)
+LOAD_SHEDDING_ENABLED = os.getenv("LOAD_SHEDDING_ENABLED", "true").lower() == "true"
+# 워커 하나가 동시에 처리하는 요청 수의 상한과 하한. 혼잡하면 상한에서 하한 쪽으로 줄어듭니다.
+LOAD_SHEDDING_MAX_IN_FLIGHT = int(os.getenv("LOAD_SHEDDING_MAX_IN_FLIGHT", "64"))
+LOAD_SHEDDING_MIN_IN_FLIGHT = int(os.getenv("LOAD_SHEDDING_MIN_IN_FLIGHT", "4"))
+# 요청 대기 시간(처리 시간)의 목표(밀리초)
+LOAD_SHEDDING_TARGET_DELAY_MS = float(os.getenv("LOAD_SHEDDING_TARGET_DELAY_MS", "200"))
+# 프록시가 넣은 X-Request-Start 헤더의 대기 시간을 혼잡 신호로 쓸지 여부.
+# 클라이언트가 보낸 헤더를 프록시가 덮어쓰는 배포에서만 켭니다. (직접 노출된 서버에서 켜면
+# 누구나 가짜 헤더로 limit을 하한까지 줄일 수 있습니다)
+LOAD_SHEDDING_TRUST_REQUEST_START = (
+    os.getenv("LOAD_SHEDDING_TRUST_REQUEST_START", "false").lower() == "true"
+)
+# URL 이름별 우선순위 등급(critical, normal, low, exempt)은
+# LOAD_SHEDDING_PRIORITIES로 바꿀 수 있습니다.
+# (기본값: config.load_shedding.DEFAULT_PRIORITIES, 목록에 없는 URL은 normal)
+
+# API 요청 샘플 기록 설정 (config/capture.py, replay_requests 명령)
+# 기록할 요청의 비율 (0이면 기록하지 않습니다. 예: 0.01 = 1%)
+REQUEST_CAPTURE_SAMPLE_RATE = float(os.getenv("REQUEST_CAPTURE_SAMPLE_RATE", "0"))
+REQUEST_CAPTURE_DIR = Path(os.getenv("REQUEST_CAPTURE_DIR", str(BASE_DIR / "logs/requests")))
+# 워커별 기록 파일 하나의 최대 크기(바이트)와 보관할 이전 파일 수
+REQUEST_CAPTURE_MAX_BYTES = int(os.getenv("REQUEST_CAPTURE_MAX_BYTES", "52428800"))
+REQUEST_CAPTURE_BACKUP_COUNT = int(os.getenv("REQUEST_CAPTURE_BACKUP_COUNT", "10"))
+
+# 좌석 샤딩 설정
+# 좌석 번호 범위별로 좌석을 저장할 DB를 지정합니다. (last_seat이 None이면 마지막 좌석까지)
+# 예: [{"database": "default", "first_seat": 1, "last_seat": 50000},
+#      {"database": "shard_2", "first_seat": 50001, "last_seat": None}]
+# primary 이외의 샤드는 DATABASES에 등록한 뒤
+# `migrate --database=<별칭>`으로 좌석 테이블을 만듭니다.
+# 사용자별 예약 카운터는 primary의 좌석만 세어 채워지므로, 샤드를 추가하거나 좌석을 옮긴 뒤에는
+# `python manage.py recompute_reservation_quotas`로 모든 샤드의 예약을 다시 셉니다.
+SEAT_SHARDS = [{"database": "default", "first_seat": 1, "last_seat": None}]
+
+# 좌석 배정 설정
+# 한 행의 좌석 수. 좌석 번호를 이 값으로 나누어 행을 구성합니다. (프론트엔드 좌석 배치와 일치)
+SEAT_ROW_LENGTH = int(os.getenv("SEAT_ROW_LENGTH", "3"))
+# 좌석 배치(/api/seats/layout/)에서 한 구역으로 묶는 행 수
+SEAT_SECTION_ROWS = int(os.getenv("SEAT_SECTION_ROWS", "10"))
+# 워커별 빈 좌석 인덱스를 Seat 테이블에서 다시 구성하는 주기(초)
+SEAT_INDEX_MAX_AGE = float(os.getenv("SEAT_INDEX_MAX_AGE", "30"))
+
+# 사용자 한 명이 동시에 예약할 수 있는 최대 좌석 수 (비어 있으면 무제한)
+# 사용자별 상한은 ReservationQuota.limit으로 따로 지정할 수 있습니다.
+SEAT_MAX_PER_USER = int(os.environ["SEAT_MAX_PER_USER"]) if os.getenv("SEAT_MAX_PER_USER") else None
+
+# 좌석 배치도 스냅샷을 다시 만드는 최대 주기(초). 다른 워커의 변경은 이 주기로 반영됩니다.
+SEAT_MAP_MAX_AGE = float(os.getenv("SEAT_MAP_MAX_AGE", "5"))
+# 롱 폴링(/api/seats/changes/)에 보낼 수 있도록 보관하는 변경 이력 개수
+SEAT_MAP_HISTORY_SIZE = int(os.getenv("SEAT_MAP_HISTORY_SIZE", "256"))
+# 롱 폴링 기본/최대 대기 시간(초)
+SEAT_MAP_LONG_POLL_TIMEOUT = float(os.getenv("SEAT_MAP_LONG_POLL_TIMEOUT", "25"))
+SEAT_MAP_LONG_POLL_MAX_TIMEOUT = float(os.getenv("SEAT_MAP_LONG_POLL_MAX_TIMEOUT", "60"))
+# 워커 사이에서 스냅샷 본문과 생성 잠금을 나누는 캐시
+SEAT_MAP_CACHE = "seatmap"
+# 다른 요청(워커)이 스냅샷을 만드는 동안 기다리는 시간(초). 지나면 이전 스냅샷을 응답합니다.
+SEAT_MAP_REBUILD_WAIT = float(os.getenv("SEAT_MAP_REBUILD_WAIT", "0.1"))
+# 스냅샷 생성 잠금의 만료 시간(초). 잠금을 잡은 워커가 죽어도 이 시간 뒤에는 풀립니다.
+SEAT_MAP_REBUILD_LOCK_TIMEOUT = float(os.getenv("SEAT_MAP_REBUILD_LOCK_TIMEOUT", "10"))
+
+# 좌석 낙관적 동시성 제어 설정
+# version 충돌 시 최대 시도 횟수와, 재시도 대기 시간의 기준값(초, 시도마다 2배)
+SEAT_VERSION_MAX_ATTEMPTS = int(os.getenv("SEAT_VERSION_MAX_ATTEMPTS", "3"))
+SEAT_VERSION_RETRY_BASE_DELAY = float(os.getenv("SEAT_VERSION_RETRY_BASE_DELAY", "0.005"))
+
+# 예약 요청 그룹 커밋 설정
+# 활성화하면 SEAT_BATCH_WINDOW_MS 안에 도착한 예약 요청들을 한 트랜잭션으로 처리합니다.
+SEAT_RESERVATION_BATCHING = os.getenv("SEAT_RESERVATION_BATCHING", "false").lower() == "true"
+SEAT_BATCH_WINDOW_MS = float(os.getenv("SEAT_BATCH_WINDOW_MS", "2"))
+SEAT_BATCH_MAX_SIZE = int(os.getenv("SEAT_BATCH_MAX_SIZE", "64"))
+
+# 예약 시퀀서: 좌석 파티션마다 워커 하나가 예약을 순서대로 씁니다. (ASGI 배포용)
+SEAT_RESERVATION_SEQUENCER = os.getenv("SEAT_RESERVATION_SEQUENCER", "false").lower() == "true"
+SEAT_SEQUENCER_PARTITIONS = int(os.getenv("SEAT_SEQUENCER_PARTITIONS", "16"))
+# 메모리에 기록한 "팔린 좌석" 정보를 믿는 시간(초). 지나면 DB에서 다시 확인합니다.
+SEAT_SEQUENCER_TAKEN_TTL = float(os.getenv("SEAT_SEQUENCER_TAKEN_TTL", "5"))
+
+# 장애 주입 설정 (부하 테스트 재현용, seats/faults.py 참고)
+# 운영에서 SEAT_FAULTS_ENABLED=false로 끄면 주입 비용이 없습니다.
+SEAT_FAULTS_ENABLED = os.getenv("SEAT_FAULTS_ENABLED", "true").lower() == "true"
+SEAT_FAULT_SEED = int(os.environ["SEAT_FAULT_SEED"]) if os.getenv("SEAT_FAULT_SEED") else None
+SEAT_FAULT_RULES = {
+    # 좌석 예약 요청의 의도적 실패 (기본 1%)
+    "reserve": {"failure_rate": float(os.getenv("SEAT_RESERVE_FAILURE_RATE", "0.01"))},
+}
+
+# 좌석 초기화 작업 설정
+# 한 트랜잭션에서 처리할 좌석 번호 범위의 크기와, 청크 사이의 대기 시간(초)입니다.
+SEAT_RESET_CHUNK_SIZE = int(os.getenv("SEAT_RESET_CHUNK_SIZE", "500"))
+SEAT_RESET_CHUNK_PAUSE = float(os.getenv("SEAT_RESET_CHUNK_PAUSE", "0.05"))
+# True이면 백그라운드 스레드에서 실행하고 즉시 202를 반환합니다.
+SEAT_RESET_ASYNC = os.getenv("SEAT_RESET_ASYNC", "true").lower() == "true"
+
 # 테스트 환경에서 SQLite 사용 (환경 변수가 없을 때)
 import sys
 
@@ -111,8 +345,41 @@ if "test" in sys.argv:
         "default": {
             "ENGINE": "django.db.backends.sqlite3",
             "NAME": "test_db.sqlite3",
-        }
+        },
+        # 복제본 라우팅 테스트에서 primary와 분리된 SQLite DB로 사용합니다.
+        "replica": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": "test_replica.sqlite3",
+        },
+        # 샤딩 테스트에서 좌석을 나누어 저장하는 SQLite DB입니다.
+        "shard_1": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": "test_shard_1.sqlite3",
+        },
+        "shard_2": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": "test_shard_2.sqlite3",
+        },
     }
+    # 복제본은 라우팅 테스트에서만 override_settings로 활성화합니다.
+    DATABASE_REPLICAS = []
+    # 실행 사이에 고정 기록과 예약 목록이 남지 않도록 테스트에서는 메모리 캐시를 씁니다.
+    # (시계열과 좌석 배치도 캐시도 redis 서버 없이 실행되도록 메모리 캐시를 씁니다)
+    CACHES["replica_pins"] = {"BACKEND": _CACHE_BACKENDS["locmem"]}
+    CACHES["reservations"] = {"BACKEND": _CACHE_BACKENDS["locmem"], "TIMEOUT": None}
+    CACHES["metrics"] = {"BACKEND": _CACHE_BACKENDS["locmem"]}
+    CACHES["seatmap"] = {"BACKEND": _CACHE_BACKENDS["locmem"]}
+    # 테스트에서는 좌석 초기화 작업을 요청 안에서 바로 실행합니다.
+    SEAT_RESET_ASYNC = False
+    SEAT_RESET_CHUNK_PAUSE = 0.0
+    # 장애 주입 결과가 실행마다 달라지지 않도록 시드를 고정합니다.
+    SEAT_FAULT_SEED = 0
+    # 빌드해 둔 스키마 파일 대신 항상 현재 코드로 스키마를 생성합니다.
+    API_SCHEMA_FILE = None
+    # 테스트마다 DB가 되돌려지므로 좌석 배치도 스냅샷을 요청마다 다시 만듭니다.
+    SEAT_MAP_MAX_AGE = 0.0
+    # 테스트마다 DB가 되돌려지므로 내 예약 목록은 캐시에 남기지 않습니다.
+    MY_RESERVATIONS_CACHE_TIMEOUT = 0
 
 ROOT_URLCONF = "config.urls"
 
@@ -0,0 +1,59 @@
+# config/sqlite.py
+
+"""
+SQLite 동시성 프로필
+
+단일 서버 배포에서 MySQL 대신 SQLite를 쓸 때(DB_ENGINE=sqlite) 사용하는 DATABASES 설정입니다.
+SQLite 기본 설정(rollback journal, DEFERRED 트랜잭션)에서는 예약이 몰리면
+"database is locked" 오류가 납니다.
+
+- journal_mode=WAL: 읽기와 쓰기가 서로를 막지 않습니다. (쓰기는 여전히 한 번에 하나)
+- synchronous=NORMAL: WAL에서는 커밋마다 fsync하지 않아도 DB가 깨지지 않습니다.
+  (전원이 꺼지면 마지막 몇 개의 커밋만 잃을 수 있습니다)
+- BEGIN IMMEDIATE: 트랜잭션을 시작할 때 쓰기 잠금을 잡습니다. DEFERRED 트랜잭션은 읽은 뒤
+  쓰기로 올라가는 순간 다른 쓰기와 겹치면 busy timeout을 기다리지 않고 바로 실패하지만,
+  IMMEDIATE는 시작할 때 잠금을 기다리므로 busy timeout 안에서 차례로 처리됩니다.
+  예약/취소는 모두 transaction.atomic(quotas.atomic) 안에서 좌석을 읽고 고치므로
+  이 경우에 해당합니다.
+- busy timeout: 다른 쓰기가 끝날 때까지 기다리는 최대 시간(초)
+
+benchmark_sqlite 명령(config/sqlite_benchmark.py)으로 기본 설정과 이 프로필의
+동시 예약 처리량과 잠금 오류 수를 비교할 수 있습니다.
+"""
+
+DEFAULT_BUSY_TIMEOUT = 20.0
+DEFAULT_SYNCHRONOUS = "NORMAL"
+SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def sqlite_options(
+    busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    synchronous: str = DEFAULT_SYNCHRONOUS,
+) -> dict:
+    """DATABASES[...]["OPTIONS"]에 넣을 동시성 설정"""
+    synchronous = synchronous.upper()
+    if synchronous not in SYNCHRONOUS_LEVELS:
+        raise ValueError(f"Unknown SQLite synchronous level: {synchronous}")
+    return {
+        "transaction_mode": "IMMEDIATE",
+        "timeout": busy_timeout,
+        "init_command": (
+            "PRAGMA journal_mode=WAL;"
+            f"PRAGMA synchronous={synchronous};"
+            # 임시 테이블/인덱스를 메모리에서 만듭니다.
+            "PRAGMA temp_store=MEMORY;"
+        ),
+    }
+
+
+def sqlite_database(
+    name,
+    busy_timeout: float = DEFAULT_BUSY_TIMEOUT,
+    synchronous: str = DEFAULT_SYNCHRONOUS,
+) -> dict:
+    """SQLite 동시성 프로필을 적용한 DATABASES 항목"""
+    return {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": name,
+        "OPTIONS": sqlite_options(busy_timeout, synchronous),
+    }
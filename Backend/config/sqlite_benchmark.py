@@ -0,0 +1,151 @@
+# config/sqlite_benchmark.py
+
+"""
+SQLite 동시 예약 벤치마크 (benchmark_sqlite 명령)
+
+임시 SQLite 파일에 좌석/예약 상한 테이블을 만들고 여러 스레드가 동시에 예약하여,
+SQLite 기본 설정과 동시성 프로필(config/sqlite.py)의 처리량과
+"database is locked" 오류 수를 비교합니다.
+"""
+
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections, transaction
+from django.db.utils import load_backend
+
+from .sqlite import DEFAULT_BUSY_TIMEOUT, sqlite_options
+
+PROFILES = ("default", "tuned")
+
+
+def profile_options(profile: str, busy_timeout: float = DEFAULT_BUSY_TIMEOUT) -> dict:
+    """
+    default: SQLite 기본 설정(DELETE journal, DEFERRED 트랜잭션)에 busy timeout만 같게 맞춥니다.
+    tuned: 동시성 프로필 (WAL, synchronous=NORMAL, BEGIN IMMEDIATE)
+    """
+    if profile == "default":
+        return {"timeout": busy_timeout}
+    return sqlite_options(busy_timeout)
+
+
+def benchmark_reservations(
+    path,
+    options: dict,
+    *,
+    threads: int = 8,
+    reservations: int = 2000,
+    seats: int = 10_000,
+    users: int = 100,
+) -> dict:
+    """
+    path의 SQLite 파일에 좌석/예약 상한 테이블을 만들고, threads개의 스레드가 나누어
+    reservations번 예약(좌석 확인 -> version 조건부 UPDATE -> 사용자 카운터 증가)합니다.
+    예약 API와 같은 읽은 뒤 쓰는 트랜잭션이므로 DEFERRED 모드의 잠금 오류가 그대로 드러납니다.
+    """
+    alias = f"sqlite_benchmark_{uuid.uuid4().hex[:8]}"
+    settings_dict = connections.configure_settings(
+        {
+            DEFAULT_DB_ALIAS: {
+                "ENGINE": "django.db.backends.sqlite3",
+                "NAME": str(path),
+                "OPTIONS": options,
+            }
+        }
+    )[DEFAULT_DB_ALIAS]
+
+    with _connect(alias, settings_dict) as connection, connection.cursor() as cursor:
+        cursor.execute(
+            "CREATE TABLE bench_seat (seat_number INTEGER PRIMARY KEY, "
+            "is_reserved BOOL NOT NULL, reserved_by INTEGER, version INTEGER NOT NULL)"
+        )
+        cursor.execute(
+            "CREATE TABLE bench_quota "
+            "(user_id INTEGER PRIMARY KEY, reserved_count INTEGER NOT NULL)"
+        )
+        cursor.executemany(
+            "INSERT INTO bench_seat VALUES (%s, 0, NULL, 0)",
+            [(seat,) for seat in range(1, seats + 1)],
+        )
+        cursor.executemany(
+            "INSERT INTO bench_quota VALUES (%s, 0)",
+            [(user,) for user in range(1, users + 1)],
+        )
+
+    counts = Counter()
+    counts_lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        rng = random.Random(index)
+        local = Counter()
+        with _connect(alias, settings_dict):
+            for _ in range(reservations // threads):
+                local[_reserve_once(alias, rng, seats, users)] += 1
+        with counts_lock:
+            counts.update(local)
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "reserved": counts["reserved"],
+        "conflicts": counts["conflict"],
+        "locked": counts["locked"],
+        "seconds": elapsed,
+        # 잠금 오류로 실패한 시도는 빼고, 끝까지 처리한 트랜잭션만 셉니다.
+        "throughput": ((counts["reserved"] + counts["conflict"]) / elapsed if elapsed else 0.0),
+    }
+
+
+@contextmanager
+def _connect(alias: str, settings_dict: dict):
+    """
+    settings.DATABASES에 없는 별칭으로 현재 스레드의 연결을 만듭니다.
+    transaction.atomic(using=alias)이 이 연결을 사용하며, 끝나면 닫고 등록을 지웁니다.
+    """
+    connection = load_backend(settings_dict["ENGINE"]).DatabaseWrapper(settings_dict, alias)
+    connections[alias] = connection
+    try:
+        yield connection
+    finally:
+        connection.close()
+        del connections[alias]
+
+
+def _reserve_once(alias: str, rng: random.Random, seats: int, users: int) -> str:
+    seat_number = rng.randint(1, seats)
+    user_id = rng.randint(1, users)
+    try:
+        with transaction.atomic(using=alias), connections[alias].cursor() as cursor:
+            cursor.execute(
+                "SELECT is_reserved, version FROM bench_seat WHERE seat_number = %s",
+                [seat_number],
+            )
+            is_reserved, version = cursor.fetchone()
+            if is_reserved:
+                return "conflict"
+            cursor.execute(
+                "UPDATE bench_seat SET is_reserved = 1, reserved_by = %s, "
+                "version = version + 1 WHERE seat_number = %s AND version = %s",
+                [user_id, seat_number, version],
+            )
+            if cursor.rowcount == 0:
+                return "conflict"
+            cursor.execute(
+                "UPDATE bench_quota SET reserved_count = reserved_count + 1 WHERE user_id = %s",
+                [user_id],
+            )
+    except OperationalError as exc:
+        if "locked" not in str(exc):
+            raise
+        return "locked"
+    return "reserved"
@@ -31,12 +31,12 @@ INSTALLED_APPS = [
 ]
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("users.authentication.RevocableJWTAuthentication",),
 }
 
 MIDDLEWARE = [
+    "config.capture.RequestCaptureMiddleware",
+    "config.load_shedding.LoadSheddingMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
@@ -123,3 +123,7 @@ PASSWORD_HASHERS = [
 
 # 테스트 시 이메일 백엔드
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+# 테스트에서는 좌석 초기화 작업을 요청 안에서 바로 실행합니다.
+SEAT_RESET_ASYNC = False
+SEAT_RESET_CHUNK_PAUSE = 0.0
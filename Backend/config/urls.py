@@ -15,28 +15,33 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
-from drf_spectacular.views import (
-    SpectacularAPIView,
-    SpectacularRedocView,
-    SpectacularSwaggerView,
-)
 
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/", include("seats.urls")),
     path("api/users/", include("users.urls")),
-    # Swagger 설정
-    path("api/schema/", SpectacularAPIView.as_view(), name="schema"),
-    path(
-        "api/schema/swagger-ui/",
-        SpectacularSwaggerView.as_view(url_name="schema"),
-        name="swagger-ui",
-    ),
-    path(
-        "api/schema/redoc/",
-        SpectacularRedocView.as_view(url_name="schema"),
-        name="redoc",
-    ),
 ]
+
+if getattr(settings, "API_DOCS_ENABLED", False):
+    # 문서를 끄면 drf_spectacular를 아예 불러오지 않습니다.
+    from drf_spectacular.views import SpectacularRedocView, SpectacularSwaggerView
+
+    from config.schema import SchemaView
+
+    urlpatterns += [
+        # Swagger 설정 (스키마는 한 번만 생성해 캐시합니다)
+        path("api/schema/", SchemaView.as_view(), name="schema"),
+        path(
+            "api/schema/swagger-ui/",
+            SpectacularSwaggerView.as_view(url_name="schema"),
+            name="swagger-ui",
+        ),
+        path(
+            "api/schema/redoc/",
+            SpectacularRedocView.as_view(url_name="schema"),
+            name="redoc",
+        ),
+    ]
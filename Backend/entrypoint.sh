@@ -10,6 +10,10 @@ set -e
 echo "Applying database migrations..."
 python manage.py migrate --noinput
 
+# OpenAPI 스키마를 미리 생성해 둡니다. (API 문서가 꺼져 있으면 건너뜁니다)
+echo "Building OpenAPI schema..."
+python manage.py build_api_schema
+
 # 그 다음, Dockerfile이나 docker-compose.yml에서 전달된
 # 원래의 메인 명령어(예: runserver)를 실행합니다.
 exec "$@"
\ No newline at end of file
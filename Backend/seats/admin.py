@@ -1 +1,169 @@
-# Register your models here.
+# seats/admin.py
+
+"""
+좌석 관리자 화면
+
+좌석이 수백만 개여도 목록 화면이 가볍도록 합니다.
+- 필터가 없는 목록의 전체 개수는 COUNT(*) 대신 DB 통계의 추정치를 사용합니다.
+- 예약자는 list_select_related로 함께 조회하여 행마다 사용자 쿼리가 나가지 않게 합니다.
+- 필터는 인덱스가 있는 컬럼(is_reserved, reserved_by)만 제공합니다.
+- 일괄 예약/해제는 객체마다 save()하지 않고 한 번의 UPDATE로 처리합니다.
+
+관리자 화면은 primary의 좌석만 다룹니다. (다른 샤드의 좌석은 API나 관리 명령을 사용합니다)
+"""
+
+from collections import defaultdict
+from functools import cached_property
+
+from django.contrib import admin, messages
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F
+
+from . import history, quotas, signals
+from .models import ReservationQuota, Seat
+
+# 추정치가 이보다 작으면 정확한 개수를 셉니다. (작은 테이블의 통계는 부정확할 수 있습니다)
+EXACT_COUNT_THRESHOLD = 10_000
+
+
+class EstimatedCountPaginator(Paginator):
+    """필터가 없는 쿼리의 전체 개수를 DB 통계(추정치)로 대신하는 Paginator"""
+
+    @cached_property
+    def count(self) -> int:
+        query = getattr(self.object_list, "query", None)
+        if query is not None and not query.where:
+            estimate = estimate_row_count(
+                self.object_list.db, self.object_list.model._meta.db_table
+            )
+            if estimate is not None and estimate >= EXACT_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+
+
+def estimate_row_count(using: str, table: str) -> int | None:
+    """
+    DB 통계에 기록된 테이블의 대략적인 행 수. 지원하지 않는 DB(SQLite 등)는 None을 반환합니다.
+    """
+    connection = connections[using]
+    if connection.vendor == "mysql":
+        sql = (
+            "SELECT TABLE_ROWS FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s"
+        )
+    elif connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+    else:
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def reserve_seats(queryset, user) -> int:
+    """
+    queryset 중 빈 좌석을 한 번의 UPDATE로 user에게 예약하고 예약한 좌석 수를 반환합니다.
+    user의 예약 상한을 넘으면 QuotaExceeded를 발생시키고 되돌립니다.
+    """
+    alias = queryset.db
+    with quotas.atomic(alias):
+        seat_numbers = list(
+            queryset.select_for_update()
+            .filter(is_reserved=False)
+            .values_list("seat_number", flat=True)
+        )
+        if not seat_numbers:
+            return 0
+        # 잠근 좌석들과 같은 조건이므로 UPDATE 한 번으로 모두 예약됩니다.
+        queryset.filter(is_reserved=False).update(
+            is_reserved=True, reserved_by=user, version=F("version") + 1
+        )
+        quotas.acquire(user.pk, len(seat_numbers))
+        history.record(history.RESERVED, {user.pk: seat_numbers})
+        signals.send_on_commit(
+            signals.seats_reserved,
+            using=alias,
+            seat_numbers=seat_numbers,
+            user_id=user.pk,
+        )
+    return len(seat_numbers)
+
+
+def release_seats(queryset) -> int:
+    """queryset 중 예약된 좌석을 한 번의 UPDATE로 해제하고 해제한 좌석 수를 반환합니다."""
+    alias = queryset.db
+    with quotas.atomic(alias):
+        rows = list(
+            queryset.select_for_update()
+            .filter(is_reserved=True)
+            .values_list("seat_number", "reserved_by_id")
+        )
+        if not rows:
+            return 0
+        queryset.filter(is_reserved=True).update(
+            is_reserved=False, reserved_by=None, version=F("version") + 1
+        )
+
+        released: dict[int | None, list[int]] = defaultdict(list)
+        for seat_number, user_id in rows:
+            released[user_id].append(seat_number)
+        quotas.release_many(
+            {user_id: len(seat_numbers) for user_id, seat_numbers in released.items()}
+        )
+        history.record(history.RELEASED, released)
+        for user_id, seat_numbers in released.items():
+            signals.send_on_commit(
+                signals.seats_released,
+                using=alias,
+                seat_numbers=seat_numbers,
+                user_id=user_id,
+            )
+    return len(rows)
+
+
+@admin.register(Seat)
+class SeatAdmin(admin.ModelAdmin):
+    list_display = ("seat_number", "is_reserved", "reserved_by", "version")
+    list_select_related = ("reserved_by",)
+    list_filter = ("is_reserved", ("reserved_by", admin.EmptyFieldListFilter))
+    # username은 unique 인덱스가 있으므로 정확히 일치하는 검색만 허용합니다.
+    search_fields = ("=reserved_by__username",)
+    # 예약 상태는 카운터와 시그널을 함께 처리하는 일괄 작업(actions)으로만 바꿉니다.
+    readonly_fields = ("is_reserved", "reserved_by", "version")
+    ordering = ("seat_number",)
+    paginator = EstimatedCountPaginator
+    # 필터를 적용했을 때 전체 개수를 따로 세지 않습니다.
+    show_full_result_count = False
+    actions = ("reserve_for_me", "release")
+
+    @admin.action(description="선택한 빈 좌석을 내 이름으로 예약")
+    def reserve_for_me(self, request, queryset):
+        try:
+            count = reserve_seats(queryset, request.user)
+        except quotas.QuotaExceeded:
+            self.message_user(
+                request,
+                "예약 상한을 넘어 예약하지 못했습니다.",
+                level=messages.ERROR,
+            )
+            return
+        self.message_user(request, f"좌석 {count}개를 예약했습니다.")
+
+    @admin.action(description="선택한 좌석의 예약 해제")
+    def release(self, request, queryset):
+        count = release_seats(queryset)
+        self.message_user(request, f"좌석 {count}개의 예약을 해제했습니다.")
+
+
+@admin.register(ReservationQuota)
+class ReservationQuotaAdmin(admin.ModelAdmin):
+    list_display = ("user", "reserved_count", "limit")
+    list_select_related = ("user",)
+    search_fields = ("=user__username",)
+    raw_id_fields = ("user",)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
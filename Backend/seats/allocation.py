@@ -0,0 +1,328 @@
+# seats/allocation.py
+
+"""
+좌석 자동 배정
+
+[최적 연속 좌석]
+좌석 번호를 SEAT_ROW_LENGTH 단위로 나누어 행(row)을 구성하고, 행마다 빈 좌석을
+비트맵(int)으로 메모리에 유지합니다. 비트 연산으로 N개의 연속된 빈 좌석을 찾고,
+조건부 UPDATE 한 번으로 블록 전체를 원자적으로 선점합니다.
+
+- 앞 행(무대와 가까운 행)을 우선하고, 같은 행에서는 가운데에 가까운 블록을 고릅니다.
+- 각 행의 최대 연속 빈 좌석 수를 함께 유지하여, 자리가 없는 행은 비트 연산 없이 건너뜁니다.
+- 인덱스는 워커마다 따로 유지됩니다. 다른 워커의 변경은 선점 실패 시 DB 값으로
+  해당 좌석을 갱신하거나, SEAT_INDEX_MAX_AGE가 지나면 전체를 다시 구성하여 반영합니다.
+
+[아무 빈 좌석]
+좌석을 지정하지 않는 자유석 판매용입니다. SELECT ... FOR UPDATE SKIP LOCKED로
+다른 트랜잭션이 잡고 있는 좌석을 건너뛰어 가져갑니다.
+"""
+
+import bisect
+import threading
+import time
+from collections.abc import Iterable
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F
+from django.dispatch import receiver
+
+from . import history, quotas, sharding, signals
+from .concurrency import VersionConflict
+from .models import Seat
+
+DEFAULT_ROW_LENGTH = 3
+DEFAULT_INDEX_MAX_AGE = 30.0
+
+
+class FreeSeatIndex:
+    """행별 빈 좌석 비트맵. 비트 i는 행의 i번째(0부터) 좌석이 비어 있음을 뜻합니다."""
+
+    def __init__(self, row_length: int):
+        self.row_length = row_length
+        self.built_at = time.monotonic()
+        self._free: dict[int, int] = {}
+        self._max_run: dict[int, int] = {}
+        self._rows: list[int] = []  # 정렬된 행 번호 (앞 행 우선)
+        # 블록 크기별로 "이 위치 앞의 행에는 자리가 없다"는 하한. 매진된 앞 행을 건너뜁니다.
+        self._first_fit: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_free_seats(cls, seat_numbers: Iterable[int], row_length: int) -> "FreeSeatIndex":
+        index = cls(row_length)
+        for seat_number in seat_numbers:
+            row, col = index._position(seat_number)
+            index._free[row] = index._free.get(row, 0) | (1 << col)
+        index._rows = sorted(index._free)
+        index._max_run = {row: _longest_run(bits) for row, bits in index._free.items()}
+        return index
+
+    def mark_reserved(self, seat_numbers: Iterable[int]) -> None:
+        self._update(seat_numbers, free=False)
+
+    def mark_free(self, seat_numbers: Iterable[int]) -> None:
+        self._update(seat_numbers, free=True)
+
+    def find_best_block(self, count: int, exclude: set[int] | None = None) -> list[int] | None:
+        """
+        가장 좋은 연속 빈 좌석 블록의 좌석 번호 목록. 없으면 None
+        exclude에 포함된 좌석 번호로 시작하는 블록은 후보에서 제외합니다.
+        """
+        if count < 1 or count > self.row_length:
+            return None
+
+        row_center = (self.row_length - 1) / 2
+        with self._lock:
+            first_fit = None
+            for position in range(self._first_fit.get(count, 0), len(self._rows)):
+                row = self._rows[position]
+                if self._max_run[row] < count:
+                    continue
+                if first_fit is None:
+                    first_fit = position
+                    self._first_fit[count] = position
+
+                # starts의 비트 i가 켜져 있으면 i부터 count개의 좌석이 모두 비어 있습니다.
+                bits = self._free[row]
+                starts = bits
+                for shift in range(1, count):
+                    starts &= bits >> shift
+
+                best_start = None
+                best_distance = None
+                while starts:
+                    lowest = starts & -starts
+                    start = lowest.bit_length() - 1
+                    starts ^= lowest
+                    if exclude and row * self.row_length + start + 1 in exclude:
+                        continue
+                    distance = abs(start + (count - 1) / 2 - row_center)
+                    if best_distance is None or distance < best_distance:
+                        best_start, best_distance = start, distance
+
+                if best_start is not None:
+                    first = row * self.row_length + best_start + 1
+                    return list(range(first, first + count))
+
+            if first_fit is None:
+                self._first_fit[count] = len(self._rows)
+        return None
+
+    def _update(self, seat_numbers: Iterable[int], *, free: bool) -> None:
+        with self._lock:
+            touched = set()
+            for seat_number in seat_numbers:
+                row, col = self._position(seat_number)
+                if row not in self._free:
+                    bisect.insort(self._rows, row)
+                    self._free[row] = 0
+                    # 행 위치가 바뀌었으므로 하한을 버립니다.
+                    self._first_fit.clear()
+                if free:
+                    self._free[row] |= 1 << col
+                else:
+                    self._free[row] &= ~(1 << col)
+                touched.add(row)
+            for row in touched:
+                self._max_run[row] = _longest_run(self._free[row])
+                if free:
+                    # 자리가 생긴 행보다 뒤에 있던 하한을 앞으로 당깁니다.
+                    position = bisect.bisect_left(self._rows, row)
+                    for size, first_fit in self._first_fit.items():
+                        if first_fit > position and self._max_run[row] >= size:
+                            self._first_fit[size] = position
+
+    def _position(self, seat_number: int) -> tuple[int, int]:
+        return divmod(seat_number - 1, self.row_length)
+
+
+def _longest_run(bits: int) -> int:
+    """비트맵에서 연속으로 켜진 비트의 최대 길이"""
+    length = 0
+    while bits:
+        bits &= bits >> 1
+        length += 1
+    return length
+
+
+_index: FreeSeatIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_index() -> FreeSeatIndex:
+    """
+    현재 워커의 인덱스를 반환합니다.
+    아직 없거나 SEAT_INDEX_MAX_AGE보다 오래되었으면 Seat 테이블에서 다시 구성합니다.
+    """
+    global _index
+    max_age = getattr(settings, "SEAT_INDEX_MAX_AGE", DEFAULT_INDEX_MAX_AGE)
+    index = _index
+    if index is not None and time.monotonic() - index.built_at < max_age:
+        return index
+
+    with _index_lock:
+        if _index is None or time.monotonic() - _index.built_at >= max_age:
+            _index = build_index()
+        return _index
+
+
+def build_index() -> FreeSeatIndex:
+    free_seats = Seat.objects.filter(is_reserved=False).values_list("seat_number", flat=True)
+    seat_numbers = (
+        seat_number
+        for queryset in sharding.iter_shard_querysets(free_seats, for_read=False)
+        for seat_number in queryset.iterator(chunk_size=2000)
+    )
+    return FreeSeatIndex.from_free_seats(
+        seat_numbers, getattr(settings, "SEAT_ROW_LENGTH", DEFAULT_ROW_LENGTH)
+    )
+
+
+def reset_index() -> None:
+    global _index
+    with _index_lock:
+        _index = None
+
+
+def reserve_best_available(user, count: int, max_attempts: int = 3) -> list[int] | None:
+    """
+    연속된 빈 좌석 count개를 찾아 user에게 원자적으로 예약합니다.
+    다른 요청이 먼저 선점한 블록은 DB 값으로 인덱스를 갱신한 뒤 다음 후보로 재시도합니다.
+    예약할 수 있는 블록이 없으면 None을 반환합니다.
+    """
+    index = get_index()
+    excluded: set[int] = set()
+    for _ in range(max_attempts):
+        seat_numbers = index.find_best_block(count, exclude=excluded)
+        if seat_numbers is None:
+            return None
+
+        shard = sharding.shard_for_seat(seat_numbers[0])
+        if sharding.shard_for_seat(seat_numbers[-1]) != shard:
+            # 샤드 경계에 걸친 블록은 한 트랜잭션으로 선점할 수 없으므로 후보에서 제외합니다.
+            excluded.add(seat_numbers[0])
+            continue
+
+        if _claim(shard, seat_numbers, user):
+            index.mark_reserved(seat_numbers)
+            return seat_numbers
+
+        _refresh(index, shard, seat_numbers)
+    return None
+
+
+def reserve_any_available(user, max_attempts: int = 5) -> int | None:
+    """
+    아무 빈 좌석 하나를 user에게 예약하고 좌석 번호를 반환합니다. 빈 좌석이 없으면 None
+
+    SKIP LOCKED를 지원하는 DB(MySQL 8, PostgreSQL)에서는 다른 트랜잭션이 잠근 좌석을 건너뛰므로,
+    동시에 요청한 구매자들이 서로의 행 잠금을 기다리지 않고 각자 다른 좌석을 가져갑니다.
+    SQLite처럼 행 잠금이 없는 DB에서는 조건부 UPDATE로 선점하고,
+    다른 요청이 먼저 가져갔으면 다음 빈 좌석으로 재시도합니다.
+    빈 좌석이 남아 있는데 max_attempts번 모두 다른 요청에 빼앗겼다면 매진이 아니므로
+    VersionConflict를 발생시킵니다. (다시 시도하면 예약할 수 있습니다)
+    """
+    contended = False
+    for shard in sharding.get_shard_databases():
+        if connections[shard].features.has_select_for_update_skip_locked:
+            seat_number = _claim_any_skip_locked(shard, user)
+        else:
+            try:
+                seat_number = _claim_any_conditional(shard, user, max_attempts)
+            except VersionConflict:
+                contended = True
+                continue
+        if seat_number is not None:
+            return seat_number
+    if contended:
+        raise VersionConflict("Every free seat was taken by a concurrent request")
+    return None
+
+
+def _claim_any_skip_locked(shard: str, user) -> int | None:
+    with quotas.atomic(shard):
+        seat = (
+            Seat.objects.using(shard)
+            .select_for_update(skip_locked=True)
+            .filter(is_reserved=False)
+            .order_by("seat_number")
+            .first()
+        )
+        if seat is None:
+            return None
+
+        # 행 잠금을 잡고 있으므로 version 확인 없이 갱신하되, 버전은 올려 둡니다.
+        seat.is_reserved = True
+        seat.reserved_by = user
+        seat.version += 1
+        seat.save(update_fields=["is_reserved", "reserved_by", "version"])
+        quotas.acquire(user.pk)
+        history.record(history.RESERVED, {user.pk: [seat.seat_number]})
+        signals.send_on_commit(
+            signals.seats_reserved,
+            using=shard,
+            seat_numbers=[seat.seat_number],
+            user_id=user.pk,
+        )
+    return seat.seat_number
+
+
+def _claim_any_conditional(shard: str, user, max_attempts: int) -> int | None:
+    free_seats = Seat.objects.using(shard).filter(is_reserved=False)
+    for _ in range(max_attempts):
+        seat_number = (
+            free_seats.order_by("seat_number").values_list("seat_number", flat=True).first()
+        )
+        if seat_number is None:
+            return None
+        if _claim(shard, [seat_number], user):
+            return seat_number
+    raise VersionConflict(f"Lost {max_attempts} races for a free seat on {shard}")
+
+
+def _claim(shard: str, seat_numbers: list[int], user) -> bool:
+    """
+    블록의 모든 좌석이 비어 있을 때만 한 번의 UPDATE로 예약합니다.
+    사용자의 예약 상한을 넘으면 QuotaExceeded를 발생시키고 UPDATE를 되돌립니다.
+    """
+    with quotas.atomic(shard):
+        updated = (
+            Seat.objects.using(shard)
+            .filter(seat_number__in=seat_numbers, is_reserved=False)
+            .update(is_reserved=True, reserved_by=user, version=F("version") + 1)
+        )
+        if updated != len(seat_numbers):
+            transaction.set_rollback(True, using=shard)
+            return False
+
+        quotas.acquire(user.pk, len(seat_numbers))
+        history.record(history.RESERVED, {user.pk: seat_numbers})
+        signals.send_on_commit(
+            signals.seats_reserved,
+            using=shard,
+            seat_numbers=seat_numbers,
+            user_id=user.pk,
+        )
+    return True
+
+
+def _refresh(index: FreeSeatIndex, shard: str, seat_numbers: list[int]) -> None:
+    """선점에 실패한 블록의 좌석 상태를 DB 값으로 다시 맞춥니다."""
+    rows = Seat.objects.using(shard).filter(seat_number__in=seat_numbers)
+    states = dict(rows.values_list("seat_number", "is_reserved"))
+    index.mark_free(n for n in seat_numbers if states.get(n) is False)
+    index.mark_reserved(n for n in seat_numbers if states.get(n) is not False)
+
+
+@receiver(signals.seats_reserved, dispatch_uid="seats.allocation.seats_reserved")
+def _on_seats_reserved(sender, seat_numbers, **kwargs):
+    if _index is not None:
+        _index.mark_reserved(seat_numbers)
+
+
+@receiver(signals.seats_released, dispatch_uid="seats.allocation.seats_released")
+def _on_seats_released(sender, seat_numbers, **kwargs):
+    if _index is not None:
+        _index.mark_free(seat_numbers)
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class SeatsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "seats"
+
+    def ready(self):
+        # 시그널 수신자(샤딩, 좌석 배정 인덱스, 예약 시퀀서, 배치도 스냅샷)를 등록합니다.
+        from . import allocation, faults, seatmap, sequencer, sharding  # noqa: F401
+
+        faults.configure_from_settings()
@@ -0,0 +1,163 @@
+# seats/batching.py
+
+"""
+예약 요청 그룹 커밋 (SEAT_RESERVATION_BATCHING)
+
+짧은 시간(SEAT_BATCH_WINDOW_MS) 안에 도착한 예약 요청들을 샤드별로 모아
+하나의 트랜잭션으로 처리합니다. 요청마다 조건부 UPDATE로 충돌을 가리고,
+커밋(fsync)은 배치당 한 번만 일어나므로 동시 요청이 많을수록 처리량이 올라갑니다.
+
+먼저 도착한 요청이 배치의 리더가 되어 창이 닫힐 때까지(또는 배치가 가득 찰 때까지)
+기다린 뒤 배치 전체를 처리하고, 나머지 요청은 자신의 결과가 채워질 때까지 기다립니다.
+RESULT_TIMEOUT초가 지나도 결과가 없으면, 리더가 아직 가져가지 않은 요청만 큐에서 빼고 실패로
+응답합니다. 리더가 이미 가져간 요청은 커밋될 수 있으므로 결과가 나올 때까지 기다립니다.
+요청마다 스레드가 따로 있는 WSGI 워커(gunicorn gthread 등)를 전제로 합니다.
+"""
+
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db.models import F
+
+from . import history, quotas, signals
+from .models import Seat
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 2.0
+DEFAULT_MAX_SIZE = 64
+# 리더가 배치를 처리하는 동안 나머지 요청이 기다리는 최대 시간(초)
+RESULT_TIMEOUT = 10.0
+
+RESERVED = "reserved"
+ALREADY_RESERVED = "already_reserved"
+NOT_FOUND = "not_found"
+QUOTA_EXCEEDED = "quota_exceeded"
+ERROR = "error"
+
+
+@dataclass(eq=False)
+class PendingReservation:
+    seat_number: int
+    user: object
+    result: str | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
+class ReservationBatcher:
+    def __init__(self, window_ms: float = DEFAULT_WINDOW_MS, max_size: int = DEFAULT_MAX_SIZE):
+        self.window = window_ms / 1000
+        self.max_size = max_size
+        self._condition = threading.Condition()
+        self._queues: dict[str, list[PendingReservation]] = {}
+
+    def submit(self, shard: str, seat_number: int, user) -> str:
+        """예약 요청을 배치에 넣고, 배치가 처리된 뒤 이 요청의 결과를 반환합니다."""
+        item = PendingReservation(seat_number=seat_number, user=user)
+        with self._condition:
+            queue = self._queues.setdefault(shard, [])
+            queue.append(item)
+            is_leader = len(queue) == 1
+            if len(queue) >= self.max_size:
+                self._condition.notify_all()
+
+            if is_leader:
+                self._condition.wait_for(lambda: len(queue) >= self.max_size, timeout=self.window)
+                # 리더가 배치를 가져간 뒤 도착한 요청은 새 배치를 시작합니다.
+                batch = self._queues.pop(shard)
+
+        if is_leader:
+            self._flush(shard, batch)
+        elif not item.done.wait(RESULT_TIMEOUT):
+            with self._condition:
+                queue = self._queues.get(shard)
+                if queue is not None and item in queue:
+                    # 리더가 아직 배치를 가져가지 않았으므로 빼면 DB에 쓰지 않습니다.
+                    queue.remove(item)
+                    return ERROR
+            # 리더가 처리 중인 배치에 들어 있습니다. _flush는 항상 done을 설정합니다.
+            item.done.wait()
+        return item.result or ERROR
+
+    def _flush(self, shard: str, batch: list[PendingReservation]) -> None:
+        try:
+            self._apply(shard, batch)
+        except Exception:
+            logger.exception("Reservation batch of %d on %s failed", len(batch), shard)
+            for item in batch:
+                item.result = ERROR
+        finally:
+            for item in batch:
+                item.done.set()
+
+    def _apply(self, shard: str, batch: list[PendingReservation]) -> None:
+        """
+        배치 전체를 하나의 트랜잭션으로 처리합니다.
+        도착 순서대로 좌석마다 조건부 UPDATE를 실행하므로,
+        같은 좌석을 요청한 경우 먼저 도착한 요청만 성공합니다.
+        예약 상한을 넘은 요청은 세이브포인트로 그 요청만 되돌립니다.
+        """
+        seat_numbers = {item.seat_number for item in batch}
+        seats = Seat.objects.using(shard)
+        with quotas.atomic(shard):
+            existing = set(
+                seats.filter(seat_number__in=seat_numbers).values_list("seat_number", flat=True)
+            )
+            reserved: dict[int, list[int]] = defaultdict(list)
+            for item in batch:
+                if item.seat_number not in existing:
+                    item.result = NOT_FOUND
+                    continue
+                try:
+                    with quotas.atomic(shard):
+                        updated = seats.filter(
+                            seat_number=item.seat_number, is_reserved=False
+                        ).update(
+                            is_reserved=True,
+                            reserved_by=item.user,
+                            version=F("version") + 1,
+                        )
+                        if updated:
+                            quotas.acquire(item.user.pk)
+                except quotas.QuotaExceeded:
+                    item.result = QUOTA_EXCEEDED
+                    continue
+                item.result = RESERVED if updated else ALREADY_RESERVED
+                if updated:
+                    reserved[item.user.pk].append(item.seat_number)
+
+            history.record(history.RESERVED, reserved)
+            for user_id, numbers in reserved.items():
+                signals.send_on_commit(
+                    signals.seats_reserved,
+                    using=shard,
+                    seat_numbers=numbers,
+                    user_id=user_id,
+                )
+
+
+_batcher: ReservationBatcher | None = None
+_batcher_lock = threading.Lock()
+
+
+def get_batcher() -> ReservationBatcher:
+    global _batcher
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                _batcher = ReservationBatcher(
+                    window_ms=getattr(settings, "SEAT_BATCH_WINDOW_MS", DEFAULT_WINDOW_MS),
+                    max_size=getattr(settings, "SEAT_BATCH_MAX_SIZE", DEFAULT_MAX_SIZE),
+                )
+    return _batcher
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "SEAT_RESERVATION_BATCHING", False)
+
+
+def reserve(shard: str, seat_number: int, user) -> str:
+    return get_batcher().submit(shard, seat_number, user)
@@ -0,0 +1,64 @@
+# seats/concurrency.py
+
+"""
+좌석 상태 변경의 낙관적 동시성 제어
+
+좌석을 읽은 뒤 version이 그대로일 때만 갱신합니다. 그 사이 다른 요청이 좌석을 바꿨다면
+VersionConflict가 발생하며, retry_on_conflict()가 잠시 기다렸다가 처음부터 다시 시도합니다.
+비관적 잠금(SELECT ... FOR UPDATE) 없이도 예약과 취소가 서로의 변경을 덮어쓰지 않습니다.
+"""
+
+import random
+import time
+
+from django.conf import settings
+from django.db.models import F
+
+from . import metrics
+from .models import Seat
+
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_BASE_DELAY = 0.005
+
+
+class VersionConflict(Exception):
+    """좌석을 읽은 뒤 다른 요청이 먼저 좌석을 변경했습니다."""
+
+
+def update_seat_if_unchanged(seat: Seat, **changes) -> None:
+    """
+    seat를 읽었을 때의 version과 DB의 version이 같을 때만 changes를 반영하고 version을 올립니다.
+    성공하면 seat 인스턴스에도 변경 내용을 반영하고, 실패하면 VersionConflict를 발생시킵니다.
+    """
+    updated = (
+        Seat.objects.using(seat._state.db)
+        .filter(seat_number=seat.seat_number, version=seat.version)
+        .update(version=F("version") + 1, **changes)
+    )
+    if updated != 1:
+        raise VersionConflict(f"Seat {seat.seat_number} changed since version {seat.version}")
+
+    for field, value in changes.items():
+        setattr(seat, field, value)
+    seat.version += 1
+
+
+def retry_on_conflict(func, *, operation: str):
+    """
+    VersionConflict가 발생하면 지수 백오프(지터 포함) 후 func를 다시 호출합니다.
+    SEAT_VERSION_MAX_ATTEMPTS번 모두 충돌하면 마지막 VersionConflict를 그대로 발생시킵니다.
+    충돌 횟수는 "<operation>.version_conflict", 재시도 소진은 "<operation>.version_retry_exhausted"
+    지표로 집계됩니다.
+    """
+    max_attempts = getattr(settings, "SEAT_VERSION_MAX_ATTEMPTS", DEFAULT_MAX_ATTEMPTS)
+    base_delay = getattr(settings, "SEAT_VERSION_RETRY_BASE_DELAY", DEFAULT_RETRY_BASE_DELAY)
+
+    for attempt in range(max_attempts):
+        try:
+            return func()
+        except VersionConflict:
+            metrics.increment(f"{operation}.version_conflict")
+            if attempt == max_attempts - 1:
+                metrics.increment(f"{operation}.version_retry_exhausted")
+                raise
+            time.sleep(base_delay * (2**attempt) * random.uniform(0.5, 1.5))
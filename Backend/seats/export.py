@@ -0,0 +1,118 @@
+# seats/export.py
+
+"""
+좌석 예약 현황 내보내기 (CSV / NDJSON)
+
+좌석을 샤드별로 seat_number 키셋 페이지(seat_number > 이전 청크의 마지막 번호)로 chunk_size개씩
+읽고, 청크마다 예약자 username을 한 번에 조회하여 한 줄씩 만들어 냅니다.
+전체 목록을 메모리에 올리지 않으므로 좌석 수와 관계없이
+메모리 사용량이 청크 크기만큼으로 일정합니다.
+청크마다 짧은 쿼리를 따로 실행하므로, 느린 클라이언트에게 스트리밍하는 동안에도 서버 측 커서나
+긴 읽기 트랜잭션을 붙잡고 있지 않습니다. (OFFSET 없이 기본 키 인덱스로 다음 청크를 찾습니다)
+관리자 API(StreamingHttpResponse)와 export_reservations 명령이 함께 사용합니다.
+"""
+
+import csv
+import heapq
+import json
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from operator import itemgetter
+
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+
+from config.db_router import PRIMARY_DATABASE, get_read_database
+
+from . import sharding
+from .models import Seat
+
+DEFAULT_CHUNK_SIZE = 2000
+FIELDS = ("seat_number", "is_reserved", "reserved_by_id", "reserved_by_username")
+CONTENT_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def get_read_databases() -> tuple[list[str], str]:
+    """
+    현재 요청의 읽기 DB 기준으로 (좌석 샤드별 읽기 DB 목록, 사용자 읽기 DB)를 정합니다.
+    스트리밍 응답은 뷰가 반환된 뒤에 만들어지므로, 뷰 안에서 미리 정해 두어야 합니다.
+    """
+    databases = [sharding.read_database(alias) for alias in sharding.get_shard_databases()]
+    return databases, get_read_database() or PRIMARY_DATABASE
+
+
+def iter_reservations(
+    *,
+    reserved_only: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    databases: list[str] | None = None,
+    user_database: str = PRIMARY_DATABASE,
+) -> Iterator[dict]:
+    """좌석 번호 순으로 좌석과 예약자 username을 dict로 하나씩 돌려줍니다."""
+    if databases is None:
+        databases = sharding.get_shard_databases()
+
+    seats = Seat.objects.order_by("seat_number")
+    if reserved_only:
+        seats = seats.filter(is_reserved=True)
+    seats = seats.values_list("seat_number", "is_reserved", "reserved_by_id")
+    rows = heapq.merge(
+        *(_iter_keyset(seats.using(alias), chunk_size) for alias in databases),
+        key=itemgetter(0),
+    )
+
+    users = User.objects.using(user_database)
+    while chunk := list(islice(rows, chunk_size)):
+        user_ids = {row[2] for row in chunk if row[2] is not None}
+        usernames = dict(
+            users.filter(pk__in=user_ids).values_list("pk", "username") if user_ids else ()
+        )
+        for seat_number, is_reserved, user_id in chunk:
+            yield {
+                "seat_number": seat_number,
+                "is_reserved": is_reserved,
+                "reserved_by_id": user_id,
+                "reserved_by_username": usernames.get(user_id),
+            }
+
+
+def _iter_keyset(seats: QuerySet, chunk_size: int) -> Iterator[tuple]:
+    """seat_number 순으로 정렬된 values_list를 seat_number 키셋으로 chunk_size개씩 읽습니다."""
+    last_seat_number = None
+    while True:
+        page = seats if last_seat_number is None else seats.filter(seat_number__gt=last_seat_number)
+        chunk = list(page[:chunk_size])
+        yield from chunk
+        if len(chunk) < chunk_size:
+            return
+        last_seat_number = chunk[-1][0]
+
+
+def render(rows: Iterable[dict], export_format: str) -> Iterator[str]:
+    """행들을 export_format(csv, ndjson)의 한 줄씩으로 바꿉니다."""
+    if export_format == "ndjson":
+        for row in rows:
+            yield json.dumps(row, ensure_ascii=False) + "\n"
+        return
+
+    writer = csv.writer(_Echo())
+    yield writer.writerow(FIELDS)
+    for row in rows:
+        yield writer.writerow(
+            [
+                row["seat_number"],
+                row["is_reserved"],
+                row["reserved_by_id"] or "",
+                row["reserved_by_username"] or "",
+            ]
+        )
+
+
+class _Echo:
+    """csv.writer가 쓴 한 줄을 그대로 돌려주는 버퍼 (Django 문서의 대용량 CSV 예제)"""
+
+    def write(self, value: str) -> str:
+        return value
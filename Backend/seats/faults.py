@@ -0,0 +1,141 @@
+# seats/faults.py
+
+"""
+장애 주입 (부하 테스트/벤치마크 재현용)
+
+주입 지점(엔드포인트)마다 실패 확률, 지연 시간, 장애 구간을 설정합니다.
+
+- SEAT_FAULTS_ENABLED: False이면 주입기를 만들지 않으며 inject()는 바로 False를 반환합니다.
+- SEAT_FAULT_SEED: 지정하면 주입 지점마다 시드가 고정된 난수 생성기를 쓰므로,
+  같은 순서의 요청에는 항상 같은 장애가 주입됩니다.
+- SEAT_FAULT_RULES: {"주입 지점": {"failure_rate", "latency_ms", "latency_rate", "windows"}}
+  windows는 [[시작, 끝], ...] (설정 시점부터 흐른 초)이며, 지정하면 그 구간에서만 주입합니다.
+
+관리자는 /api/seats/faults/ 에서 현재 워커의 설정을 조회하고 바꿀 수 있습니다.
+"""
+
+import random
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from . import metrics
+
+INJECTION_POINTS = ("reserve", "reserve_best_available", "reserve_any", "cancel")
+
+
+@dataclass(frozen=True)
+class FaultRule:
+    failure_rate: float = 0.0
+    latency_ms: float = 0.0
+    latency_rate: float = 1.0
+    windows: tuple[tuple[float, float], ...] = ()
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FaultRule":
+        return cls(
+            failure_rate=float(data.get("failure_rate", 0.0)),
+            latency_ms=float(data.get("latency_ms", 0.0)),
+            latency_rate=float(data.get("latency_rate", 1.0)),
+            windows=tuple((float(start), float(end)) for start, end in data.get("windows", ())),
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "failure_rate": self.failure_rate,
+            "latency_ms": self.latency_ms,
+            "latency_rate": self.latency_rate,
+            "windows": [[start, end] for start, end in self.windows],
+        }
+
+
+class FaultInjector:
+    def __init__(
+        self,
+        rules: dict[str, FaultRule],
+        seed: int | None = None,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        self.rules = rules
+        self.seed = seed
+        self._clock = clock
+        self._sleep = sleep
+        self.started_at = clock()
+        # 주입 지점마다 난수열을 따로 두어 다른 엔드포인트의 요청 수에 영향받지 않게 합니다.
+        self._rngs = {
+            point: (random.Random(f"{seed}:{point}") if seed is not None else random.Random())
+            for point in rules
+        }
+
+    def elapsed(self) -> float:
+        return self._clock() - self.started_at
+
+    def inject(self, point: str) -> bool:
+        """설정된 지연을 주입하고, 이번 요청을 실패시켜야 하면 True를 반환합니다."""
+        rule = self.rules.get(point)
+        if rule is None:
+            return False
+        if rule.windows:
+            elapsed = self.elapsed()
+            if not any(start <= elapsed < end for start, end in rule.windows):
+                return False
+
+        rng = self._rngs[point]
+        if rule.latency_ms and rng.random() < rule.latency_rate:
+            metrics.increment(f"{point}.injected_latency")
+            self._sleep(rule.latency_ms / 1000)
+        if rule.failure_rate and rng.random() < rule.failure_rate:
+            metrics.increment(f"{point}.injected_failure")
+            return True
+        return False
+
+
+_injector: FaultInjector | None = None
+
+
+def inject(point: str) -> bool:
+    """장애 주입이 꺼져 있으면 None 확인 한 번으로 끝납니다."""
+    injector = _injector
+    return injector is not None and injector.inject(point)
+
+
+def configure(enabled: bool, rules: dict[str, dict], seed: int | None = None) -> None:
+    """주입기를 새로 만듭니다. 장애 구간의 기준 시각과 난수열도 처음부터 다시 시작합니다."""
+    global _injector
+    if not enabled:
+        _injector = None
+        return
+    _injector = FaultInjector(
+        {point: FaultRule.from_dict(rule) for point, rule in rules.items()}, seed=seed
+    )
+
+
+def configure_from_settings() -> None:
+    configure(
+        enabled=getattr(settings, "SEAT_FAULTS_ENABLED", False),
+        rules=getattr(settings, "SEAT_FAULT_RULES", {}),
+        seed=getattr(settings, "SEAT_FAULT_SEED", None),
+    )
+
+
+def get_config() -> dict:
+    injector = _injector
+    if injector is None:
+        return {"enabled": False, "seed": None, "rules": {}, "elapsed": None}
+    return {
+        "enabled": True,
+        "seed": injector.seed,
+        "rules": {point: rule.to_dict() for point, rule in injector.rules.items()},
+        "elapsed": injector.elapsed(),
+    }
+
+
+@receiver(setting_changed, dispatch_uid="seats.faults.setting_changed")
+def _on_setting_changed(sender, setting, **kwargs):
+    # override_settings로 장애 주입 설정을 바꾸면 주입기를 다시 만듭니다.
+    if setting.startswith("SEAT_FAULT"):
+        configure_from_settings()
@@ -0,0 +1,31 @@
+# seats/history.py
+
+"""
+사용자별 예약 이력 (ReservationEvent)
+
+예약/취소/초기화가 좌석을 바꾸는 트랜잭션(quotas.atomic) 안에서, 예약 카운터를 갱신하는 곳
+바로 옆에서 record를 호출하여 좌석마다 이력 한 행을 primary에 기록합니다.
+좌석 변경과 함께 커밋되거나 함께 되돌려지므로, 이력이 빠지거나 되돌려진 예약이 남지 않습니다.
+
+조회는 (user, created_at, id) 인덱스를 따라 최신순으로 읽는 키셋 페이지네이션만 제공합니다.
+OFFSET이나 COUNT(*)를 쓰지 않으므로 이력이 아무리 길어도 한 페이지의 비용은 같습니다.
+"""
+
+from config.db_router import PRIMARY_DATABASE
+
+from .models import ReservationEvent
+
+RESERVED = ReservationEvent.Action.RESERVED
+RELEASED = ReservationEvent.Action.RELEASED
+
+
+def record(action: str, seat_numbers_by_user: dict[int | None, list[int]]) -> None:
+    """사용자별 좌석 번호 목록의 이력을 한 번의 INSERT로 기록합니다. (사용자가 없는 좌석은 제외)"""
+    events = [
+        ReservationEvent(user_id=user_id, seat_number=seat_number, action=action)
+        for user_id, seat_numbers in seat_numbers_by_user.items()
+        if user_id is not None
+        for seat_number in seat_numbers
+    ]
+    if events:
+        ReservationEvent.objects.using(PRIMARY_DATABASE).bulk_create(events)
@@ -0,0 +1,154 @@
+# seats/layout.py
+
+"""
+좌석 배치(정적)와 예약 가능 여부(동적) 분리
+
+좌석 목록(SeatListView)은 좌석 정보와 예약 상태를 매번 함께 보냅니다.
+좌석의 위치와 이름은 거의 바뀌지 않으므로 따로 떼어 내어,
+클라이언트가 배치는 공연마다 한 번만 받고 새로 고칠 때는 작은 예약 상태만 받게 합니다.
+
+- 배치(layout): 구역(section) > 행(row) > 좌석(좌표, 이름). 내용의 해시를 URL에 넣어
+  (/api/seats/layout/<hash>/) 영구 캐시(immutable)할 수 있게 합니다. 좌석이 추가/삭제되거나
+  배치 설정이 바뀌면 해시가 바뀌므로 클라이언트는 새 URL을 받게 됩니다.
+- 예약 상태(availability): 배치도 버전, 배치 해시, 예약된 좌석 번호 목록만 보냅니다.
+
+둘 다 좌석 배치도 스냅샷(seatmap)에서 만들므로 좌석 테이블을 따로 조회하지 않으며,
+스냅샷마다 한 번만 직렬화/압축합니다.
+
+좌석 번호를 SEAT_ROW_LENGTH개씩 나누어 행을, SEAT_SECTION_ROWS개의 행을 묶어 구역을 만듭니다.
+(allocation의 행 구성과 같습니다) 좌표는 행 안의 위치(x)와 행 번호(y)이며,
+구역 사이에는 한 행만큼 간격을 둡니다.
+"""
+
+import json
+import string
+import threading
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from config.precompressed import PrecompressedBody
+
+from .seatmap import SeatMapSnapshot
+
+DEFAULT_ROW_LENGTH = 3
+DEFAULT_SECTION_ROWS = 10
+CONTENT_TYPE = "application/json"
+# 해시가 든 URL의 배치는 내용이 바뀌지 않으므로 1년 동안 다시 확인하지 않게 합니다.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@dataclass(frozen=True)
+class SeatLayout:
+    seat_numbers: tuple[int, ...]
+    body: PrecompressedBody
+
+    @property
+    def digest(self) -> str:
+        return self.body.digest
+
+
+def section_name(index: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA ..."""
+    name = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        name = string.ascii_uppercase[remainder] + name
+    return name
+
+
+def build_layout(seat_numbers: tuple[int, ...]) -> dict:
+    row_length = getattr(settings, "SEAT_ROW_LENGTH", DEFAULT_ROW_LENGTH)
+    section_rows = getattr(settings, "SEAT_SECTION_ROWS", DEFAULT_SECTION_ROWS)
+
+    sections: dict[int, dict[int, list[dict]]] = {}
+    for seat_number in seat_numbers:
+        row, position = divmod(seat_number - 1, row_length)
+        section, row_in_section = divmod(row, section_rows)
+        sections.setdefault(section, {}).setdefault(row_in_section, []).append(
+            {
+                "seat_number": seat_number,
+                "x": position,
+                "label": f"{section_name(section)}{row_in_section + 1}-{position + 1}",
+            }
+        )
+    return {
+        "row_length": row_length,
+        "sections": [
+            {
+                "name": section_name(section),
+                "rows": [
+                    {
+                        "name": f"{section_name(section)}{row_in_section + 1}",
+                        # 구역마다 한 행만큼 간격을 둡니다.
+                        "y": section * (section_rows + 1) + row_in_section,
+                        "seats": seats,
+                    }
+                    for row_in_section, seats in sorted(rows.items())
+                ],
+            }
+            for section, rows in sorted(sections.items())
+        ],
+    }
+
+
+def _render(data: dict) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+_layout: SeatLayout | None = None
+# 읽기 DB별 (스냅샷, 예약 상태 본문)
+_availability: dict[str, tuple[SeatMapSnapshot, PrecompressedBody]] = {}
+_lock = threading.Lock()
+
+
+def get_layout(snapshot: SeatMapSnapshot) -> SeatLayout:
+    """스냅샷의 좌석들로 배치를 만듭니다. 좌석 구성이 같으면 이전 배치를 그대로 씁니다."""
+    global _layout
+    seat_numbers = tuple(seat["seat_number"] for seat in snapshot.data)
+    layout = _layout
+    if layout is not None and layout.seat_numbers == seat_numbers:
+        return layout
+    with _lock:
+        if _layout is None or _layout.seat_numbers != seat_numbers:
+            _layout = SeatLayout(
+                seat_numbers=seat_numbers,
+                body=PrecompressedBody.build(_render(build_layout(seat_numbers)), CONTENT_TYPE),
+            )
+        return _layout
+
+
+def get_availability(snapshot: SeatMapSnapshot) -> PrecompressedBody:
+    """스냅샷의 예약 상태 본문. 스냅샷마다 한 번만 만듭니다."""
+    cached = _availability.get(snapshot.database)
+    if cached is not None and cached[0] is snapshot:
+        return cached[1]
+    body = PrecompressedBody.build(
+        _render(
+            {
+                "version": snapshot.version,
+                "layout": get_layout(snapshot).digest,
+                "reserved": [seat["seat_number"] for seat in snapshot.data if seat["is_reserved"]],
+            }
+        ),
+        CONTENT_TYPE,
+    )
+    with _lock:
+        _availability[snapshot.database] = (snapshot, body)
+    return body
+
+
+def reset() -> None:
+    global _layout
+    with _lock:
+        _layout = None
+        _availability.clear()
+
+
+@receiver(setting_changed, dispatch_uid="seats.layout.setting_changed")
+def _on_setting_changed(sender, setting, **kwargs):
+    if setting in ("SEAT_ROW_LENGTH", "SEAT_SECTION_ROWS"):
+        reset()
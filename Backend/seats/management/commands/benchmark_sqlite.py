@@ -0,0 +1,58 @@
+# seats/management/commands/benchmark_sqlite.py
+
+import tempfile
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config import sqlite_benchmark
+
+
+class Command(BaseCommand):
+    help = (
+        "임시 SQLite 파일에서 동시 예약을 실행하여 기본 설정과 동시성 프로필의 "
+        "처리량과 잠금 오류 수를 비교합니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--profile",
+            choices=[*sqlite_benchmark.PROFILES, "all"],
+            default="all",
+            help="실행할 프로필 (기본값: all)",
+        )
+        parser.add_argument("--threads", type=int, default=8, help="동시 예약 스레드 수")
+        parser.add_argument("--reservations", type=int, default=2000, help="전체 예약 시도 횟수")
+        parser.add_argument("--seats", type=int, default=10_000, help="좌석 수")
+        parser.add_argument(
+            "--busy-timeout",
+            type=float,
+            default=5.0,
+            help="다른 쓰기를 기다리는 최대 시간(초, 두 프로필 공통)",
+        )
+
+    def handle(self, *args, **options):
+        if options["threads"] < 1 or options["reservations"] < options["threads"]:
+            raise CommandError("--reservations는 --threads 이상이어야 합니다.")
+        profiles = (
+            sqlite_benchmark.PROFILES if options["profile"] == "all" else (options["profile"],)
+        )
+
+        self.stdout.write(
+            f"{'profile':<10} {'reserved':>9} {'conflicts':>9} {'locked':>7} "
+            f"{'seconds':>8} {'tx/s':>9}"
+        )
+        for profile in profiles:
+            with tempfile.TemporaryDirectory() as directory:
+                result = sqlite_benchmark.benchmark_reservations(
+                    Path(directory) / "benchmark.sqlite3",
+                    sqlite_benchmark.profile_options(profile, options["busy_timeout"]),
+                    threads=options["threads"],
+                    reservations=options["reservations"],
+                    seats=options["seats"],
+                )
+            self.stdout.write(
+                f"{profile:<10} {result['reserved']:>9} {result['conflicts']:>9} "
+                f"{result['locked']:>7} {result['seconds']:>8.2f} "
+                f"{result['throughput']:>9.1f}"
+            )
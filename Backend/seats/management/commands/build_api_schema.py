@@ -0,0 +1,18 @@
+# seats/management/commands/build_api_schema.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from config.schema import write_schema_file
+
+
+class Command(BaseCommand):
+    help = "OpenAPI 스키마를 미리 생성해 API_SCHEMA_FILE에 저장합니다."
+
+    def handle(self, *args, **options):
+        if not getattr(settings, "API_DOCS_ENABLED", False):
+            self.stdout.write("API 문서가 비활성화되어 있어 스키마를 생성하지 않습니다.")
+            return
+
+        path = write_schema_file()
+        self.stdout.write(f"OpenAPI 스키마를 저장했습니다: {path}")
@@ -0,0 +1,49 @@
+# seats/management/commands/export_reservations.py
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+
+from seats import export
+
+
+class Command(BaseCommand):
+    help = "좌석별 예약 현황(예약자 username 포함)을 CSV 또는 NDJSON으로 내보냅니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=sorted(export.CONTENT_TYPES),
+            default="csv",
+            help="출력 형식 (기본값: csv)",
+        )
+        parser.add_argument("--output", type=Path, help="저장할 파일 (기본값: 표준 출력)")
+        parser.add_argument(
+            "--reserved-only", action="store_true", help="예약된 좌석만 내보냅니다."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=export.DEFAULT_CHUNK_SIZE,
+            help="DB에서 한 번에 읽을 좌석 수",
+        )
+
+    def handle(self, *args, **options):
+        rows = export.iter_reservations(
+            reserved_only=options["reserved_only"], chunk_size=options["chunk_size"]
+        )
+        lines = export.render(rows, options["format"])
+
+        if options["output"] is None:
+            for line in lines:
+                self.stdout.write(line, ending="")
+            return
+
+        count = 0
+        with options["output"].open("w", newline="", encoding="utf-8") as output:
+            for line in lines:
+                output.write(line)
+                count += 1
+        if options["format"] == "csv":
+            count -= 1  # 헤더 행
+        self.stdout.write(f"좌석 {count}개를 저장했습니다: {options['output']}")
@@ -0,0 +1,13 @@
+# seats/management/commands/recompute_reservation_quotas.py
+
+from django.core.management.base import BaseCommand
+
+from seats.quotas import recompute
+
+
+class Command(BaseCommand):
+    help = "모든 샤드의 예약된 좌석을 세어 사용자별 예약 카운터(reserved_count)를 다시 맞춥니다."
+
+    def handle(self, *args, **options):
+        updated = recompute()
+        self.stdout.write(f"예약 카운터 {updated}개를 갱신했습니다.")
@@ -0,0 +1,93 @@
+# seats/management/commands/replay_requests.py
+
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from config import capture, replay
+
+
+class Command(BaseCommand):
+    help = "기록한 API 요청(JSONL)을 대상 서버에 다시 보내고 처리 시간을 비교합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("captures", nargs="+", type=Path, help="기록 파일들")
+        parser.add_argument(
+            "--base-url",
+            default="http://127.0.0.1:8000",
+            help="요청을 보낼 서버 (기본값: http://127.0.0.1:8000)",
+        )
+        parser.add_argument(
+            "--speed",
+            type=float,
+            default=1.0,
+            help="재현 속도 배율 (기본값: 1, 0이면 간격 없이 최대한 빠르게)",
+        )
+        parser.add_argument("--concurrency", type=int, default=8, help="동시에 보내는 요청 수")
+        auth = parser.add_mutually_exclusive_group()
+        auth.add_argument(
+            "--tokens",
+            type=Path,
+            help=(
+                "로그인했던 요청에 사용자별로 붙일 access 토큰 파일 "
+                "(provision_users --tokens-out으로 만든 JSONL, 기록에는 토큰이 없습니다)"
+            ),
+        )
+        auth.add_argument(
+            "--token",
+            help="로그인했던 모든 요청에 붙일 access 토큰 하나",
+        )
+        parser.add_argument("--limit", type=int, help="앞에서부터 이 개수의 요청만 재현합니다.")
+
+    def handle(self, *args, **options):
+        if options["speed"] < 0:
+            raise CommandError("--speed는 0 이상이어야 합니다.")
+        if options["concurrency"] < 1:
+            raise CommandError("--concurrency는 1 이상이어야 합니다.")
+        for path in options["captures"]:
+            if not path.exists():
+                raise CommandError(f"기록 파일이 없습니다: {path}")
+        tokens = [options["token"]] if options["token"] else []
+        if options["tokens"] is not None:
+            if not options["tokens"].exists():
+                raise CommandError(f"토큰 파일이 없습니다: {options['tokens']}")
+            tokens = replay.read_tokens(options["tokens"])
+
+        records = capture.read_capture(options["captures"])
+        if options["limit"] is not None:
+            records = records[: options["limit"]]
+        # 비밀번호/토큰이 가려진 인증 요청은 재현해도 실패하므로 건너뜁니다.
+        skipped = sum(replay.is_auth_request(record) for record in records)
+        records = [record for record in records if not replay.is_auth_request(record)]
+        if skipped:
+            self.stdout.write(f"인증 요청 {skipped}개는 재현하지 않습니다.")
+        if not records:
+            self.stdout.write("재현할 요청이 없습니다.")
+            return
+
+        span = records[-1]["ts"] - records[0]["ts"]
+        self.stdout.write(
+            f"요청 {len(records)}개 (기록 구간 {span:.1f}초)를 {options['base_url']}에 재현합니다."
+        )
+        results = replay.replay(
+            records,
+            options["base_url"],
+            speed=options["speed"],
+            concurrency=options["concurrency"],
+            tokens=tokens,
+        )
+
+        self.stdout.write(
+            f"{'endpoint':<40} {'count':>6} {'cap_p50':>9} {'rep_p50':>9} "
+            f"{'cap_p95':>9} {'rep_p95':>9} {'delta_p50':>9} "
+            f"{'mismatch':>8} {'errors':>6} {'max_lag':>9}"
+        )
+        for row in replay.summarize(results):
+            self.stdout.write(
+                f"{row['endpoint']:<40} {row['count']:>6} "
+                f"{row['captured_p50']:>9.1f} {row['replayed_p50']:>9.1f} "
+                f"{row['captured_p95']:>9.1f} {row['replayed_p95']:>9.1f} "
+                f"{row['delta_p50']:>+9.1f} {row['status_mismatches']:>8} "
+                f"{row['errors']:>6} {row['max_lag']:>9.1f}"
+            )
+        self.stdout.write("(cap: 기록 당시, rep: 재현, 단위: ms)")
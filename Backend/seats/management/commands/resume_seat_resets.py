@@ -0,0 +1,18 @@
+# seats/management/commands/resume_seat_resets.py
+
+from django.core.management.base import BaseCommand
+
+from seats.reset_jobs import resume_incomplete_jobs
+
+
+class Command(BaseCommand):
+    help = "중단된 좌석 초기화 작업을 마지막으로 커밋된 지점부터 재개합니다."
+
+    def handle(self, *args, **options):
+        jobs = resume_incomplete_jobs()
+        if not jobs:
+            self.stdout.write("재개할 좌석 초기화 작업이 없습니다.")
+            return
+
+        for job in jobs:
+            self.stdout.write(f"작업 {job.pk}: {job.status} (초기화된 좌석 {job.reset_count}개)")
@@ -0,0 +1,32 @@
+# seats/metrics.py
+
+"""
+예약 관련 카운터 (워커별, 메모리)
+
+이름 규칙은 "<작업>.<결과>" 입니다. 예) reserve.success, reserve.version_conflict
+예약/취소 결과는 초당 시계열(timeseries)에도 함께 기록됩니다.
+"""
+
+import threading
+from collections import Counter
+
+from . import timeseries
+
+_counters: Counter[str] = Counter()
+_lock = threading.Lock()
+
+
+def increment(name: str, amount: int = 1) -> None:
+    with _lock:
+        _counters[name] += amount
+    timeseries.record_metric(name, amount)
+
+
+def snapshot() -> dict[str, int]:
+    with _lock:
+        return dict(_counters)
+
+
+def reset() -> None:
+    with _lock:
+        _counters.clear()
@@ -2,15 +2,20 @@
 
 from django.db import migrations
 
+from seats.sharding import shard_for_seat
+
 
 def create_initial_seats(apps, schema_editor):
     Seat = apps.get_model("seats", "Seat")
+    # 여러 DB를 사용할 때에도 현재 마이그레이션 중인 DB에 좌석을 생성합니다.
+    # 샤딩을 사용하면 SEAT_SHARDS에서 이 DB가 소유한 좌석 번호만 생성합니다.
+    db_alias = schema_editor.connection.alias
     for i in range(1, 10):
-        Seat.objects.create(seat_number=i)
+        if shard_for_seat(i) == db_alias:
+            Seat.objects.using(db_alias).create(seat_number=i)
 
 
 class Migration(migrations.Migration):
-
     dependencies = [
         ("seats", "0001_initial"),
     ]
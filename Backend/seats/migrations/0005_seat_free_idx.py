@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seats", "0004_seat_reserved_by_no_constraint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="seat",
+            index=models.Index(
+                fields=["is_reserved", "seat_number"], name="seat_free_idx"
+            ),
+        ),
+    ]
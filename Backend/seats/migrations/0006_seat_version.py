@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seats", "0005_seat_free_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="seat",
+            name="version",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
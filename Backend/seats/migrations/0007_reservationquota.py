@@ -0,0 +1,55 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:46
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_reserved_counts(apps, schema_editor):
+    # 예약 카운터는 primary에만 있으므로 primary를 마이그레이션할 때 한 번만 채웁니다.
+    # primary가 아닌 샤드의 예약은 세지 않으므로, 샤드를 쓰는 경우 모든 샤드를 마이그레이션한 뒤
+    # `python manage.py recompute_reservation_quotas`로 reserved_count를 다시 맞춥니다.
+    db_alias = schema_editor.connection.alias
+    if db_alias != "default":
+        return
+    Seat = apps.get_model("seats", "Seat")
+    ReservationQuota = apps.get_model("seats", "ReservationQuota")
+    counts = (
+        Seat.objects.using(db_alias)
+        .filter(is_reserved=True, reserved_by__isnull=False)
+        .values_list("reserved_by")
+        .annotate(count=models.Count("seat_number"))
+    )
+    ReservationQuota.objects.using(db_alias).bulk_create(
+        ReservationQuota(user_id=user_id, reserved_count=count)
+        for user_id, count in counts
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("seats", "0006_seat_version"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReservationQuota",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="reservation_quota",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                ("reserved_count", models.PositiveIntegerField(default=0)),
+                ("limit", models.PositiveIntegerField(blank=True, null=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_reserved_counts, migrations.RunPython.noop),
+    ]
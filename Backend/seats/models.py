@@ -4,11 +4,23 @@ from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import models
 
+from .sharding import shard_for_seat
+
+
+class SeatQuerySet(models.QuerySet):
+    def create(self, **kwargs):
+        # DB를 명시하지 않았다면 좌석 번호를 소유한 샤드에 생성합니다.
+        if self._db is None and kwargs.get("seat_number") is not None:
+            return self.using(shard_for_seat(kwargs["seat_number"])).create(**kwargs)
+        return super().create(**kwargs)
+
 
 # Create your models here.
 class Seat(models.Model):
     seat_number: int = models.AutoField(primary_key=True)
     is_reserved: bool = models.BooleanField(default=False)
+    # 낙관적 동시성 제어용 버전. 좌석 상태가 바뀔 때마다 1씩 증가합니다.
+    version: int = models.PositiveIntegerField(default=0)
 
     reserved_by: Optional[User] = models.ForeignKey(
         settings.AUTH_USER_MODEL,
@@ -16,7 +28,122 @@ class Seat(models.Model):
         null=True,
         blank=True,
         related_name="seats",
+        # 좌석은 사용자와 다른 DB(샤드)에 저장될 수 있으므로 DB 수준의 외래 키 제약을 두지 않습니다.
+        db_constraint=False,
     )
 
+    objects = SeatQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 빈 좌석을 좌석 번호 순으로 찾는 쿼리(자동 배정, SKIP LOCKED)가 인덱스만 읽도록 합니다.
+            models.Index(fields=["is_reserved", "seat_number"], name="seat_free_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"Seat {self.seat_number}"
+
+
+class SeatResetJob(models.Model):
+    """
+    좌석 초기화를 PK 범위 단위로 나누어 수행하는 백그라운드 작업.
+    청크마다 진행 위치(last_seat_number)를 함께 커밋하므로,
+    작업이 중간에 중단되어도 마지막 커밋 지점부터 재개할 수 있습니다.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "대기"
+        RUNNING = "running", "진행 중"
+        COMPLETED = "completed", "완료"
+        FAILED = "failed", "실패"
+
+    status: str = models.CharField(
+        max_length=16, choices=Status.choices, default=Status.PENDING, db_index=True
+    )
+    chunk_size: int = models.PositiveIntegerField()
+    # 작업 시작 시점의 최대 좌석 번호. 이후에 추가된 좌석은 초기화 대상이 아닙니다.
+    max_seat_number: int = models.IntegerField(default=0)
+    # 마지막으로 커밋된 청크의 끝 좌석 번호 (재개 지점)
+    last_seat_number: int = models.IntegerField(default=0)
+    reset_count: int = models.PositiveIntegerField(default=0)
+    error: str = models.TextField(blank=True)
+
+    requested_by: Optional[User] = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    ACTIVE_STATUSES = (Status.PENDING, Status.RUNNING)
+
+    @property
+    def is_active(self) -> bool:
+        return self.status in self.ACTIVE_STATUSES
+
+    @property
+    def progress(self) -> float:
+        """처리된 PK 범위의 비율 (0.0 ~ 1.0)"""
+        if self.status == self.Status.COMPLETED:
+            return 1.0
+        if self.max_seat_number <= 0:
+            return 0.0
+        return min(self.last_seat_number / self.max_seat_number, 1.0)
+
+    def __str__(self) -> str:
+        return f"SeatResetJob {self.pk} ({self.status})"
+
+
+class ReservationQuota(models.Model):
+    """
+    사용자별 예약 좌석 수와 예약 상한.
+    예약/취소/초기화 시 좌석 변경과 같은 트랜잭션에서 reserved_count를 갱신하므로,
+    상한 확인에 Seat 테이블 COUNT(*)가 필요 없습니다. (seats/quotas.py 참고)
+    """
+
+    user: User = models.OneToOneField(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="reservation_quota",
+    )
+    reserved_count: int = models.PositiveIntegerField(default=0)
+    # 이 사용자에게만 적용할 상한. 비어 있으면 SEAT_MAX_PER_USER를 따릅니다.
+    limit: Optional[int] = models.PositiveIntegerField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        return f"ReservationQuota {self.user_id} ({self.reserved_count})"
+
+
+class ReservationEvent(models.Model):
+    """
+    사용자별 예약/해제 이력. 좌석을 바꾸는 트랜잭션 안에서 함께 기록합니다. (seats/history.py)
+    (user, created_at, id) 인덱스로 사용자의 이력을 최신순으로 키셋 페이지네이션합니다.
+    """
+
+    class Action(models.TextChoices):
+        RESERVED = "reserved", "예약"
+        RELEASED = "released", "해제"
+
+    user: User = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        # 아래 복합 인덱스가 user로 시작하므로 단일 인덱스는 만들지 않습니다.
+        db_index=False,
+    )
+    seat_number: int = models.PositiveIntegerField()
+    action: str = models.CharField(max_length=8, choices=Action.choices)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "created_at", "id"], name="reservation_event_user_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return f"ReservationEvent {self.user_id} {self.action} {self.seat_number}"
@@ -16,4 +16,5 @@ class IsOwnerOrAdmin(permissions.BasePermission):
             return True
 
         # 객체의 소유자(reserved_by)와 요청을 보낸 사용자(request.user)가 같은지 확인합니다.
-        return obj.reserved_by == request.user
+        # 좌석과 사용자가 다른 DB(샤드)에 있을 수 있으므로 사용자 조회 없이 ID로 비교합니다.
+        return obj.reserved_by_id == request.user.pk
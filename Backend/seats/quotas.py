@@ -0,0 +1,139 @@
+# seats/quotas.py
+
+"""
+사용자별 예약 상한 (SEAT_MAX_PER_USER, ReservationQuota.limit)
+
+예약할 때마다 Seat 테이블을 COUNT(*)하지 않고, ReservationQuota.reserved_count를
+"상한 안에 있을 때만 증가"하는 조건부 UPDATE 한 번으로 올립니다.
+UPDATE가 0행을 갱신하면 상한에 도달한 것이므로 QuotaExceeded를 발생시켜 트랜잭션을 되돌립니다.
+
+카운터는 primary에 있습니다. 좌석 변경은 atomic(shard) 안에서 실행하여
+카운터 갱신과 같은 트랜잭션(다른 샤드라면 primary 트랜잭션 안의 샤드 트랜잭션)으로 묶습니다.
+"""
+
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import Case, Count, F, Q, When
+from django.db.models.lookups import LessThanOrEqual
+
+from config.db_router import PRIMARY_DATABASE
+
+from . import sharding
+from .models import ReservationQuota, Seat
+
+
+class QuotaExceeded(Exception):
+    """사용자가 예약할 수 있는 최대 좌석 수를 넘었습니다."""
+
+
+@contextmanager
+def atomic(shard: str):
+    """카운터(primary)와 좌석(shard)을 함께 갱신하는 트랜잭션"""
+    with transaction.atomic(using=PRIMARY_DATABASE):
+        if shard == PRIMARY_DATABASE:
+            yield
+        else:
+            with transaction.atomic(using=shard):
+                yield
+
+
+def acquire(user_id: int, count: int = 1) -> None:
+    """
+    user_id의 예약 좌석 수를 count만큼 늘립니다.
+    상한을 넘으면 QuotaExceeded를 발생시키므로, 좌석을 갱신한 뒤 같은 트랜잭션 안에서 호출합니다.
+    """
+    if _increment(user_id, count):
+        return
+    # 카운터 행이 아직 없는 사용자라면 만든 뒤 한 번 더 시도합니다.
+    # 같은 사용자의 첫 예약이 동시에 들어오면 다른 요청이 먼저 만들었을 수 있으므로
+    # created와 관계없이 다시 시도하고, 그래도 실패할 때만 상한 초과로 봅니다.
+    ReservationQuota.objects.using(PRIMARY_DATABASE).get_or_create(user_id=user_id)
+    if not _increment(user_id, count):
+        raise QuotaExceeded(f"User {user_id} cannot reserve {count} more seat(s)")
+
+
+def release(user_id: int | None, count: int = 1) -> None:
+    if user_id is not None:
+        release_many({user_id: count})
+
+
+def release_many(counts: dict[int | None, int]) -> None:
+    """
+    사용자별 해제 좌석 수만큼 카운터를 줄입니다.
+    같은 수를 해제하는 사용자끼리 묶어 한 번의 UPDATE로 갱신합니다.
+    """
+    by_count: dict[int, list[int]] = defaultdict(list)
+    for user_id, count in counts.items():
+        if user_id is not None and count > 0:
+            by_count[count].append(user_id)
+
+    quotas = ReservationQuota.objects.using(PRIMARY_DATABASE)
+    for count, user_ids in by_count.items():
+        quotas.filter(user_id__in=user_ids).update(
+            reserved_count=Case(
+                When(reserved_count__gte=count, then=F("reserved_count") - count),
+                default=0,
+            )
+        )
+
+
+def recompute() -> int:
+    """
+    모든 샤드의 예약된 좌석을 세어 reserved_count를 다시 맞추고, 바꾼 카운터 수를 반환합니다.
+    0007 마이그레이션은 primary의 좌석만 세므로, 샤드를 쓰도록 바꾼 뒤에는 이것으로 맞춥니다.
+    (recompute_reservation_quotas 명령) 세는 동안의 예약/취소는 반영되지 않을 수 있으므로
+    예약을 받지 않는 동안 실행합니다.
+    """
+    counts: dict[int, int] = defaultdict(int)
+    seats = (
+        Seat.objects.filter(is_reserved=True, reserved_by__isnull=False)
+        .values_list("reserved_by")
+        .annotate(count=Count("seat_number"))
+        .order_by()
+    )
+    for queryset in sharding.iter_shard_querysets(seats, for_read=False):
+        for user_id, count in queryset:
+            counts[user_id] += count
+
+    quotas = ReservationQuota.objects.using(PRIMARY_DATABASE)
+    users = get_user_model().objects.using(PRIMARY_DATABASE)
+    with transaction.atomic(using=PRIMARY_DATABASE):
+        existing = {quota.user_id: quota for quota in quotas.select_for_update()}
+        changed = []
+        for user_id, quota in existing.items():
+            if quota.reserved_count != counts.get(user_id, 0):
+                quota.reserved_count = counts.get(user_id, 0)
+                changed.append(quota)
+        quotas.bulk_update(changed, ["reserved_count"], batch_size=1000)
+
+        # 샤드 간에는 외래 키가 없으므로 존재하는 사용자만 카운터를 만듭니다.
+        missing = users.filter(pk__in=counts.keys() - existing.keys()).values_list("pk", flat=True)
+        created = quotas.bulk_create(
+            ReservationQuota(user_id=user_id, reserved_count=counts[user_id]) for user_id in missing
+        )
+    return len(changed) + len(created)
+
+
+def get_default_limit() -> int | None:
+    return getattr(settings, "SEAT_MAX_PER_USER", None)
+
+
+def _increment(user_id: int, count: int) -> bool:
+    # 사용자별 상한이 있으면 그것을, 없으면 SEAT_MAX_PER_USER를 적용합니다. (None이면 무제한)
+    within_limit = Q(LessThanOrEqual(F("reserved_count") + count, F("limit")), limit__isnull=False)
+    default_limit = get_default_limit()
+    if default_limit is None:
+        within_default = Q(limit__isnull=True)
+    else:
+        within_default = Q(limit__isnull=True, reserved_count__lte=default_limit - count)
+
+    updated = (
+        ReservationQuota.objects.using(PRIMARY_DATABASE)
+        .filter(within_limit | within_default, user_id=user_id)
+        .update(reserved_count=F("reserved_count") + count)
+    )
+    return updated == 1
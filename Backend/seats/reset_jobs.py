@@ -0,0 +1,173 @@
+# seats/reset_jobs.py
+
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.db.models import F, Max, Q
+from django.utils import timezone
+
+from . import history, quotas, sharding, signals
+from .models import Seat, SeatResetJob
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 500
+
+
+def get_or_create_job(user=None) -> tuple[SeatResetJob, bool]:
+    """
+    진행 중(대기/실행)인 초기화 작업이 있으면 그 작업을, 없으면 새 작업을 반환합니다.
+    중단된 작업을 다시 요청하면 마지막으로 커밋된 지점부터 이어서 실행됩니다.
+    """
+    job = (
+        SeatResetJob.objects.filter(status__in=SeatResetJob.ACTIVE_STATUSES).order_by("pk").first()
+    )
+    if job is not None:
+        return job, False
+
+    job = SeatResetJob.objects.create(
+        chunk_size=getattr(settings, "SEAT_RESET_CHUNK_SIZE", DEFAULT_CHUNK_SIZE),
+        max_seat_number=_max_seat_number(),
+        requested_by=user,
+    )
+    return job, True
+
+
+def dispatch_job(job: SeatResetJob) -> SeatResetJob:
+    """
+    SEAT_RESET_ASYNC 설정에 따라 작업을 백그라운드 스레드에서 실행하거나,
+    현재 요청 안에서 바로 실행합니다.
+    """
+    if getattr(settings, "SEAT_RESET_ASYNC", True):
+        thread = threading.Thread(
+            target=_run_in_thread,
+            args=(job.pk,),
+            name=f"seat-reset-{job.pk}",
+            daemon=True,
+        )
+        # 작업 행이 커밋된 뒤에 스레드가 시작되어야 작업을 조회할 수 있습니다.
+        transaction.on_commit(thread.start)
+        return job
+    return run_job(job.pk)
+
+
+def run_job(job_id: int) -> SeatResetJob:
+    """
+    작업이 끝날 때까지 청크를 하나씩 처리합니다.
+    청크 사이에는 SEAT_RESET_CHUNK_PAUSE초만큼 쉬어 대기 중인 예약 요청이 먼저 처리되도록 합니다.
+    """
+    pause = getattr(settings, "SEAT_RESET_CHUNK_PAUSE", 0)
+    SeatResetJob.objects.filter(pk=job_id, status=SeatResetJob.Status.PENDING).update(
+        status=SeatResetJob.Status.RUNNING, updated_at=timezone.now()
+    )
+
+    try:
+        while not _reset_next_chunk(job_id):
+            if pause:
+                time.sleep(pause)
+    except Exception as exc:
+        logger.exception("Seat reset job %s failed", job_id)
+        SeatResetJob.objects.filter(pk=job_id).update(
+            status=SeatResetJob.Status.FAILED,
+            error=str(exc),
+            finished_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+
+    return SeatResetJob.objects.get(pk=job_id)
+
+
+def resume_incomplete_jobs() -> list[SeatResetJob]:
+    """프로세스가 비정상 종료되어 멈춘 작업들을 마지막 커밋 지점부터 재개합니다."""
+    job_ids = (
+        SeatResetJob.objects.filter(status__in=SeatResetJob.ACTIVE_STATUSES)
+        .order_by("pk")
+        .values_list("pk", flat=True)
+    )
+    return [run_job(job_id) for job_id in list(job_ids)]
+
+
+def _reset_next_chunk(job_id: int) -> bool:
+    """
+    다음 PK 범위 하나를 초기화하고, 진행 위치를 같은 트랜잭션 안에서 기록합니다.
+    작업이 더 이상 진행할 것이 없으면 True를 반환합니다.
+    """
+    with transaction.atomic():
+        # 같은 작업을 여러 워커가 재개하더라도 작업 행 잠금으로 청크 처리가 직렬화됩니다.
+        job = SeatResetJob.objects.select_for_update().get(pk=job_id)
+        if job.status != SeatResetJob.Status.RUNNING:
+            return True
+
+        if job.last_seat_number >= job.max_seat_number:
+            job.status = SeatResetJob.Status.COMPLETED
+            job.finished_at = timezone.now()
+            job.save(update_fields=["status", "finished_at", "updated_at"])
+            return True
+
+        start = job.last_seat_number
+        end = min(start + job.chunk_size, job.max_seat_number)
+        # 범위 안에서도 실제로 예약된 좌석만 갱신하여 잠그는 행의 수를 최소화합니다.
+        chunk = Seat.objects.filter(seat_number__gt=start, seat_number__lte=end).filter(
+            Q(is_reserved=True) | Q(reserved_by__isnull=False)
+        )
+        # 각 샤드의 갱신은 샤드별 트랜잭션으로 먼저 커밋됩니다. 진행 위치를 기록하기 전에
+        # 중단되면 같은 청크를 다시 처리하게 되지만, 초기화는 여러 번 실행해도 결과가 같습니다.
+        updated_count = sum(
+            _reset_shard_chunk(shard_chunk)
+            for shard_chunk in sharding.iter_shard_querysets(chunk, for_read=False)
+        )
+
+        job.last_seat_number = end
+        job.reset_count += updated_count
+        job.save(update_fields=["last_seat_number", "reset_count", "updated_at"])
+
+    return False
+
+
+def _reset_shard_chunk(chunk) -> int:
+    """
+    한 샤드의 청크를 초기화하고, 커밋 후 사용자별로 좌석 해제 시그널을 보냅니다.
+    해제한 좌석 수만큼 사용자별 예약 카운터도 같은 트랜잭션에서 줄입니다.
+    """
+    alias = chunk.db
+    with quotas.atomic(alias):
+        rows = list(chunk.select_for_update().values_list("seat_number", "reserved_by_id"))
+        if not rows:
+            return 0
+        Seat.objects.using(alias).filter(seat_number__in=[row[0] for row in rows]).update(
+            is_reserved=False, reserved_by=None, version=F("version") + 1
+        )
+
+        released: dict[int | None, list[int]] = defaultdict(list)
+        for seat_number, user_id in rows:
+            released[user_id].append(seat_number)
+        quotas.release_many(
+            {user_id: len(seat_numbers) for user_id, seat_numbers in released.items()}
+        )
+        history.record(history.RELEASED, released)
+        for user_id, seat_numbers in released.items():
+            signals.send_on_commit(
+                signals.seats_released,
+                using=alias,
+                seat_numbers=seat_numbers,
+                user_id=user_id,
+            )
+    return len(rows)
+
+
+def _max_seat_number() -> int:
+    """모든 샤드에서 가장 큰 좌석 번호"""
+    result = sharding.aggregate_shards(Seat.objects.all(), max, max_pk=Max("seat_number"))
+    return result["max_pk"] or 0
+
+
+def _run_in_thread(job_id: int) -> None:
+    try:
+        run_job(job_id)
+    finally:
+        # 스레드 전용 DB 연결을 정리합니다.
+        connections.close_all()
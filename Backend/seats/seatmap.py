@@ -0,0 +1,449 @@
+# seats/seatmap.py
+
+"""
+좌석 배치도 스냅샷 (워커별, 메모리)
+
+SeatListView의 응답(전체 좌석과 예약 상태)을 버전마다 한 번만 직렬화하고,
+gzip/brotli 본문까지 미리 만들어 둡니다. 요청은 Accept-Encoding에 맞는 본문을 그대로 받으므로
+클라이언트 수가 늘어도 좌석 테이블 조회와 직렬화/압축 비용은 늘지 않습니다.
+
+- 예약/취소/초기화 시그널(또는 Seat 저장/삭제)이 커밋되면 버전이 올라가고,
+  다음 요청 때 스냅샷을 새로 만듭니다.
+- 버전은 SEAT_MAP_CACHE 캐시의 카운터 하나를 모든 워커가 함께 올리므로, 클라이언트가 어느
+  워커에서 받은 버전이든 다른 워커에서 그대로 비교할 수 있습니다. (롱 폴링)
+- 다른 워커의 변경은 시그널로 전달되지 않으므로 SEAT_MAP_MAX_AGE초가 지나면 공유 버전을 읽어
+  다시 만들고, 시그널 없이 내용이 바뀌었으면 버전을 올립니다.
+- 스냅샷은 읽기 DB(복제본 또는 primary)별로 따로 둡니다. primary에 고정된 사용자는
+  primary에서 만든 스냅샷을 받습니다.
+- 스냅샷을 새로 만들 때 이전 스냅샷과 비교한 변경분을 SEAT_MAP_HISTORY_SIZE개까지 보관하여,
+  롱 폴링 클라이언트에게 전체 배치도 대신 변경분만 보낼 수 있게 합니다.
+
+스냅샷이 만료된 순간 많은 요청이 한꺼번에 좌석 테이블을 조회하지 않도록(thundering herd)
+다시 만드는 일은 한 요청만 합니다. (single-flight)
+- 워커 안: 읽기 DB별 잠금을 잡은 요청만 만들고, 나머지는 SEAT_MAP_REBUILD_WAIT초까지 기다렸다가
+  새 스냅샷을, 그때까지 끝나지 않으면 이전 스냅샷을 받습니다.
+  (이전 스냅샷이 없으면 끝까지 기다립니다)
+- 워커 사이: 만든 본문을 SEAT_MAP_CACHE 캐시에 올려 두어 다른 워커는 DB 조회 없이 가져다 씁니다.
+  캐시의 잠금(cache.add)을 잡은 워커만 만들고, 다른 워커는 같은 방식으로 기다리거나 이전 스냅샷을
+  씁니다.
+
+생성 잠금(cache.add)과 공유 버전(cache.incr)은 캐시 백엔드의 원자적 연산에 기대므로,
+SEAT_MAP_CACHE는 워커들이 함께 쓰면서 add/incr가 원자적인 백엔드(redis, memcached)여야 합니다.
+file/db 백엔드는 add/incr가 읽고-쓰기로 나뉘어 두 워커가 같은 잠금을 잡거나 버전 증가를
+잃을 수 있으므로 시스템 체크(seats.E001)에서 거부합니다.
+locmem은 원자적이지만 프로세스 하나에서만 공유됩니다.
+"""
+
+import asyncio
+import heapq
+import json
+import os
+import socket
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from operator import itemgetter
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.checks import Error, Tags, register
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from config.db_router import PRIMARY_DATABASE, get_read_database
+from config.precompressed import PrecompressedBody
+
+from . import sharding, signals
+from .models import Seat
+from .serializers import SeatSerializer
+
+DEFAULT_MAX_AGE = 5.0
+DEFAULT_HISTORY_SIZE = 256
+DEFAULT_REBUILD_WAIT = 0.1
+DEFAULT_LOCK_TIMEOUT = 10.0
+DEFAULT_CACHE = "default"
+CACHE_KEY_PREFIX = "seat_map"
+VERSION_KEY = f"{CACHE_KEY_PREFIX}:version"
+# 다른 워커가 만드는 스냅샷을 기다릴 때 캐시를 확인하는 간격(초)
+SHARED_POLL_INTERVAL = 0.01
+CONTENT_TYPE = "application/json"
+VERSION_HEADER = "X-Seat-Map-Version"
+# add/incr가 원자적인 캐시 백엔드
+ATOMIC_CACHE_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.redis.RedisCache",
+    "django.core.cache.backends.memcached.PyMemcacheCache",
+    "django.core.cache.backends.memcached.PyLibMCCache",
+)
+
+
+class SeatMapHistory:
+    """
+    읽기 DB 하나의 스냅샷 변경 이력.
+    start 버전 이후의 변경분을 (버전, 바뀐 좌석 목록)으로 보관합니다.
+    """
+
+    def __init__(self, version: int, max_entries: int):
+        self.start = version
+        self.max_entries = max_entries
+        self._entries: deque[tuple[int, list[dict]]] = deque()
+
+    def record(self, version: int, changes: list[dict]) -> None:
+        if len(self._entries) >= self.max_entries:
+            self.start = self._entries.popleft()[0]
+        self._entries.append((version, changes))
+
+    def restart(self, version: int) -> None:
+        self.start = version
+        self._entries.clear()
+
+    def changes_since(self, version: int) -> list[dict] | None:
+        """version 이후 바뀐 좌석의 최신 상태 목록. 이력이 없으면 None을 반환합니다."""
+        if version < self.start:
+            return None
+        merged: dict[int, dict] = {}
+        for entry_version, changes in self._entries:
+            if entry_version > version:
+                merged.update((seat["seat_number"], seat) for seat in changes)
+        return [merged[seat_number] for seat_number in sorted(merged)]
+
+
+@dataclass(frozen=True)
+class SeatMapSnapshot:
+    version: int
+    database: str
+    data: list[dict]
+    body: PrecompressedBody
+    built_at: float
+    history: SeatMapHistory
+
+
+# 이 워커가 마지막으로 확인한 공유 버전
+_version = 0
+_version_lock = threading.Lock()
+_snapshots: dict[str, SeatMapSnapshot] = {}
+# 읽기 DB별 스냅샷 생성 잠금
+_build_locks: dict[str, threading.Lock] = {}
+_build_lock = threading.Lock()
+_worker_id = f"{socket.gethostname()}:{os.getpid()}"
+# 롱 폴링으로 변경을 기다리는 (이벤트 루프, 이벤트) 목록
+_waiters: set[tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+_waiters_lock = threading.Lock()
+
+
+def current_version() -> int:
+    return _version
+
+
+def invalidate() -> int:
+    """좌석 배치도가 바뀌었음을 알리고 공유 버전을 올려 새 버전을 반환합니다."""
+    global _version
+    cache = _cache()
+    # 카운터가 없으면(캐시가 비워졌으면) 이 워커가 아는 버전부터 다시 셉니다.
+    cache.add(VERSION_KEY, _version, None)
+    try:
+        shared = cache.incr(VERSION_KEY)
+    except ValueError:
+        # add와 incr 사이에 지워졌습니다.
+        shared = 0
+    with _version_lock:
+        _version = max(_version + 1, shared)
+        version = _version
+    _notify_waiters()
+    return version
+
+
+def sync_version() -> int:
+    """공유 버전을 읽어 다른 워커에서 올린 버전을 이 워커에 반영합니다."""
+    global _version
+    shared = _cache().get(VERSION_KEY)
+    if shared is None:
+        _cache().add(VERSION_KEY, _version, None)
+        return _version
+    with _version_lock:
+        _version = max(_version, shared)
+        return _version
+
+
+def get_latest_snapshot() -> SeatMapSnapshot:
+    """
+    공유 버전을 먼저 확인한 뒤 스냅샷을 반환합니다.
+    다른 워커에서 버전이 올라갔으면 SEAT_MAP_MAX_AGE를 기다리지 않고 새로 만듭니다.
+    (요청마다 캐시를 읽으므로 롱 폴링처럼 버전을 비교하는 곳에서만 씁니다)
+    """
+    sync_version()
+    return get_snapshot()
+
+
+def get_snapshot() -> SeatMapSnapshot:
+    """현재 요청의 읽기 DB에 대한 최신 스냅샷을 반환합니다. (필요하면 새로 만듭니다)"""
+    database = get_read_database() or PRIMARY_DATABASE
+    snapshot = _snapshots.get(database)
+    if _is_fresh(snapshot):
+        return snapshot
+
+    with _build_lock:
+        lock = _build_locks.setdefault(database, threading.Lock())
+    # 이전 스냅샷이 있으면 잠시만 기다리고, 없으면 만들어질 때까지 기다립니다.
+    if not lock.acquire(timeout=_rebuild_wait() if snapshot is not None else -1):
+        return snapshot
+    try:
+        snapshot = _snapshots.get(database)
+        if not _is_fresh(snapshot):
+            snapshot = _snapshots[database] = _rebuild(database, snapshot)
+        return snapshot
+    finally:
+        lock.release()
+
+
+def _rebuild(database: str, previous: SeatMapSnapshot | None) -> SeatMapSnapshot:
+    """
+    다른 워커가 최근에 만든 스냅샷이 캐시에 있으면 그것을 쓰고, 없으면 캐시 잠금을 잡고 만듭니다.
+    다른 워커가 만드는 중이면 잠시 기다리고, 그래도 없으면 이전 스냅샷을 그대로 씁니다.
+    이전 스냅샷이 없으면 캐시 잠금이 만료될 때까지 기다린 뒤 직접 만듭니다.
+    """
+    cache = _cache()
+    key = f"{CACHE_KEY_PREFIX}:{database}"
+    lock_key = f"{key}:lock"
+    sync_version()
+
+    wait = _rebuild_wait() if previous is not None else _lock_timeout()
+    deadline = time.monotonic() + wait
+    while True:
+        shared = _usable_shared(cache.get(key))
+        if shared is not None:
+            return build_snapshot(database, previous, shared=shared)
+        if cache.add(lock_key, _worker_id, _lock_timeout()):
+            break
+        if time.monotonic() >= deadline:
+            if previous is not None:
+                return previous
+            # 잠금을 잡은 워커가 죽었거나 너무 오래 걸립니다.
+            return build_snapshot(database, previous)
+        time.sleep(SHARED_POLL_INTERVAL)
+
+    try:
+        started_at = time.time()
+        snapshot = build_snapshot(database, previous)
+        cache.set(
+            key,
+            {
+                "version": snapshot.version,
+                "started_at": started_at,
+                "body": snapshot.body,
+            },
+            max(_max_age(), 1),
+        )
+        return snapshot
+    finally:
+        # 잠금이 만료되어 다른 워커가 잡은 경우에는 지우지 않습니다.
+        if cache.get(lock_key) == _worker_id:
+            cache.delete(lock_key)
+
+
+def _usable_shared(shared: dict | None) -> dict | None:
+    """
+    공유 스냅샷이 이 워커가 아는 최신 버전에서 만들어졌고
+    SEAT_MAP_MAX_AGE 안에 만들어졌으면 그대로 반환합니다.
+    """
+    if shared is None:
+        return None
+    if shared["version"] < _version or time.time() - shared["started_at"] >= _max_age():
+        return None
+    return shared
+
+
+def build_snapshot(
+    database: str,
+    previous: SeatMapSnapshot | None = None,
+    shared: dict | None = None,
+) -> SeatMapSnapshot:
+    """좌석을 조회하여(shared가 있으면 다른 워커가 만든 본문과 버전으로) 스냅샷을 만듭니다."""
+    # 조회 전에 버전을 읽어 두어야, 조회 중에 들어온 변경이 다음 요청에서 반영됩니다.
+    version = _version
+    if shared is not None:
+        version = shared["version"]
+        body = shared["body"]
+        data = json.loads(body.body)
+    else:
+        data = load_seat_map()
+        body = PrecompressedBody.build(JSONRenderer().render(data), CONTENT_TYPE)
+    if previous is not None and previous.version == version and previous.body.digest != body.digest:
+        # 시그널 없이 내용이 바뀌었습니다. (다른 워커의 변경)
+        version = invalidate()
+
+    if previous is None:
+        history = SeatMapHistory(
+            version, getattr(settings, "SEAT_MAP_HISTORY_SIZE", DEFAULT_HISTORY_SIZE)
+        )
+    else:
+        history = previous.history
+        if version != previous.version:
+            changes = diff_seat_maps(previous.data, data)
+            if changes is None:
+                history.restart(version)
+            else:
+                history.record(version, changes)
+    return SeatMapSnapshot(
+        version=version,
+        database=database,
+        data=data,
+        body=body,
+        built_at=time.monotonic(),
+        history=history,
+    )
+
+
+def diff_seat_maps(old: list[dict], new: list[dict]) -> list[dict] | None:
+    """
+    새 배치도에서 바뀌거나 추가된 좌석 목록을 반환합니다.
+    삭제된 좌석이 있으면 변경분으로 표현할 수 없으므로 None을 반환합니다.
+    """
+    old_seats = {seat["seat_number"]: seat for seat in old}
+    if old_seats.keys() - {seat["seat_number"] for seat in new}:
+        return None
+    return [seat for seat in new if old_seats.get(seat["seat_number"]) != seat]
+
+
+def changes_since(snapshot: SeatMapSnapshot, version: int) -> dict:
+    """
+    클라이언트가 가진 version 이후의 변경분을 응답 형태로 만듭니다.
+    변경 이력이 남아 있지 않으면 전체 배치도를 보냅니다. (full=True)
+    """
+    changes = None
+    if version <= snapshot.version:
+        changes = snapshot.history.changes_since(version)
+    if changes is None:
+        return {"version": snapshot.version, "full": True, "changes": snapshot.data}
+    return {"version": snapshot.version, "full": False, "changes": changes}
+
+
+async def wait_for_change(version: int, timeout: float) -> None:
+    """이 워커의 배치도 버전이 version보다 올라가거나 timeout초가 지날 때까지 기다립니다."""
+    event = asyncio.Event()
+    waiter = (asyncio.get_running_loop(), event)
+    with _waiters_lock:
+        _waiters.add(waiter)
+    try:
+        # 등록한 뒤에 확인해야 그 사이에 올라간 버전을 놓치지 않습니다.
+        if _version > version:
+            return
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except TimeoutError:
+            pass
+    finally:
+        with _waiters_lock:
+            _waiters.discard(waiter)
+
+
+def _notify_waiters() -> None:
+    # 시그널은 요청 스레드에서 오므로 각 이벤트 루프에 깨우기를 예약합니다.
+    with _waiters_lock:
+        waiters = list(_waiters)
+    for loop, event in waiters:
+        try:
+            loop.call_soon_threadsafe(event.set)
+        except RuntimeError:
+            # 이미 닫힌 이벤트 루프입니다.
+            pass
+
+
+def load_seat_map() -> list[dict]:
+    """모든 샤드의 좌석을 SeatSerializer와 같은 형태의 dict 목록으로 조회합니다."""
+    queryset = Seat.objects.order_by("seat_number").values(*SeatSerializer.Meta.fields)
+    return list(
+        heapq.merge(*sharding.iter_shard_querysets(queryset), key=itemgetter("seat_number"))
+    )
+
+
+def reset() -> None:
+    with _build_lock:
+        _snapshots.clear()
+        _build_locks.clear()
+    _cache().delete_many([f"{CACHE_KEY_PREFIX}:{database}" for database in settings.DATABASES])
+
+
+def _cache():
+    return caches[getattr(settings, "SEAT_MAP_CACHE", DEFAULT_CACHE)]
+
+
+@register(Tags.caches)
+def check_seat_map_cache(app_configs, **kwargs):
+    """SEAT_MAP_CACHE가 생성 잠금과 공유 버전에 쓸 수 있는(add/incr가 원자적인) 백엔드인지 확인"""
+    alias = getattr(settings, "SEAT_MAP_CACHE", DEFAULT_CACHE)
+    backend = settings.CACHES.get(alias, {}).get("BACKEND")
+    if backend in ATOMIC_CACHE_BACKENDS:
+        return []
+    return [
+        Error(
+            f"SEAT_MAP_CACHE ({alias!r}) uses {backend}, whose add/incr are not atomic.",
+            hint="Use a redis or memcached cache (or locmem for a single process).",
+            id="seats.E001",
+        )
+    ]
+
+
+def _is_fresh(snapshot: SeatMapSnapshot | None) -> bool:
+    return (
+        snapshot is not None
+        # 다른 워커가 올린 공유 스냅샷은 이 워커가 아는 버전보다 높을 수 있습니다.
+        and snapshot.version >= _version
+        and time.monotonic() - snapshot.built_at < _max_age()
+    )
+
+
+def _max_age() -> float:
+    return getattr(settings, "SEAT_MAP_MAX_AGE", DEFAULT_MAX_AGE)
+
+
+def _rebuild_wait() -> float:
+    return getattr(settings, "SEAT_MAP_REBUILD_WAIT", DEFAULT_REBUILD_WAIT)
+
+
+def _lock_timeout() -> float:
+    return getattr(settings, "SEAT_MAP_REBUILD_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT)
+
+
+class SnapshotResponse(Response):
+    """
+    스냅샷의 미리 압축한 본문을 그대로 내보내는 Response.
+    렌더러를 거치지 않으며, data에는 스냅샷의 좌석 목록이 들어 있습니다.
+    """
+
+    def __init__(self, snapshot: SeatMapSnapshot, request):
+        encoding, etag, not_modified = snapshot.body.negotiate(request)
+        if not_modified:
+            super().__init__(status=304)
+            self._body = b""
+        else:
+            super().__init__(snapshot.data)
+            self._body = snapshot.body.encodings[encoding]
+        snapshot.body.apply_headers(self, encoding, etag, "no-cache")
+        self[VERSION_HEADER] = str(snapshot.version)
+
+    @property
+    def rendered_content(self):
+        if self.status_code == 304:
+            del self["Content-Type"]
+        else:
+            self["Content-Type"] = CONTENT_TYPE
+            self["Content-Length"] = str(len(self._body))
+        return self._body
+
+
+@receiver(signals.seats_reserved, dispatch_uid="seats.seatmap.seats_reserved")
+@receiver(signals.seats_released, dispatch_uid="seats.seatmap.seats_released")
+def _on_seats_changed(sender, **kwargs):
+    invalidate()
+
+
+@receiver(post_save, sender=Seat, dispatch_uid="seats.seatmap.seat_saved")
+@receiver(post_delete, sender=Seat, dispatch_uid="seats.seatmap.seat_deleted")
+def _on_seat_saved(sender, using, **kwargs):
+    # 관리자 화면 등에서 Seat를 직접 저장/삭제한 경우입니다.
+    transaction.on_commit(invalidate, using=using)
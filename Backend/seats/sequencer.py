@@ -0,0 +1,233 @@
+# seats/sequencer.py
+
+"""
+파티션별 단일 writer 예약 시퀀서 (SEAT_RESERVATION_SEQUENCER)
+
+좌석 번호를 SEAT_SEQUENCER_PARTITIONS개의 파티션으로 나누고, 파티션마다
+전용 워커 스레드 하나가 큐에 쌓인 예약 요청을 도착 순서대로 DB에 씁니다.
+같은 좌석에 대한 쓰기는 항상 같은 워커가 하므로 행 잠금 경쟁이 생기지 않고,
+이미 팔린 좌석에 대한 중복 요청은 메모리 상태만 보고 DB에 가지 않고 거절합니다.
+
+요청 스레드는 큐에 넣고 결과만 기다리며 DB 쓰기는 파티션 워커가 맡습니다.
+동기 뷰는 ASGI에서는 요청마다 따로인 ThreadSensitiveContext의 스레드에서,
+WSGI 스레드 워커에서는 요청 스레드에서 동시에 실행되므로, 같은 좌석에 대한 쓰기를
+파티션 워커 하나로 모아 순서대로 처리합니다.
+
+결과를 RESULT_TIMEOUT초 안에 받지 못하면 아직 워커가 꺼내지 않은 요청만 취소하고 실패로 응답합니다.
+이미 처리 중인 요청은 DB에 반영될 수 있으므로 실제 결과가 나올 때까지 기다립니다.
+
+메모리의 "팔린 좌석" 정보는 seats_reserved/seats_released 시그널로 갱신되고,
+다른 프로세스에서 취소된 좌석을 놓치지 않도록 SEAT_SEQUENCER_TAKEN_TTL초가 지나면
+다시 DB에서 확인합니다.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import F
+from django.dispatch import receiver
+
+from . import history, metrics, quotas, signals
+from .batching import (
+    ALREADY_RESERVED,
+    ERROR,
+    NOT_FOUND,
+    QUOTA_EXCEEDED,
+    RESERVED,
+)
+from .models import Seat
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARTITIONS = 16
+DEFAULT_TAKEN_TTL = 5.0
+# 요청 스레드가 파티션 워커의 처리 결과를 기다리는 최대 시간(초)
+RESULT_TIMEOUT = 10.0
+
+_STOP = object()
+
+
+class Partition:
+    """예약 요청 큐 하나와 그 큐를 처리하는 워커 스레드 하나"""
+
+    def __init__(self, key: int, taken_ttl: float = DEFAULT_TAKEN_TTL):
+        self.key = key
+        self.taken_ttl = taken_ttl
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        # seat_number -> 팔린 것을 확인한 시각(monotonic)
+        self._taken: dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def submit(self, shard: str, seat_number: int, user) -> str:
+        """예약 요청을 큐에 넣고 워커가 처리한 결과를 반환합니다."""
+        if self.is_taken(seat_number):
+            metrics.increment("sequencer.rejected_in_memory")
+            return ALREADY_RESERVED
+
+        future: Future = Future()
+        self._ensure_worker()
+        self._queue.put((shard, seat_number, user, future))
+        try:
+            return future.result(timeout=RESULT_TIMEOUT)
+        except FutureTimeoutError:
+            # 워커가 아직 꺼내지 않았으면 취소되어 DB에 쓰지 않습니다.
+            if future.cancel():
+                return ERROR
+        # 이미 처리 중이므로 예약이 커밋될 수 있습니다. 실패로 응답하지 않고 결과를 기다립니다.
+        return future.result()
+
+    def is_taken(self, seat_number: int) -> bool:
+        with self._lock:
+            taken_at = self._taken.get(seat_number)
+            if taken_at is None:
+                return False
+            if time.monotonic() - taken_at > self.taken_ttl:
+                del self._taken[seat_number]
+                return False
+            return True
+
+    def mark_taken(self, seat_number: int) -> None:
+        with self._lock:
+            self._taken[seat_number] = time.monotonic()
+
+    def forget(self, seat_number: int) -> None:
+        with self._lock:
+            self._taken.pop(seat_number, None)
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+
+    def _ensure_worker(self) -> None:
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._run, name=f"seat-sequencer-{self.key}", daemon=True
+                    )
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                break
+            shard, seat_number, user, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            future.set_result(self._process(shard, seat_number, user))
+            # 큐가 비었을 때만 오래된 DB 연결을 정리합니다. (요청 사이클 밖의 스레드이므로)
+            if self._queue.empty():
+                close_old_connections()
+        close_old_connections()
+
+    def _process(self, shard: str, seat_number: int, user) -> str:
+        # 큐에서 기다리는 동안 앞선 요청이 좌석을 가져갔다면 DB에 가지 않습니다.
+        if self.is_taken(seat_number):
+            metrics.increment("sequencer.rejected_in_memory")
+            return ALREADY_RESERVED
+        try:
+            result = write_reservation(shard, seat_number, user)
+        except Exception:
+            logger.exception("Sequenced reservation of seat %s failed", seat_number)
+            return ERROR
+        if result in (RESERVED, ALREADY_RESERVED):
+            self.mark_taken(seat_number)
+        return result
+
+
+class ReservationSequencer:
+    def __init__(
+        self,
+        partitions: int = DEFAULT_PARTITIONS,
+        taken_ttl: float = DEFAULT_TAKEN_TTL,
+    ):
+        self.partitions = [Partition(key, taken_ttl) for key in range(partitions)]
+
+    def partition_for(self, seat_number: int) -> Partition:
+        return self.partitions[seat_number % len(self.partitions)]
+
+    def submit(self, shard: str, seat_number: int, user) -> str:
+        return self.partition_for(seat_number).submit(shard, seat_number, user)
+
+    def mark_taken(self, seat_numbers) -> None:
+        for seat_number in seat_numbers:
+            self.partition_for(seat_number).mark_taken(seat_number)
+
+    def forget(self, seat_numbers) -> None:
+        for seat_number in seat_numbers:
+            self.partition_for(seat_number).forget(seat_number)
+
+    def stop(self) -> None:
+        for partition in self.partitions:
+            partition.stop()
+
+
+def write_reservation(shard: str, seat_number: int, user) -> str:
+    """좌석 하나를 조건부 UPDATE로 예약합니다. 파티션 워커 스레드에서 실행됩니다."""
+    seats = Seat.objects.using(shard)
+    try:
+        with quotas.atomic(shard):
+            updated = seats.filter(seat_number=seat_number, is_reserved=False).update(
+                is_reserved=True, reserved_by=user, version=F("version") + 1
+            )
+            if updated:
+                quotas.acquire(user.pk)
+                history.record(history.RESERVED, {user.pk: [seat_number]})
+                signals.send_on_commit(
+                    signals.seats_reserved,
+                    using=shard,
+                    seat_numbers=[seat_number],
+                    user_id=user.pk,
+                )
+                return RESERVED
+    except quotas.QuotaExceeded:
+        return QUOTA_EXCEEDED
+    if seats.filter(seat_number=seat_number).exists():
+        return ALREADY_RESERVED
+    return NOT_FOUND
+
+
+_sequencer: ReservationSequencer | None = None
+_sequencer_lock = threading.Lock()
+
+
+def get_sequencer() -> ReservationSequencer:
+    global _sequencer
+    if _sequencer is None:
+        with _sequencer_lock:
+            if _sequencer is None:
+                _sequencer = ReservationSequencer(
+                    partitions=getattr(settings, "SEAT_SEQUENCER_PARTITIONS", DEFAULT_PARTITIONS),
+                    taken_ttl=getattr(settings, "SEAT_SEQUENCER_TAKEN_TTL", DEFAULT_TAKEN_TTL),
+                )
+    return _sequencer
+
+
+def is_enabled() -> bool:
+    return getattr(settings, "SEAT_RESERVATION_SEQUENCER", False)
+
+
+def reserve(shard: str, seat_number: int, user) -> str:
+    return get_sequencer().submit(shard, seat_number, user)
+
+
+@receiver(signals.seats_reserved, dispatch_uid="seats.sequencer.seats_reserved")
+def _on_seats_reserved(sender, seat_numbers, **kwargs):
+    if _sequencer is not None:
+        _sequencer.mark_taken(seat_numbers)
+
+
+@receiver(signals.seats_released, dispatch_uid="seats.sequencer.seats_released")
+def _on_seats_released(sender, seat_numbers, **kwargs):
+    if _sequencer is not None:
+        _sequencer.forget(seat_numbers)
@@ -1,8 +1,10 @@
 # reservations/serializers.py
 
+from django.conf import settings
 from rest_framework import serializers
 
-from .models import Seat
+from .faults import INJECTION_POINTS
+from .models import ReservationEvent, Seat, SeatResetJob
 
 
 class SeatSerializer(serializers.ModelSerializer):
@@ -11,8 +13,95 @@ class SeatSerializer(serializers.ModelSerializer):
         fields = ["seat_number", "is_reserved"]
 
 
+class ReservationEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ReservationEvent
+        fields = ["seat_number", "action", "created_at"]
+
+
 class ReservationSerializer(serializers.Serializer):
     seat_number = serializers.IntegerField(required=True, help_text="예약할 좌석 번호")
     # 추후 예약자 이름, 연락처 등 필드 추가 가능
     # name = serializers.CharField(max_length=100)
     # phone_number = serializers.CharField(max_length=20)
+
+
+class BestAvailableSerializer(serializers.Serializer):
+    count = serializers.IntegerField(
+        min_value=1, help_text="함께 예약할 연속 좌석 수 (한 행의 좌석 수 이하)"
+    )
+
+    def validate_count(self, value):
+        row_length = getattr(settings, "SEAT_ROW_LENGTH", 3)
+        if value > row_length:
+            raise serializers.ValidationError(
+                f"한 번에 최대 {row_length}개의 연속 좌석까지 예약할 수 있습니다."
+            )
+        return value
+
+
+class SeatResetJobSerializer(serializers.ModelSerializer):
+    progress = serializers.FloatField(
+        read_only=True, help_text="처리된 좌석 범위의 비율 (0.0 ~ 1.0)"
+    )
+
+    class Meta:
+        model = SeatResetJob
+        fields = [
+            "id",
+            "status",
+            "chunk_size",
+            "max_seat_number",
+            "last_seat_number",
+            "reset_count",
+            "progress",
+            "error",
+            "created_at",
+            "updated_at",
+            "finished_at",
+        ]
+        read_only_fields = fields
+
+
+class FaultRuleSerializer(serializers.Serializer):
+    failure_rate = serializers.FloatField(
+        min_value=0.0,
+        max_value=1.0,
+        default=0.0,
+        help_text="요청을 500으로 실패시킬 확률",
+    )
+    latency_ms = serializers.FloatField(
+        min_value=0.0, default=0.0, help_text="주입할 지연 시간(ms)"
+    )
+    latency_rate = serializers.FloatField(
+        min_value=0.0, max_value=1.0, default=1.0, help_text="지연을 주입할 확률"
+    )
+    windows = serializers.ListField(
+        child=serializers.ListField(
+            child=serializers.FloatField(min_value=0.0), min_length=2, max_length=2
+        ),
+        default=list,
+        help_text="장애 구간 [[시작, 끝], ...] (설정 시점부터 흐른 초). 비우면 항상 주입",
+    )
+
+    def validate_windows(self, value):
+        for start, end in value:
+            if start >= end:
+                raise serializers.ValidationError("구간의 시작은 끝보다 작아야 합니다.")
+        return value
+
+
+class FaultConfigSerializer(serializers.Serializer):
+    enabled = serializers.BooleanField(help_text="장애 주입 사용 여부")
+    seed = serializers.IntegerField(
+        required=False, allow_null=True, default=None, help_text="난수 시드 (재현용)"
+    )
+    rules = serializers.DictField(
+        child=FaultRuleSerializer(), default=dict, help_text="주입 지점별 규칙"
+    )
+
+    def validate_rules(self, value):
+        unknown = sorted(set(value) - set(INJECTION_POINTS))
+        if unknown:
+            raise serializers.ValidationError(f"알 수 없는 주입 지점입니다: {', '.join(unknown)}")
+        return value
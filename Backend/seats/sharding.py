@@ -0,0 +1,150 @@
+# seats/sharding.py
+
+"""
+좌석 데이터 수평 샤딩
+
+SEAT_SHARDS 설정에 좌석 번호 범위별로 좌석을 저장할 DB를 지정합니다.
+예약/취소는 좌석을 소유한 샤드로 보내고, 목록 조회와 초기화/집계는 모든 샤드에 나누어 실행합니다.
+좌석 이외의 데이터(사용자, 초기화 작업 등)는 항상 primary(default)에 있습니다.
+"""
+
+import heapq
+from collections.abc import Iterator
+from dataclasses import dataclass
+from operator import attrgetter
+
+from django.conf import settings
+from django.db.models import QuerySet
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from config.db_router import PRIMARY_DATABASE, get_read_database
+
+DEFAULT_SEAT_SHARDS = [{"database": PRIMARY_DATABASE, "first_seat": 1, "last_seat": None}]
+
+
+@dataclass(frozen=True)
+class SeatShard:
+    database: str
+    first_seat: int
+    last_seat: int | None = None
+
+    def owns(self, seat_number: int) -> bool:
+        if seat_number < self.first_seat:
+            return False
+        return self.last_seat is None or seat_number <= self.last_seat
+
+
+def get_shards() -> list[SeatShard]:
+    """좌석 번호 순으로 정렬된 샤드 목록"""
+    shards = [SeatShard(**shard) for shard in getattr(settings, "SEAT_SHARDS", DEFAULT_SEAT_SHARDS)]
+    return sorted(shards, key=attrgetter("first_seat"))
+
+
+def get_shard_databases() -> list[str]:
+    """좌석을 저장하는 DB 별칭 목록 (중복 없이, 좌석 번호 순)"""
+    return list(dict.fromkeys(shard.database for shard in get_shards()))
+
+
+def is_shard_database(alias: str | None) -> bool:
+    return alias in get_shard_databases()
+
+
+def shard_for_seat(seat_number: int) -> str:
+    """좌석 번호를 소유한 샤드의 DB 별칭. 어느 범위에도 속하지 않으면 첫 번째 샤드를 사용합니다."""
+    shards = get_shards()
+    for shard in shards:
+        if shard.owns(seat_number):
+            return shard.database
+    return shards[0].database
+
+
+def read_database(alias: str) -> str:
+    """
+    샤드에서 읽을 때 사용할 DB 별칭.
+    primary 샤드는 현재 요청에서 선택된 복제본이 있으면 복제본에서 읽습니다.
+    """
+    if alias == PRIMARY_DATABASE:
+        return get_read_database() or alias
+    return alias
+
+
+def iter_shard_querysets(queryset: QuerySet, *, for_read: bool = True) -> Iterator[QuerySet]:
+    """같은 쿼리를 각 샤드에 대해 실행할 수 있도록 샤드별 QuerySet을 만듭니다."""
+    for alias in get_shard_databases():
+        yield queryset.using(read_database(alias) if for_read else alias)
+
+
+def merge_by_seat_number(queryset: QuerySet) -> list:
+    """
+    seat_number 순으로 정렬된 QuerySet을 모든 샤드에서 조회하여 하나의 정렬된 목록으로 합칩니다.
+    """
+    ordered = queryset.order_by("seat_number")
+    return list(heapq.merge(*iter_shard_querysets(ordered), key=attrgetter("seat_number")))
+
+
+def aggregate_shards(queryset: QuerySet, combine, **aggregates) -> dict:
+    """
+    각 샤드의 aggregate() 결과를 combine 함수(sum, max 등)로 합칩니다.
+    값이 없는 샤드(None)는 제외합니다.
+    """
+    results = [qs.aggregate(**aggregates) for qs in iter_shard_querysets(queryset, for_read=False)]
+    combined = {}
+    for key in aggregates:
+        values = [result[key] for result in results if result[key] is not None]
+        combined[key] = combine(values) if values else None
+    return combined
+
+
+class SeatShardRouter:
+    """
+    좌석 인스턴스를 소유 샤드로 보내는 라우터. PrimaryReplicaRouter보다 먼저 등록해야 합니다.
+    QuerySet 단위의 조회/갱신은 iter_shard_querysets() 등으로 샤드를 명시합니다.
+    """
+
+    def db_for_read(self, model, **hints):
+        instance = hints.get("instance")
+        if _is_seat(model) and isinstance(instance, model) and instance._state.db:
+            return instance._state.db
+        return None
+
+    def db_for_write(self, model, **hints):
+        # 복제본에서 읽은 좌석이라도 항상 소유 샤드에 씁니다.
+        instance = hints.get("instance")
+        if _is_seat(model) and isinstance(instance, model) and instance.seat_number is not None:
+            return shard_for_seat(instance.seat_number)
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 샤드에 있는 좌석과 primary에 있는 사용자 사이의 관계(reserved_by)를 허용합니다.
+        databases = {obj1._state.db, obj2._state.db}
+        if databases <= {PRIMARY_DATABASE, *get_shard_databases()}:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # primary가 아닌 샤드에는 좌석 테이블만 생성합니다.
+        if db == PRIMARY_DATABASE or not is_shard_database(db):
+            return None
+        return app_label == "seats" and model_name in (None, "seat")
+
+
+def _is_seat(model) -> bool:
+    return model._meta.label == "seats.Seat"
+
+
+@receiver(
+    pre_delete,
+    sender=settings.AUTH_USER_MODEL,
+    dispatch_uid="seats.sharding.release_seats_on_other_shards",
+)
+def release_seats_on_other_shards(sender, instance, **kwargs):
+    """
+    샤드 간에는 외래 키 제약이 없으므로, 사용자가 삭제될 때 primary 이외의 샤드에 있는
+    좌석의 reserved_by를 직접 비웁니다. (on_delete=SET_NULL과 같은 동작)
+    """
+    from .models import Seat
+
+    for alias in get_shard_databases():
+        if alias != PRIMARY_DATABASE:
+            Seat.objects.using(alias).filter(reserved_by_id=instance.pk).update(reserved_by=None)
@@ -0,0 +1,39 @@
+# seats/signals.py
+
+"""
+좌석 상태 변경 시그널
+
+예약/취소/초기화가 커밋된 뒤에 발송되며, 메모리 인덱스나 캐시처럼
+DB와 동기화해야 하는 구성 요소가 이 시그널을 구독합니다.
+
+- seats_reserved: seat_numbers(list[int]), user_id(예약한 사용자 ID)
+- seats_released: seat_numbers(list[int]), user_id(예약했던 사용자 ID, 없으면 None)
+"""
+
+import logging
+
+from django.db import transaction
+from django.dispatch import Signal
+
+logger = logging.getLogger(__name__)
+
+seats_reserved = Signal()
+seats_released = Signal()
+
+
+def send_on_commit(signal: Signal, *, using: str, **kwargs) -> None:
+    """
+    using DB의 트랜잭션이 커밋된 뒤 시그널을 발송합니다. (트랜잭션 밖이면 즉시 발송)
+    좌석 변경은 이미 커밋되었으므로, 수신자의 오류는 기록만 하고 호출한 쪽으로 전파하지 않습니다.
+    """
+    transaction.on_commit(lambda: _send(signal, kwargs), using=using)
+
+
+def _send(signal: Signal, kwargs: dict) -> None:
+    for receiver, result in signal.send_robust(sender=None, **kwargs):
+        if isinstance(result, Exception):
+            logger.error(
+                "Seat signal receiver %s failed",
+                getattr(receiver, "__qualname__", receiver),
+                exc_info=result,
+            )
@@ -1,10 +1,63 @@
 # seats/tests.py
 
+import asyncio
+import gzip
+import http.server
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from importlib import import_module
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+import brotli
+from asgiref.sync import sync_to_async
+from django.apps import apps
+from django.conf import settings
 from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.core.cache.backends.filebased import FileBasedCache
+from django.core.management import call_command
+from django.db import connection
+from django.db.models import F
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
 from rest_framework.test import APITestCase
 
-from .models import Seat
+from config import (
+    capture,
+    db_router,
+    load_shedding,
+    replay,
+    schema,
+    sqlite,
+    sqlite_benchmark,
+)
+
+from . import (
+    allocation,
+    batching,
+    concurrency,
+    export,
+    faults,
+    layout,
+    metrics,
+    quotas,
+    reset_jobs,
+    seatmap,
+    sequencer,
+    signals,
+    timeseries,
+)
+from .admin import EstimatedCountPaginator
+from .models import ReservationQuota, Seat, SeatResetJob
 
 
 class SeatAPITests(APITestCase):
@@ -17,12 +70,8 @@ class SeatAPITests(APITestCase):
     @classmethod
     def setUpTestData(cls):
         cls.user = User.objects.create_user(username="testuser", password="password123")
-        cls.other_user = User.objects.create_user(
-            username="otheruser", password="password123"
-        )
-        cls.admin_user = User.objects.create_superuser(
-            username="admin", password="password123"
-        )
+        cls.other_user = User.objects.create_user(username="otheruser", password="password123")
+        cls.admin_user = User.objects.create_superuser(username="admin", password="password123")
 
         # seat_number를 마이그레이션과 겹치지 않는 '숫자'로 생성합니다.
         cls.seat1 = Seat.objects.create(seat_number=10)
@@ -97,9 +146,7 @@ class SeatAPITests(APITestCase):
         test_seat = Seat.objects.create(seat_number=888)
 
         # 테스트 유저 생성 및 로그인
-        test_user = User.objects.create_user(
-            username="single_test_user", password="password123"
-        )
+        test_user = User.objects.create_user(username="single_test_user", password="password123")
 
         login_response = self.client.post(
             "/api/users/login/",
@@ -156,15 +203,15 @@ class SeatAPITests(APITestCase):
         self.seat1.refresh_from_db()
         self.assertFalse(self.seat1.is_reserved)
 
+    # 시드를 고정해 실패 횟수가 매번 같도록 합니다.
+    @override_settings(SEAT_FAULT_SEED=2)
     def test_random_failure_500_error(self):
         """1% 확률로 실패하는 로직이 500 에러를 반환하는지 테스트"""
         # 테스트용 좌석 생성
         test_seat = Seat.objects.create(seat_number=999)
 
         # 테스트 유저 생성 및 로그인
-        test_user = User.objects.create_user(
-            username="failure_test_user", password="password123"
-        )
+        test_user = User.objects.create_user(username="failure_test_user", password="password123")
 
         login_response = self.client.post(
             "/api/users/login/",
@@ -195,12 +242,8 @@ class SeatAPITests(APITestCase):
                 failure_count += 1
                 # 실패한 경우 좌석 상태 확인
                 test_seat.refresh_from_db()
-                self.assertFalse(
-                    test_seat.is_reserved, "실패 시 좌석이 예약되지 않아야 합니다"
-                )
-                self.assertIsNone(
-                    test_seat.reserved_by, "실패 시 예약자가 없어야 합니다"
-                )
+                self.assertFalse(test_seat.is_reserved, "실패 시 좌석이 예약되지 않아야 합니다")
+                self.assertIsNone(test_seat.reserved_by, "실패 시 예약자가 없어야 합니다")
             else:
                 self.fail(f"예상치 못한 응답 코드: {response.status_code}")
 
@@ -214,7 +257,7 @@ class SeatAPITests(APITestCase):
         print(f"총 시도: {max_attempts}회")
         print(f"성공: {success_count}회")
         print(f"실패: {failure_count}회")
-        print(f"실패율: {failure_rate*100:.2f}%")
+        print(f"실패율: {failure_rate * 100:.2f}%")
 
         # 실패율이 0.5% ~ 2% 범위 내에 있는지 확인 (통계적 허용 오차)
         self.assertGreaterEqual(failure_rate, 0.005, "실패율이 너무 낮습니다")
@@ -232,9 +275,7 @@ class SeatIntegrationTests(APITestCase):
 
     @classmethod
     def setUpTestData(cls):
-        cls.user = User.objects.create_user(
-            username="integration_user", password="password123"
-        )
+        cls.user = User.objects.create_user(username="integration_user", password="password123")
         cls.other_user = User.objects.create_user(
             username="integration_other", password="password123"
         )
@@ -321,18 +362,14 @@ class SeatIntegrationTests(APITestCase):
         # 6. 내 예약 목록 조회
         my_reservations_response = self.client.get("/api/users/me/reservations/")
         self.assertEqual(my_reservations_response.status_code, status.HTTP_200_OK)
-        self.assertEqual(
-            len(my_reservations_response.data), 1, "예약 목록에 1개가 있어야 합니다"
-        )
+        self.assertEqual(len(my_reservations_response.data), 1, "예약 목록에 1개가 있어야 합니다")
 
         reservation = my_reservations_response.data[0]
         self.assertEqual(reservation["seat_number"], available_seat["seat_number"])
         print(f"✅ 내 예약 목록에서 좌석 {reservation['seat_number']}번 확인")
 
         # 7. 예약 취소
-        cancel_response = self.client.delete(
-            f"/api/seats/{available_seat['seat_number']}/cancel/"
-        )
+        cancel_response = self.client.delete(f"/api/seats/{available_seat['seat_number']}/cancel/")
         self.assertEqual(cancel_response.status_code, status.HTTP_200_OK)
         print(f"✅ 좌석 {available_seat['seat_number']}번 예약 취소 성공")
 
@@ -347,9 +384,7 @@ class SeatIntegrationTests(APITestCase):
                 break
 
         self.assertIsNotNone(cancelled_seat, "취소된 좌석을 찾을 수 있어야 합니다")
-        self.assertFalse(
-            cancelled_seat["is_reserved"], "좌석이 예약되지 않은 상태여야 합니다"
-        )
+        self.assertFalse(cancelled_seat["is_reserved"], "좌석이 예약되지 않은 상태여야 합니다")
         print(f"✅ 좌석 {cancelled_seat['seat_number']}번이 취소된 상태로 확인됨")
 
         print("🎉 완전한 좌석 예약 워크플로우 테스트 통과!")
@@ -430,9 +465,7 @@ class SeatIntegrationTests(APITestCase):
                 other_available_seat = seat_data
                 break
 
-        self.assertIsNotNone(
-            other_available_seat, "다른 예약 가능한 좌석이 있어야 합니다"
-        )
+        self.assertIsNotNone(other_available_seat, "다른 예약 가능한 좌석이 있어야 합니다")
 
         other_reserve_response = self.client.post(
             "/api/seats/reserve/",
@@ -551,3 +584,2152 @@ class SeatIntegrationTests(APITestCase):
         print("✅ 모든 좌석이 초기화된 상태로 확인됨")
 
         print("🎉 관리자 좌석 초기화 기능 테스트 통과!")
+
+
+class SeatResetJobTests(APITestCase):
+    """청크 단위 좌석 초기화 작업 테스트"""
+
+    user: User
+    admin_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="reset_user", password="password123")
+        cls.admin_user = User.objects.create_superuser(
+            username="reset_admin", password="password123"
+        )
+        # 마이그레이션으로 생성된 1~9번 좌석 중 일부를 예약 상태로 만듭니다.
+        Seat.objects.filter(seat_number__in=[1, 4, 5, 9]).update(
+            is_reserved=True, reserved_by=cls.user
+        )
+
+    def test_reset_runs_in_bounded_chunks(self):
+        """좌석 번호 범위를 청크 크기만큼 나누어 모두 초기화하는지 테스트"""
+        # Arrange
+        job = SeatResetJob.objects.create(chunk_size=2, max_seat_number=9)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            job = reset_jobs.run_job(job.pk)
+
+        # Assert
+        self.assertEqual(job.status, SeatResetJob.Status.COMPLETED)
+        self.assertEqual(job.reset_count, 4)
+        self.assertEqual(job.progress, 1.0)
+        self.assertFalse(Seat.objects.filter(is_reserved=True).exists())
+        # 9개 좌석을 2개씩 5개 청크로 처리하며, 예약된 좌석이 없는 청크(7~8번)는 갱신하지 않습니다.
+        seat_updates = [
+            q for q in ctx.captured_queries if q["sql"].startswith('UPDATE "seats_seat"')
+        ]
+        self.assertEqual(len(seat_updates), 4)
+
+    def test_resume_from_last_committed_chunk(self):
+        """중단된 작업이 마지막 커밋 지점 이후의 좌석만 초기화하는지 테스트"""
+        # Arrange: 4번 좌석까지 처리한 뒤 프로세스가 종료된 상황을 흉내 냅니다.
+        job = SeatResetJob.objects.create(
+            chunk_size=3,
+            max_seat_number=9,
+            last_seat_number=4,
+            status=SeatResetJob.Status.RUNNING,
+        )
+
+        # Act
+        call_command("resume_seat_resets", stdout=StringIO())
+
+        # Assert: 커밋 지점 이전의 좌석(1, 4번)은 건드리지 않습니다.
+        job.refresh_from_db()
+        self.assertEqual(job.status, SeatResetJob.Status.COMPLETED)
+        self.assertEqual(job.reset_count, 2)
+        reserved = Seat.objects.filter(is_reserved=True).values_list("seat_number", flat=True)
+        self.assertEqual(sorted(reserved), [1, 4])
+
+    def test_reset_job_status_endpoint(self):
+        """초기화 요청 후 작업 상태 조회 API 테스트 (관리자만 성공)"""
+        # Arrange
+        self.client.force_authenticate(user=self.admin_user)
+
+        # Act
+        response = self.client.post("/api/seats/reset/")
+        job_id = response.data["job"]["id"]
+        status_response = self.client.get(f"/api/seats/reset/jobs/{job_id}/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(status_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(status_response.data["status"], "completed")
+        self.assertEqual(status_response.data["reset_count"], 4)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get(f"/api/seats/reset/jobs/{job_id}/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @override_settings(SEAT_RESET_ASYNC=True)
+    def test_async_reset_returns_accepted(self):
+        """백그라운드 모드에서 202와 함께 작업 정보를 반환하는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.admin_user)
+
+        # Act: 스레드 시작은 막고, 커밋 시점에 등록되는 콜백만 확인합니다.
+        with mock.patch("seats.reset_jobs.threading.Thread") as thread_cls:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post("/api/seats/reset/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["job"]["status"], "pending")
+        thread_cls.return_value.start.assert_called_once()
+
+
+@override_settings(DATABASE_REPLICAS=["replica"])
+class ReplicaRoutingTests(APITestCase):
+    """primary/replica 읽기 라우팅 및 read-your-writes 테스트"""
+
+    databases = {"default", "replica"}
+
+    user: User
+    seat: Seat
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="replica_user", password="password123")
+        # primary에만 존재하는 좌석. 복제본에는 아직 반영되지 않은 상태를 흉내 냅니다.
+        cls.seat = Seat.objects.create(seat_number=20)
+
+    def setUp(self):
+        caches["replica_pins"].clear()
+        db_router.reset_lag_cache()
+
+    def test_seat_list_reads_from_replica(self):
+        """좌석 목록 조회가 복제본으로 라우팅되는지 테스트"""
+        response = self.client.get("/api/seats/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seat_numbers = [seat["seat_number"] for seat in response.data]
+        self.assertNotIn(self.seat.seat_number, seat_numbers)
+
+    def test_user_pinned_to_primary_after_reservation(self):
+        """예약 직후에는 내 예약 목록을 primary에서 조회하는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+
+        # Act
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            response = self.client.post(
+                "/api/seats/reserve/",
+                {"seat_number": self.seat.seat_number},
+                format="json",
+            )
+        my_reservations = self.client.get("/api/users/me/reservations/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [seat["seat_number"] for seat in my_reservations.data],
+            [self.seat.seat_number],
+        )
+
+        # 고정 시간이 지나면 다시 복제본에서 조회합니다.
+        caches["replica_pins"].clear()
+        my_reservations = self.client.get("/api/users/me/reservations/")
+        self.assertEqual(my_reservations.data, [])
+
+    def test_pin_is_visible_to_other_workers(self):
+        """primary 고정을 워커들이 함께 쓰는 캐시에 기록하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            shared = {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}
+            with override_settings(
+                CACHES={**settings.CACHES, "replica_pins": {**shared, "LOCATION": tmp}}
+            ):
+                # Act: 한 워커에서 고정합니다.
+                db_router.pin_to_primary(self.user)
+                # 다른 워커의 캐시 객체처럼 같은 위치를 새로 엽니다.
+                other_worker = FileBasedCache(tmp, {})
+
+                # Assert
+                self.assertTrue(other_worker.get(db_router._pin_key(self.user)))
+                self.assertEqual(db_router.choose_read_database(self.user), "default")
+
+    @override_settings(REPLICA_MAX_LAG_SECONDS=2.0)
+    def test_lagging_replica_falls_back_to_primary(self):
+        """허용 지연을 넘은 복제본은 선택되지 않는지 테스트"""
+        with mock.patch.object(db_router, "measure_replica_lag", return_value=30.0) as probe:
+            self.assertEqual(db_router.choose_read_database(self.user), "default")
+            self.assertEqual(db_router.choose_read_database(self.user), "default")
+
+        # 측정 결과는 REPLICA_LAG_CHECK_INTERVAL 동안 재사용됩니다.
+        probe.assert_called_once_with("replica")
+
+        db_router.reset_lag_cache()
+        with mock.patch.object(db_router, "measure_replica_lag", return_value=0.5):
+            self.assertEqual(db_router.choose_read_database(self.user), "replica")
+
+
+@override_settings(
+    SEAT_SHARDS=[
+        {"database": "shard_1", "first_seat": 1, "last_seat": 100},
+        {"database": "shard_2", "first_seat": 101, "last_seat": None},
+    ]
+)
+class SeatShardingTests(APITestCase):
+    """좌석 번호 범위 기반 샤딩 테스트"""
+
+    databases = {"default", "shard_1", "shard_2"}
+
+    user: User
+    admin_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="shard_user", password="password123")
+        cls.admin_user = User.objects.create_superuser(
+            username="shard_admin", password="password123"
+        )
+        # 테스트 DB는 샤딩 없이 마이그레이션되므로, 각 샤드의 좌석을 직접 만듭니다.
+        for seat_number in [*range(1, 10), 150]:
+            Seat.objects.create(seat_number=seat_number)
+
+    def test_seat_is_stored_on_owning_shard(self):
+        """좌석이 번호 범위에 맞는 샤드에 저장되는지 테스트"""
+        self.assertTrue(Seat.objects.using("shard_2").filter(seat_number=150).exists())
+        self.assertFalse(Seat.objects.using("shard_1").filter(seat_number=150).exists())
+
+    def test_initial_seats_are_created_only_on_owning_shard(self):
+        """초기 좌석 마이그레이션이 해당 DB가 소유한 좌석 번호만 생성하는지 테스트"""
+        # Arrange: 1~9번 좌석은 shard_1 소유이므로 shard_2에는 만들지 않아야 합니다.
+        migration = import_module("seats.migrations.0002_auto_20250816_0647")
+        schema_editor = mock.Mock(connection=mock.Mock(alias="shard_2"))
+
+        # Act
+        migration.create_initial_seats(apps, schema_editor)
+
+        # Assert
+        seat_numbers = Seat.objects.using("shard_2").values_list("seat_number", flat=True)
+        self.assertEqual(list(seat_numbers), [150])
+
+    def test_recompute_quotas_counts_all_shards(self):
+        """예약 카운터를 다시 계산할 때 모든 샤드의 예약을 세는지 테스트"""
+        # Arrange: 0007 마이그레이션처럼 primary의 예약만 센 카운터
+        Seat.objects.using("shard_1").filter(seat_number=3).update(
+            is_reserved=True, reserved_by=self.user
+        )
+        Seat.objects.using("shard_2").filter(seat_number=150).update(
+            is_reserved=True, reserved_by=self.user
+        )
+        ReservationQuota.objects.create(user=self.admin_user, reserved_count=4)
+
+        # Act
+        output = StringIO()
+        call_command("recompute_reservation_quotas", stdout=output)
+
+        # Assert
+        counts = dict(ReservationQuota.objects.values_list("user_id", "reserved_count"))
+        self.assertEqual(counts, {self.user.pk: 2, self.admin_user.pk: 0})
+        self.assertIn("2개", output.getvalue())
+
+    def test_seat_list_fans_out_across_shards(self):
+        """좌석 목록이 모든 샤드의 좌석을 번호 순으로 합쳐서 반환하는지 테스트"""
+        response = self.client.get("/api/seats/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seat_numbers = [seat["seat_number"] for seat in response.data]
+        self.assertEqual(seat_numbers, [*range(1, 10), 150])
+
+    def test_reserve_and_cancel_on_owning_shard(self):
+        """예약/내 예약 조회/취소가 소유 샤드에서 처리되는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+
+        # Act & Assert: 예약
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            response = self.client.post("/api/seats/reserve/", {"seat_number": 150}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seat = Seat.objects.using("shard_2").get(seat_number=150)
+        self.assertTrue(seat.is_reserved)
+        self.assertEqual(seat.reserved_by_id, self.user.pk)
+
+        # 내 예약 조회
+        response = self.client.get("/api/users/me/reservations/")
+        self.assertEqual([seat["seat_number"] for seat in response.data], [150])
+
+        # 취소
+        response = self.client.delete("/api/seats/150/cancel/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        seat.refresh_from_db()
+        self.assertFalse(seat.is_reserved)
+
+    def test_reset_fans_out_and_aggregates(self):
+        """초기화 작업이 모든 샤드의 좌석을 초기화하고 개수를 합산하는지 테스트"""
+        # Arrange
+        Seat.objects.using("shard_1").filter(seat_number=3).update(
+            is_reserved=True, reserved_by=self.user
+        )
+        Seat.objects.using("shard_2").filter(seat_number=150).update(
+            is_reserved=True, reserved_by=self.user
+        )
+        self.client.force_authenticate(user=self.admin_user)
+
+        # Act
+        response = self.client.post("/api/seats/reset/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["job"]["max_seat_number"], 150)
+        self.assertEqual(response.data["job"]["reset_count"], 2)
+        for alias in ("shard_1", "shard_2"):
+            self.assertFalse(Seat.objects.using(alias).filter(is_reserved=True).exists())
+
+
+class BestAvailableAllocationTests(APITestCase):
+    """연속 좌석 자동 배정 테스트 (한 행 3석, 마이그레이션으로 생성된 1~9번 좌석 사용)"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="block_user", password="password123")
+        Seat.objects.filter(seat_number=2).update(is_reserved=True)
+
+    def setUp(self):
+        allocation.reset_index()
+        self.client.force_authenticate(user=self.user)
+
+    def test_index_prefers_front_row_and_center(self):
+        """앞 행을 우선하고, 같은 행에서는 가운데에 가까운 블록을 고르는지 테스트"""
+        # 1행: 1~4번만 빈 좌석, 2행: 전부 빈 좌석 (한 행 10석)
+        index = allocation.FreeSeatIndex.from_free_seats([1, 2, 3, 4, *range(11, 21)], 10)
+
+        self.assertEqual(index.find_best_block(3), [2, 3, 4])
+        self.assertEqual(index.find_best_block(5), [13, 14, 15, 16, 17])
+
+        index.mark_reserved([3])
+        self.assertEqual(index.find_best_block(3), [14, 15, 16])
+        index.mark_free([3])
+        self.assertEqual(index.find_best_block(3), [2, 3, 4])
+
+    def test_reserve_best_available_block(self):
+        """연속된 빈 좌석 블록을 한 번에 예약하는지 테스트"""
+        response = self.client.post(
+            "/api/seats/reserve/best-available/", {"count": 2}, format="json"
+        )
+
+        # 1행은 2번이 예약되어 연속 2석이 없으므로 2행에 배정됩니다.
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["seat_numbers"], [4, 5])
+        reserved = Seat.objects.filter(reserved_by=self.user).values_list("seat_number", flat=True)
+        self.assertEqual(sorted(reserved), [4, 5])
+
+    def test_stale_index_retries_next_block(self):
+        """다른 워커가 먼저 선점한 블록은 DB 값으로 갱신하고 다음 블록을 배정하는지 테스트"""
+        # Arrange: 인덱스를 만든 뒤, 인덱스가 모르는 사이에 5번 좌석이 예약됩니다.
+        allocation.get_index()
+        Seat.objects.filter(seat_number=5).update(is_reserved=True)
+
+        # Act
+        response = self.client.post(
+            "/api/seats/reserve/best-available/", {"count": 2}, format="json"
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["seat_numbers"], [7, 8])
+        self.assertFalse(Seat.objects.get(seat_number=4).is_reserved)
+
+    def test_no_block_available(self):
+        """연속된 빈 좌석이 없으면 409, 한 행보다 많이 요청하면 400을 반환하는지 테스트"""
+        Seat.objects.filter(seat_number__in=[5, 8]).update(is_reserved=True)
+
+        response = self.client.post(
+            "/api/seats/reserve/best-available/", {"count": 3}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+
+        response = self.client.post(
+            "/api/seats/reserve/best-available/", {"count": 4}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AnySeatReservationTests(APITestCase):
+    """아무 빈 좌석 예약 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="any_seat_user", password="password123")
+        Seat.objects.filter(seat_number__in=[1, 2]).update(is_reserved=True)
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def test_reserve_any_seat_conditional_fallback(self):
+        """SKIP LOCKED가 없는 DB(SQLite)에서 조건부 UPDATE로 빈 좌석을 예약하는지 테스트"""
+        self.assertFalse(connection.features.has_select_for_update_skip_locked)
+
+        first = self.client.post("/api/seats/reserve/any/")
+        second = self.client.post("/api/seats/reserve/any/")
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual([first.data["seat_number"], second.data["seat_number"]], [3, 4])
+        self.assertEqual(Seat.objects.get(seat_number=3).reserved_by, self.user)
+
+    def test_reserve_any_seat_skip_locked(self):
+        """SKIP LOCKED를 지원하는 DB에서는 잠긴 좌석을 건너뛰는 경로를 사용하는지 테스트"""
+        with mock.patch.object(connection.features, "has_select_for_update_skip_locked", True):
+            with mock.patch.object(
+                allocation, "_claim_any_conditional", side_effect=AssertionError
+            ):
+                response = self.client.post("/api/seats/reserve/any/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["seat_number"], 3)
+        self.assertTrue(Seat.objects.get(seat_number=3).is_reserved)
+
+    def test_sold_out(self):
+        """빈 좌석이 없으면 409를 반환하는지 테스트"""
+        Seat.objects.update(is_reserved=True)
+
+        response = self.client.post("/api/seats/reserve/any/")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(response.data["error"], "예약 가능한 좌석이 없습니다.")
+
+    def test_contention_is_not_reported_as_sold_out(self):
+        """빈 좌석이 남았는데 선점 경쟁에서 모두 졌으면 매진이 아닌 충돌로 응답하는지 테스트"""
+        # Act: 다른 요청이 매번 먼저 가져간 상황입니다.
+        with mock.patch.object(allocation, "_claim", return_value=False) as claim:
+            response = self.client.post("/api/seats/reserve/any/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            response.data["error"],
+            "다른 요청과 충돌하여 예약하지 못했습니다. 다시 시도해주세요.",
+        )
+        self.assertEqual(claim.call_count, 5)
+
+
+@override_settings(SEAT_VERSION_RETRY_BASE_DELAY=0)
+class OptimisticConcurrencyTests(APITestCase):
+    """좌석 version 기반 낙관적 동시성 제어 테스트"""
+
+    user: User
+    seat: Seat
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="version_user", password="password123")
+        cls.seat = Seat.objects.create(seat_number=30)
+
+    def setUp(self):
+        metrics.reset()
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch("seats.views.faults.inject", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _concurrent_writer(self, times):
+        """좌석을 읽은 직후 다른 요청이 먼저 좌석을 바꾼 상황을 times번 만듭니다."""
+        real_update = concurrency.update_seat_if_unchanged
+        remaining = [times]
+
+        def update(seat, **changes):
+            if remaining[0] > 0:
+                remaining[0] -= 1
+                Seat.objects.filter(pk=seat.pk).update(version=F("version") + 1)
+            return real_update(seat, **changes)
+
+        return mock.patch("seats.views.update_seat_if_unchanged", side_effect=update)
+
+    def test_version_increments_on_each_change(self):
+        """예약과 취소가 좌석 version을 하나씩 올리는지 테스트"""
+        self.client.post("/api/seats/reserve/", {"seat_number": 30}, format="json")
+        self.seat.refresh_from_db()
+        self.assertEqual(self.seat.version, 1)
+
+        self.client.delete("/api/seats/30/cancel/")
+        self.seat.refresh_from_db()
+        self.assertEqual(self.seat.version, 2)
+        self.assertEqual(metrics.snapshot(), {"reserve.success": 1, "cancel.success": 1})
+
+    def test_conflict_is_retried(self):
+        """version 충돌이 나면 다시 읽어서 재시도하는지 테스트"""
+        with self._concurrent_writer(times=1):
+            response = self.client.post("/api/seats/reserve/", {"seat_number": 30}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.seat.refresh_from_db()
+        self.assertTrue(self.seat.is_reserved)
+        self.assertEqual(metrics.snapshot()["reserve.version_conflict"], 1)
+
+    def test_conflict_retries_are_bounded(self):
+        """재시도를 모두 소진하면 409와 함께 별도 지표를 남기는지 테스트"""
+        with self._concurrent_writer(times=10):
+            response = self.client.post("/api/seats/reserve/", {"seat_number": 30}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.seat.refresh_from_db()
+        self.assertFalse(self.seat.is_reserved)
+        counters = metrics.snapshot()
+        self.assertEqual(counters["reserve.version_conflict"], 3)
+        self.assertEqual(counters["reserve.version_retry_exhausted"], 1)
+        self.assertNotIn("reserve.already_reserved", counters)
+
+    def test_cancel_does_not_clobber_concurrent_change(self):
+        """취소도 version을 확인하여, 그 사이의 변경을 덮어쓰지 않는지 테스트"""
+        Seat.objects.filter(pk=30).update(is_reserved=True, reserved_by=self.user)
+
+        with self._concurrent_writer(times=1):
+            response = self.client.delete("/api/seats/30/cancel/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(metrics.snapshot()["cancel.version_conflict"], 1)
+
+
+class ReservationBatchingTests(APITestCase):
+    """예약 요청 그룹 커밋 테스트"""
+
+    user: User
+    other_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="batch_user", password="password123")
+        cls.other_user = User.objects.create_user(username="batch_other", password="password123")
+        Seat.objects.create(seat_number=40)
+        Seat.objects.create(seat_number=41)
+
+    def test_batch_resolves_conflicts_per_request(self):
+        """한 트랜잭션 안에서 요청마다 충돌을 가려 각자의 결과를 돌려주는지 테스트"""
+        # Arrange
+        batch = [
+            batching.PendingReservation(seat_number=40, user=self.user),
+            batching.PendingReservation(seat_number=40, user=self.other_user),
+            batching.PendingReservation(seat_number=41, user=self.other_user),
+            batching.PendingReservation(seat_number=4040, user=self.user),
+        ]
+
+        # Act
+        batching.ReservationBatcher()._flush("default", batch)
+
+        # Assert
+        self.assertEqual(
+            [item.result for item in batch],
+            [
+                batching.RESERVED,
+                batching.ALREADY_RESERVED,
+                batching.RESERVED,
+                batching.NOT_FOUND,
+            ],
+        )
+        self.assertTrue(all(item.done.is_set() for item in batch))
+        self.assertEqual(Seat.objects.get(seat_number=40).reserved_by, self.user)
+        self.assertEqual(Seat.objects.get(seat_number=41).reserved_by, self.other_user)
+
+    def test_concurrent_requests_share_one_batch(self):
+        """동시에 도착한 요청들이 하나의 배치로 모여 처리되는지 테스트"""
+        # Arrange: DB 처리 대신 배치 크기만 기록합니다.
+        batcher = batching.ReservationBatcher(window_ms=5000, max_size=5)
+        batch_sizes = []
+
+        def apply(shard, batch):
+            batch_sizes.append(len(batch))
+            for item in batch:
+                item.result = batching.RESERVED
+
+        results = []
+        with mock.patch.object(batcher, "_apply", side_effect=apply):
+            threads = [
+                threading.Thread(
+                    target=lambda n=n: results.append(batcher.submit("default", n, self.user))
+                )
+                for n in range(5)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        # Assert: 창이 끝나기 전에 배치가 가득 차서 한 번에 처리됩니다.
+        self.assertEqual(batch_sizes, [5])
+        self.assertEqual(results, [batching.RESERVED] * 5)
+
+    def test_timeout_before_leader_takes_batch(self):
+        """리더가 배치를 가져가기 전에 시간이 지난 요청은 배치에서 빠지고 실패하는지 테스트"""
+        # Arrange
+        batcher = batching.ReservationBatcher(window_ms=300, max_size=10)
+        batches = []
+
+        def apply(shard, batch):
+            batches.append([item.seat_number for item in batch])
+            for item in batch:
+                item.result = batching.RESERVED
+
+        # Act
+        with mock.patch.object(batcher, "_apply", side_effect=apply):
+            with mock.patch("seats.batching.RESULT_TIMEOUT", 0.05):
+                leader = threading.Thread(target=batcher.submit, args=("default", 40, self.user))
+                leader.start()
+                time.sleep(0.01)
+                result = batcher.submit("default", 41, self.user)
+                leader.join(timeout=5)
+
+        # Assert
+        self.assertEqual(result, batching.ERROR)
+        self.assertEqual(batches, [[40]])
+
+    def test_timeout_after_leader_takes_batch_waits_for_result(self):
+        """리더가 처리 중인 요청은 시간이 지나도 실패로 응답하지 않고 결과를 기다리는지 테스트"""
+        # Arrange
+        batcher = batching.ReservationBatcher(window_ms=20, max_size=10)
+
+        def slow_apply(shard, batch):
+            time.sleep(0.2)
+            for item in batch:
+                item.result = batching.RESERVED
+
+        results = {}
+
+        def submit(seat_number):
+            results[seat_number] = batcher.submit("default", seat_number, self.user)
+
+        # Act
+        with mock.patch.object(batcher, "_apply", side_effect=slow_apply):
+            with mock.patch("seats.batching.RESULT_TIMEOUT", 0.05):
+                leader = threading.Thread(target=submit, args=(40,))
+                leader.start()
+                time.sleep(0.005)
+                submit(41)
+                leader.join(timeout=5)
+
+        # Assert
+        self.assertEqual(results, {40: batching.RESERVED, 41: batching.RESERVED})
+
+    @override_settings(SEAT_RESERVATION_BATCHING=True)
+    def test_reserve_view_in_batching_mode(self):
+        """그룹 커밋 모드에서도 예약 API의 응답이 기존과 같은지 테스트"""
+        self.client.force_authenticate(user=self.user)
+
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            response = self.client.post("/api/seats/reserve/", {"seat_number": 40}, format="json")
+            conflict = self.client.post("/api/seats/reserve/", {"seat_number": 40}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(conflict.status_code, status.HTTP_409_CONFLICT)
+        self.assertTrue(Seat.objects.get(seat_number=40).is_reserved)
+
+
+class ReservationSequencerTests(APITestCase):
+    """파티션별 단일 writer 예약 시퀀서 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="sequencer_user", password="password123")
+        Seat.objects.create(seat_number=50)
+
+    def test_write_reservation(self):
+        """조건부 UPDATE로 예약하고, 이미 팔렸거나 없는 좌석을 구분하는지 테스트"""
+        self.assertEqual(sequencer.write_reservation("default", 50, self.user), batching.RESERVED)
+        self.assertEqual(
+            sequencer.write_reservation("default", 50, self.user),
+            batching.ALREADY_RESERVED,
+        )
+        self.assertEqual(
+            sequencer.write_reservation("default", 5050, self.user), batching.NOT_FOUND
+        )
+        self.assertEqual(Seat.objects.get(seat_number=50).reserved_by, self.user)
+
+    def test_duplicate_requests_rejected_in_memory(self):
+        """이미 팔린 좌석에 대한 중복 요청은 DB에 가지 않고 거절되는지 테스트"""
+        # Arrange: 파티션 워커가 DB 대신 가짜 writer를 호출하게 합니다.
+        seq = sequencer.ReservationSequencer(partitions=4)
+        self.addCleanup(seq.stop)
+
+        # Act
+        with mock.patch(
+            "seats.sequencer.write_reservation", return_value=batching.RESERVED
+        ) as write:
+            results = [seq.submit("default", 50, self.user) for _ in range(3)]
+
+        # Assert
+        self.assertEqual(
+            results,
+            [batching.RESERVED, batching.ALREADY_RESERVED, batching.ALREADY_RESERVED],
+        )
+        write.assert_called_once_with("default", 50, self.user)
+
+    def test_timeout_cancels_only_queued_requests(self):
+        """시간 초과 시 대기 중인 요청은 취소하고, 처리 중인 요청은 실제 결과를 기다리는지 테스트"""
+        # Arrange: 첫 요청의 쓰기를 붙잡아 두어 뒤 요청이 큐에서 기다리게 합니다.
+        seq = sequencer.ReservationSequencer(partitions=1)
+        self.addCleanup(seq.stop)
+        started = threading.Event()
+        release = threading.Event()
+        writes = []
+
+        def slow_write(shard, seat_number, user):
+            writes.append(seat_number)
+            started.set()
+            release.wait(5)
+            return batching.RESERVED
+
+        results = {}
+
+        def submit(seat_number):
+            results[seat_number] = seq.submit("default", seat_number, self.user)
+
+        # Act
+        with mock.patch("seats.sequencer.write_reservation", slow_write):
+            with mock.patch("seats.sequencer.RESULT_TIMEOUT", 0.05):
+                first = threading.Thread(target=submit, args=(50,))
+                first.start()
+                started.wait(5)
+                submit(51)
+                time.sleep(0.1)
+                release.set()
+                first.join()
+            seq.stop()
+
+        # Assert
+        self.assertEqual(results, {50: batching.RESERVED, 51: batching.ERROR})
+        self.assertEqual(writes, [50])
+
+    def test_released_seat_is_forgotten(self):
+        """취소 시그널을 받거나 TTL이 지나면 메모리의 팔린 좌석 정보를 잊는지 테스트"""
+        seq = sequencer.ReservationSequencer(partitions=4)
+        seq.mark_taken([50])
+
+        with mock.patch.object(sequencer, "_sequencer", seq):
+            signals.seats_released.send(sender=None, seat_numbers=[50], user_id=None)
+        self.assertFalse(seq.partition_for(50).is_taken(50))
+
+        partition = sequencer.Partition(0, taken_ttl=0)
+        partition.mark_taken(50)
+        time.sleep(0.001)
+        self.assertFalse(partition.is_taken(50))
+
+
+class FaultInjectionTests(APITestCase):
+    """장애 주입 테스트"""
+
+    admin_user: User
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin_user = User.objects.create_superuser(
+            username="fault_admin", password="password123"
+        )
+        cls.user = User.objects.create_user(username="fault_user", password="password123")
+        Seat.objects.create(seat_number=60)
+
+    def setUp(self):
+        metrics.reset()
+        # 테스트에서 바꾼 주입 설정을 원래대로 돌립니다.
+        self.addCleanup(faults.configure_from_settings)
+
+    def test_seeded_injection_is_reproducible(self):
+        """같은 시드면 주입 지점마다 같은 실패 순서가 나오는지 테스트"""
+        rules = {"reserve": faults.FaultRule(failure_rate=0.3)}
+
+        first = faults.FaultInjector(rules, seed=7)
+        second = faults.FaultInjector(rules, seed=7)
+
+        self.assertEqual(
+            [first.inject("reserve") for _ in range(50)],
+            [second.inject("reserve") for _ in range(50)],
+        )
+        self.assertFalse(first.inject("cancel"))
+
+    def test_latency_and_windows(self):
+        """장애 구간 안에서만 지연과 실패가 주입되는지 테스트"""
+        # Arrange: 가짜 시계와 sleep을 사용합니다.
+        now = [100.0]
+        sleeps = []
+        rule = faults.FaultRule(failure_rate=1.0, latency_ms=250, windows=((5.0, 10.0),))
+        injector = faults.FaultInjector(
+            {"reserve": rule}, seed=1, clock=lambda: now[0], sleep=sleeps.append
+        )
+
+        # Act & Assert: 구간 전
+        now[0] = 103.0
+        self.assertFalse(injector.inject("reserve"))
+        self.assertEqual(sleeps, [])
+
+        # 구간 안
+        now[0] = 106.0
+        self.assertTrue(injector.inject("reserve"))
+        self.assertEqual(sleeps, [0.25])
+
+        # 구간 뒤
+        now[0] = 110.0
+        self.assertFalse(injector.inject("reserve"))
+        self.assertEqual(metrics.snapshot()["reserve.injected_failure"], 1)
+
+    @override_settings(SEAT_FAULTS_ENABLED=False)
+    def test_disabled_injection(self):
+        """장애 주입을 끄면 주입기가 없고 예약이 실패하지 않는지 테스트"""
+        self.assertIsNone(faults._injector)
+        self.assertFalse(faults.inject("reserve"))
+
+    def test_admin_updates_fault_config(self):
+        """관리자가 API로 주입 설정을 바꾸면 해당 엔드포인트에 바로 적용되는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.admin_user)
+        config = {
+            "enabled": True,
+            "seed": 3,
+            "rules": {"reserve_any": {"failure_rate": 1.0}},
+        }
+
+        # Act
+        response = self.client.put("/api/seats/faults/", config, format="json")
+        any_response = self.client.post("/api/seats/reserve/any/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["seed"], 3)
+        self.assertEqual(response.data["rules"]["reserve_any"]["failure_rate"], 1.0)
+        self.assertEqual(any_response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertFalse(Seat.objects.get(seat_number=60).is_reserved)
+
+    def test_fault_config_validation_and_permission(self):
+        """잘못된 설정은 400, 일반 사용자는 403을 받는지 테스트"""
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.put(
+            "/api/seats/faults/",
+            {"enabled": True, "rules": {"unknown": {"failure_rate": 2}}},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/seats/faults/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class ApiSchemaTests(APITestCase):
+    """캐시된 OpenAPI 스키마 테스트"""
+
+    def setUp(self):
+        schema.reset_schema()
+        self.addCleanup(schema.reset_schema)
+
+    def test_schema_is_generated_once(self):
+        """스키마를 한 번만 생성하고 compact JSON과 강한 ETag로 응답하는지 테스트"""
+        # Act
+        with mock.patch("config.schema.generate_schema", wraps=schema.generate_schema) as generate:
+            first = self.client.get("/api/schema/")
+            second = self.client.get("/api/schema/")
+
+        # Assert
+        self.assertEqual(generate.call_count, 1)
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(first["Content-Type"], schema.CONTENT_TYPE)
+        self.assertFalse(first["ETag"].startswith("W/"))
+        self.assertEqual(first["ETag"], second["ETag"])
+        document = json.loads(first.content)
+        self.assertIn("/api/seats/reserve/", document["paths"])
+        self.assertNotIn(b"\n", first.content)
+
+    def test_gzip_and_not_modified(self):
+        """gzip 본문을 미리 압축해 두고, ETag가 같으면 304를 반환하는지 테스트"""
+        plain = self.client.get("/api/schema/")
+
+        compressed = self.client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip, deflate")
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertNotEqual(compressed["ETag"], plain["ETag"])
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+
+        not_modified = self.client.get(
+            "/api/schema/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=compressed["ETag"],
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b"")
+
+    def test_brotli_preferred_and_q_zero_excluded(self):
+        """br을 gzip보다 먼저 고르고, q=0으로 거부한 인코딩은 쓰지 않는지 테스트"""
+        plain = self.client.get("/api/schema/")
+
+        compressed = self.client.get("/api/schema/", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertEqual(compressed["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(compressed.content), plain.content)
+
+        gzip_only = self.client.get("/api/schema/", HTTP_ACCEPT_ENCODING="br;q=0, gzip")
+        self.assertEqual(gzip_only["Content-Encoding"], "gzip")
+
+        identity = self.client.get("/api/schema/", HTTP_ACCEPT_ENCODING="br;q=0, gzip;q=0")
+        self.assertNotIn("Content-Encoding", identity)
+        self.assertEqual(identity.content, plain.content)
+
+    def test_prebuilt_schema_file(self):
+        """빌드 시 저장한 스키마 파일이 있으면 생성하지 않고 파일을 사용하는지 테스트"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "openapi.json"
+            with override_settings(API_SCHEMA_FILE=str(path)):
+                call_command("build_api_schema", stdout=StringIO())
+                path.write_bytes(b'{"openapi":"3.0.3","paths":{}}')
+
+                with mock.patch("config.schema.generate_schema") as generate:
+                    response = self.client.get("/api/schema/")
+
+        generate.assert_not_called()
+        self.assertEqual(response.content, b'{"openapi":"3.0.3","paths":{}}')
+
+    def test_views_do_not_import_spectacular_when_docs_disabled(self):
+        """API 문서를 끄면 뷰와 URL을 불러와도 drf_spectacular를 불러오지 않는지 테스트"""
+        # Arrange: 설정은 import 시점에 읽으므로 새 프로세스에서 확인합니다.
+        # ("test" 인자로 테스트용 SQLite 설정을 사용합니다)
+        code = (
+            "import sys, django; django.setup(); "
+            "import config.urls, seats.views, users.views; "
+            "print('drf_spectacular' in sys.modules)"
+        )
+        env = {
+            **os.environ,
+            "API_DOCS_ENABLED": "false",
+            "DJANGO_SETTINGS_MODULE": "config.settings",
+        }
+
+        # Act
+        result = subprocess.run(
+            [sys.executable, "-c", code, "test"],
+            cwd=settings.BASE_DIR,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        # Assert
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+@override_settings(SEAT_MAP_MAX_AGE=60)
+class SeatMapSnapshotTests(APITestCase):
+    """미리 압축한 좌석 배치도 스냅샷 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="seatmap_user", password="password123")
+        Seat.objects.create(seat_number=70)
+        Seat.objects.create(seat_number=71)
+
+    def setUp(self):
+        seatmap.reset()
+        self.addCleanup(seatmap.reset)
+
+    def test_snapshot_reused_until_seat_map_changes(self):
+        """배치도가 바뀌기 전까지는 DB 조회 없이 같은 스냅샷을 응답하는지 테스트"""
+        # Arrange
+        first = self.client.get("/api/seats/")
+
+        # Act & Assert: 변경 전에는 쿼리 없이 같은 버전을 응답합니다.
+        with self.assertNumQueries(0):
+            second = self.client.get("/api/seats/")
+        self.assertEqual(second[seatmap.VERSION_HEADER], first[seatmap.VERSION_HEADER])
+        self.assertEqual(second["ETag"], first["ETag"])
+
+        # 예약이 커밋되면 버전이 올라가고 새 스냅샷을 만듭니다.
+        self.client.force_authenticate(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            with mock.patch("seats.views.faults.inject", return_value=False):
+                self.client.post("/api/seats/reserve/", {"seat_number": 70}, format="json")
+        third = self.client.get("/api/seats/")
+
+        self.assertGreater(int(third[seatmap.VERSION_HEADER]), int(first[seatmap.VERSION_HEADER]))
+        self.assertNotEqual(third["ETag"], first["ETag"])
+        self.assertEqual(
+            [seat["is_reserved"] for seat in third.data if seat["seat_number"] == 70],
+            [True],
+        )
+
+    def test_precompressed_variants(self):
+        """Accept-Encoding에 맞는 미리 압축한 본문과 304 응답을 반환하는지 테스트"""
+        plain = self.client.get("/api/seats/")
+        compressed = self.client.get("/api/seats/", HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertEqual(json.loads(plain.content), plain.data)
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+
+        not_modified = self.client.get(
+            "/api/seats/",
+            HTTP_ACCEPT_ENCODING="gzip",
+            HTTP_IF_NONE_MATCH=compressed["ETag"],
+        )
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.content, b"")
+
+    @override_settings(SEAT_MAP_MAX_AGE=0)
+    def test_change_without_signal_bumps_version(self):
+        """시그널 없이(다른 워커에서) 바뀐 배치도도 다시 만들 때 버전이 올라가는지 테스트"""
+        first = self.client.get("/api/seats/")
+        unchanged = self.client.get("/api/seats/")
+
+        Seat.objects.filter(seat_number=71).update(is_reserved=True)
+        changed = self.client.get("/api/seats/")
+
+        self.assertEqual(unchanged[seatmap.VERSION_HEADER], first[seatmap.VERSION_HEADER])
+        self.assertGreater(int(changed[seatmap.VERSION_HEADER]), int(first[seatmap.VERSION_HEADER]))
+
+
+@override_settings(SEAT_MAP_MAX_AGE=60, SEAT_MAP_CACHE="seatmap")
+class SeatMapSingleFlightTests(APITestCase):
+    """좌석 배치도 스냅샷을 한 요청만 다시 만드는지(single-flight) 테스트"""
+
+    def setUp(self):
+        seatmap.reset()
+        self.addCleanup(seatmap.reset)
+        self.loads = 0
+        self.release_load = threading.Event()
+        self.release_load.set()
+
+    def slow_load(self):
+        self.loads += 1
+        self.release_load.wait(5)
+        time.sleep(0.05)
+        return [{"seat_number": 1, "is_reserved": self.loads > 1}]
+
+    def test_concurrent_requests_build_once(self):
+        """스냅샷이 없을 때 동시에 들어온 요청들이 한 번만 조회하고 같은 스냅샷을 받는지 테스트"""
+        # Arrange
+        results = []
+
+        def request():
+            results.append(seatmap.get_snapshot())
+
+        threads = [threading.Thread(target=request) for _ in range(8)]
+
+        # Act
+        with mock.patch("seats.seatmap.load_seat_map", self.slow_load):
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        # Assert
+        self.assertEqual(self.loads, 1)
+        self.assertEqual(len({id(snapshot) for snapshot in results}), 1)
+
+    @override_settings(SEAT_MAP_REBUILD_WAIT=0.01)
+    def test_waiting_requests_get_previous_snapshot(self):
+        """다른 요청이 다시 만드는 동안에는 기다리지 않고 이전 스냅샷을 받는지 테스트"""
+        # Arrange: 이전 스냅샷을 만들고 버전을 올린 뒤, 다시 만드는 요청을 멈춰 둡니다.
+        with mock.patch("seats.seatmap.load_seat_map", self.slow_load):
+            previous = seatmap.get_snapshot()
+            seatmap.invalidate()
+            self.release_load.clear()
+            builder = threading.Thread(target=seatmap.get_snapshot)
+            builder.start()
+            while self.loads < 2:
+                time.sleep(0.01)
+
+            # Act
+            served = seatmap.get_snapshot()
+            self.release_load.set()
+            builder.join()
+            rebuilt = seatmap.get_snapshot()
+
+        # Assert
+        self.assertIs(served, previous)
+        self.assertEqual(self.loads, 2)
+        self.assertGreater(rebuilt.version, previous.version)
+        self.assertTrue(rebuilt.data[0]["is_reserved"])
+
+    def test_other_worker_reuses_shared_snapshot(self):
+        """다른 워커가 캐시에 올린 스냅샷을 DB 조회 없이 가져다 쓰는지 테스트"""
+        # Arrange: 한 워커가 스냅샷을 만들어 캐시에 올립니다.
+        with mock.patch("seats.seatmap.load_seat_map", self.slow_load):
+            built = seatmap.get_snapshot()
+        # 다른 워커처럼 메모리의 스냅샷만 비웁니다.
+        seatmap._snapshots.clear()
+
+        # Act
+        with mock.patch("seats.seatmap.load_seat_map") as load:
+            shared = seatmap.get_snapshot()
+
+        # Assert
+        load.assert_not_called()
+        self.assertEqual(shared.data, built.data)
+        self.assertEqual(shared.body.digest, built.body.digest)
+
+    @override_settings(SEAT_MAP_REBUILD_WAIT=0.01)
+    def test_lock_held_by_other_worker_serves_previous(self):
+        """다른 워커가 생성 잠금을 잡고 있으면 직접 조회하지 않고 이전 스냅샷을 쓰는지 테스트"""
+        # Arrange
+        with mock.patch("seats.seatmap.load_seat_map", self.slow_load):
+            previous = seatmap.get_snapshot()
+        seatmap.invalidate()
+        caches["seatmap"].set("seat_map:default:lock", "other-worker")
+        self.addCleanup(caches["seatmap"].delete, "seat_map:default:lock")
+
+        # Act
+        with mock.patch("seats.seatmap.load_seat_map") as load:
+            served = seatmap.get_snapshot()
+
+        # Assert
+        load.assert_not_called()
+        self.assertIs(served, previous)
+
+    def test_cache_without_atomic_add_is_rejected(self):
+        """add/incr가 원자적이지 않은 캐시를 SEAT_MAP_CACHE로 쓰면 시스템 체크가 거부하는지 테스트"""
+        # Arrange
+        file_cache = {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": tempfile.mkdtemp(),
+        }
+
+        # Act
+        with override_settings(CACHES={**settings.CACHES, "seatmap": file_cache}):
+            errors = seatmap.check_seat_map_cache(None)
+
+        # Assert
+        self.assertEqual([error.id for error in errors], ["seats.E001"])
+        self.assertEqual(seatmap.check_seat_map_cache(None), [])
+
+
+class SeatLayoutTests(APITestCase):
+    """정적 좌석 배치와 예약 상태 API 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="layout_user", password="password123")
+
+    def setUp(self):
+        seatmap.reset()
+        layout.reset()
+        self.addCleanup(seatmap.reset)
+        self.addCleanup(layout.reset)
+
+    @override_settings(SEAT_ROW_LENGTH=2, SEAT_SECTION_ROWS=1)
+    def test_layout_is_served_immutable_under_hash(self):
+        """배치를 해시가 든 URL에서 immutable 캐시 헤더로 반환하는지 테스트"""
+        # Act
+        index = self.client.get("/api/seats/layout/")
+        response = self.client.get(index.data["url"], HTTP_ACCEPT_ENCODING="gzip")
+
+        # Assert
+        self.assertEqual(index["Cache-Control"], "no-cache")
+        self.assertEqual(index.data["url"], f"/api/seats/layout/{index.data['hash']}/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Cache-Control"], layout.IMMUTABLE_CACHE_CONTROL)
+        body = json.loads(gzip.decompress(response.content))
+        # 초기 좌석 1~9번: 한 행 2석, 한 구역 1행 -> A~E 구역
+        self.assertEqual(
+            [section["name"] for section in body["sections"]], ["A", "B", "C", "D", "E"]
+        )
+        self.assertEqual(
+            body["sections"][1]["rows"][0],
+            {
+                "name": "B1",
+                "y": 2,
+                "seats": [
+                    {"seat_number": 3, "x": 0, "label": "B1-1"},
+                    {"seat_number": 4, "x": 1, "label": "B1-2"},
+                ],
+            },
+        )
+        stale = self.client.get("/api/seats/layout/0123abcd/")
+        self.assertEqual(stale.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_availability_changes_without_changing_layout(self):
+        """예약하면 예약 상태는 바뀌고 배치 해시는 그대로인지 테스트"""
+        # Arrange
+        before = self.client.get("/api/seats/availability/")
+        layout_hash = self.client.get("/api/seats/layout/").data["hash"]
+
+        # Act
+        self.client.force_authenticate(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            with mock.patch("seats.views.faults.inject", return_value=False):
+                self.client.post("/api/seats/reserve/", {"seat_number": 2}, format="json")
+        after = self.client.get("/api/seats/availability/")
+
+        # Assert
+        self.assertEqual(json.loads(before.content)["reserved"], [])
+        body = json.loads(after.content)
+        self.assertEqual(body["reserved"], [2])
+        self.assertEqual(body["layout"], layout_hash)
+        self.assertEqual(self.client.get("/api/seats/layout/").data["hash"], layout_hash)
+        self.assertGreater(int(after[seatmap.VERSION_HEADER]), int(before[seatmap.VERSION_HEADER]))
+
+    def test_layout_hash_changes_when_seats_change(self):
+        """좌석이 추가되면 배치 해시가 바뀌는지 테스트"""
+        first = self.client.get("/api/seats/layout/").data["hash"]
+
+        Seat.objects.create(seat_number=10)
+        second = self.client.get("/api/seats/layout/").data["hash"]
+
+        self.assertNotEqual(first, second)
+
+    def test_section_names(self):
+        """구역 이름이 A..Z 다음에 AA로 이어지는지 테스트"""
+        self.assertEqual([layout.section_name(i) for i in (0, 25, 26, 27)], ["A", "Z", "AA", "AB"])
+
+
+class SeatChangesLongPollTests(APITestCase):
+    """좌석 배치도 변경 롱 폴링 테스트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        Seat.objects.create(seat_number=80)
+        Seat.objects.create(seat_number=81)
+
+    def setUp(self):
+        seatmap.reset()
+        self.addCleanup(seatmap.reset)
+
+    def _reserve_seat(self, seat_number):
+        Seat.objects.filter(seat_number=seat_number).update(is_reserved=True)
+        seatmap.invalidate()
+
+    async def test_returns_delta_since_client_version(self):
+        """클라이언트 버전 이후에 바뀐 좌석만 바로 반환하는지 테스트"""
+        # Arrange
+        version = (await sync_to_async(seatmap.get_snapshot)()).version
+        await sync_to_async(self._reserve_seat)(80)
+
+        # Act
+        response = await self.async_client.get(
+            "/api/seats/changes/", {"version": version, "timeout": 5}
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        body = response.json()
+        self.assertGreater(body["version"], version)
+        self.assertFalse(body["full"])
+        self.assertEqual(body["changes"], [{"seat_number": 80, "is_reserved": True}])
+
+    @override_settings(SEAT_MAP_MAX_AGE=60)
+    async def test_waits_until_seat_map_changes(self):
+        """변경이 생길 때까지 요청을 붙잡고 있다가 변경 즉시 응답하는지 테스트"""
+        version = (await sync_to_async(seatmap.get_snapshot)()).version
+
+        async def change_later():
+            await asyncio.sleep(0.1)
+            await sync_to_async(self._reserve_seat)(81)
+
+        started = time.monotonic()
+        response, _ = await asyncio.gather(
+            self.async_client.get("/api/seats/changes/", {"version": version, "timeout": 10}),
+            change_later(),
+        )
+
+        self.assertLess(time.monotonic() - started, 5)
+        self.assertEqual(response.json()["changes"], [{"seat_number": 81, "is_reserved": True}])
+
+    @override_settings(SEAT_MAP_MAX_AGE=60)
+    def test_version_is_shared_between_workers(self):
+        """다른 워커에서 받은 버전으로 롱 폴링해도 기다렸다가 변경분만 받는지 테스트"""
+        # Arrange: 한 워커에서 예약한 뒤 받은 버전
+        self._reserve_seat(80)
+        version = seatmap.get_snapshot().version
+        # 공유 캐시만 함께 쓰는 다른 워커처럼 메모리의 버전과 스냅샷을 비웁니다.
+        seatmap._version = 0
+        seatmap._snapshots.clear()
+
+        # Act: 변경이 없으면 바로 돌아오지 않고 timeout까지 기다립니다.
+        started = time.monotonic()
+        unchanged = self.client.get("/api/seats/changes/", {"version": version, "timeout": 0.2})
+        waited = time.monotonic() - started
+        # 또 다른 워커의 변경은 공유 버전만 올라갑니다.
+        Seat.objects.filter(seat_number=81).update(is_reserved=True)
+        caches["seatmap"].incr(seatmap.VERSION_KEY)
+        changed = self.client.get("/api/seats/changes/", {"version": version, "timeout": 5})
+
+        # Assert
+        self.assertGreaterEqual(waited, 0.2)
+        self.assertEqual(unchanged.json(), {"version": version, "full": False, "changes": []})
+        self.assertEqual(
+            changed.json(),
+            {
+                "version": version + 1,
+                "full": False,
+                "changes": [{"seat_number": 81, "is_reserved": True}],
+            },
+        )
+
+    async def test_timeout_without_changes(self):
+        """변경이 없으면 timeout 뒤 같은 버전과 빈 변경분을 반환하는지 테스트"""
+        version = (await sync_to_async(seatmap.get_snapshot)()).version
+
+        response = await self.async_client.get(
+            "/api/seats/changes/", {"version": version, "timeout": 0.2}
+        )
+
+        self.assertEqual(response.json(), {"version": version, "full": False, "changes": []})
+
+    async def test_unknown_version_gets_full_map_and_bad_params(self):
+        """이력에 없는 버전은 전체 배치도를, 잘못된 파라미터는 400을 받는지 테스트"""
+        snapshot = await sync_to_async(seatmap.get_snapshot)()
+
+        response = await self.async_client.get(
+            "/api/seats/changes/", {"version": snapshot.version + 100, "timeout": 0}
+        )
+        self.assertTrue(response.json()["full"])
+        self.assertEqual(len(response.json()["changes"]), len(snapshot.data))
+
+        response = await self.async_client.get("/api/seats/changes/", {"timeout": 1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(SEAT_MAX_PER_USER=2)
+class ReservationQuotaTests(APITestCase):
+    """사용자별 예약 상한 테스트"""
+
+    user: User
+    other_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="quota_user", password="password123")
+        cls.other_user = User.objects.create_user(username="quota_other", password="password123")
+
+    def setUp(self):
+        allocation.reset_index()
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch("seats.views.faults.inject", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def reserve(self, seat_number):
+        return self.client.post("/api/seats/reserve/", {"seat_number": seat_number}, format="json")
+
+    def reserved_count(self, user):
+        return ReservationQuota.objects.get(user=user).reserved_count
+
+    def test_reserve_rejected_over_limit(self):
+        """상한을 넘는 예약은 409로 거절하고 좌석을 비워 두는지 테스트"""
+        # Act
+        responses = [self.reserve(n).status_code for n in (1, 2, 3)]
+
+        # Assert
+        self.assertEqual(
+            responses,
+            [status.HTTP_200_OK, status.HTTP_200_OK, status.HTTP_409_CONFLICT],
+        )
+        self.assertFalse(Seat.objects.get(seat_number=3).is_reserved)
+        self.assertEqual(self.reserved_count(self.user), 2)
+
+    def test_limit_check_does_not_count_seats(self):
+        """상한 확인에 좌석 테이블 COUNT 쿼리를 쓰지 않는지 테스트"""
+        # Arrange
+        self.reserve(1)
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.reserve(2)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in ctx.captured_queries if "COUNT(" in q["sql"].upper()])
+
+    def test_per_user_limit_overrides_default(self):
+        """사용자별 상한이 SEAT_MAX_PER_USER보다 우선하는지 테스트"""
+        # Arrange
+        ReservationQuota.objects.create(user=self.user, limit=1)
+
+        # Act
+        first = self.reserve(1)
+        second = self.reserve(2)
+
+        # Assert
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_409_CONFLICT)
+        self.assertEqual(
+            second.data["error"],
+            "한 사용자가 예약할 수 있는 최대 좌석 수를 넘었습니다.",
+        )
+
+    def test_concurrent_first_reservation_within_limit(self):
+        """같은 사용자의 첫 예약이 동시에 카운터 행을 만들어도 상한 초과로 거절하지 않는지 테스트"""
+        # Arrange: 첫 증가가 실패한 직후 다른 요청이 카운터 행을 먼저 만든 상황입니다.
+        increment = quotas._increment
+
+        def racing_increment(user_id, count):
+            if not ReservationQuota.objects.filter(user_id=user_id).exists():
+                ReservationQuota.objects.create(user_id=user_id, reserved_count=1)
+                return False
+            return increment(user_id, count)
+
+        # Act
+        with mock.patch("seats.quotas._increment", side_effect=racing_increment):
+            response = self.reserve(1)
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.reserved_count(self.user), 2)
+
+    def test_cancel_releases_quota(self):
+        """취소하면 카운터가 줄어 다시 예약할 수 있는지 테스트"""
+        # Arrange
+        self.reserve(1)
+        self.reserve(2)
+
+        # Act
+        cancel = self.client.delete("/api/seats/1/cancel/")
+        response = self.reserve(3)
+
+        # Assert
+        self.assertEqual(cancel.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.reserved_count(self.user), 2)
+
+    def test_best_available_respects_limit(self):
+        """연속 좌석 배정도 블록 전체를 상한에 맞춰 확인하는지 테스트"""
+        # Act
+        response = self.client.post(
+            "/api/seats/reserve/best-available/", {"count": 3}, format="json"
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Seat.objects.filter(is_reserved=True).exists())
+        self.assertFalse(ReservationQuota.objects.filter(reserved_count__gt=0).exists())
+
+    def test_batch_rejects_only_requests_over_limit(self):
+        """그룹 커밋 배치에서 상한을 넘은 요청만 되돌리는지 테스트"""
+        # Arrange
+        batch = [batching.PendingReservation(seat_number=n, user=self.user) for n in (1, 2, 3)]
+        batch.append(batching.PendingReservation(seat_number=4, user=self.other_user))
+
+        # Act
+        batching.ReservationBatcher()._flush("default", batch)
+
+        # Assert
+        self.assertEqual(
+            [item.result for item in batch],
+            [
+                batching.RESERVED,
+                batching.RESERVED,
+                batching.QUOTA_EXCEEDED,
+                batching.RESERVED,
+            ],
+        )
+        self.assertFalse(Seat.objects.get(seat_number=3).is_reserved)
+
+    def test_sequencer_write_respects_limit(self):
+        """시퀀서의 예약 쓰기도 상한을 확인하는지 테스트"""
+        # Arrange
+        ReservationQuota.objects.create(user=self.user, limit=0)
+
+        # Act
+        result = sequencer.write_reservation("default", 1, self.user)
+
+        # Assert
+        self.assertEqual(result, batching.QUOTA_EXCEEDED)
+        self.assertFalse(Seat.objects.get(seat_number=1).is_reserved)
+
+    def test_reset_releases_counters(self):
+        """좌석 초기화가 사용자별 카운터를 해제한 좌석 수만큼 줄이는지 테스트"""
+        # Arrange
+        self.reserve(1)
+        self.reserve(2)
+        self.client.force_authenticate(user=self.other_user)
+        self.reserve(3)
+        job = SeatResetJob.objects.create(chunk_size=2, max_seat_number=9)
+
+        # Act
+        reset_jobs.run_job(job.pk)
+
+        # Assert
+        self.assertEqual(self.reserved_count(self.user), 0)
+        self.assertEqual(self.reserved_count(self.other_user), 0)
+
+    def test_release_never_goes_below_zero(self):
+        """카운터보다 많이 해제해도 0 아래로 내려가지 않는지 테스트"""
+        # Arrange
+        ReservationQuota.objects.create(user=self.user, reserved_count=1)
+
+        # Act
+        quotas.release_many({self.user.pk: 3, None: 1})
+
+        # Assert
+        self.assertEqual(self.reserved_count(self.user), 0)
+
+
+class SeatExportTests(APITestCase):
+    """좌석 예약 현황 내보내기 테스트"""
+
+    databases = {"default", "shard_1", "shard_2"}
+
+    user: User
+    admin_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="export_user", password="password123")
+        cls.admin_user = User.objects.create_superuser(
+            username="export_admin", password="password123"
+        )
+        Seat.objects.filter(seat_number__in=[2, 5]).update(is_reserved=True, reserved_by=cls.user)
+
+    def export(self, export_format, **params):
+        self.client.force_authenticate(user=self.admin_user)
+        return self.client.get(f"/api/seats/export/{export_format}/", params)
+
+    def test_csv_export_streams_all_seats(self):
+        """모든 좌석과 예약자 username을 CSV로 스트리밍하는지 테스트"""
+        # Act
+        response = self.export("csv")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        lines = b"".join(response.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "seat_number,is_reserved,reserved_by_id,reserved_by_username")
+        self.assertEqual(len(lines), 10)
+        self.assertEqual(lines[2], f"2,True,{self.user.pk},export_user")
+        self.assertEqual(lines[3], "3,False,,")
+
+    def test_ndjson_export_of_reserved_seats(self):
+        """reserved=true이면 예약된 좌석만 NDJSON으로 내보내는지 테스트"""
+        # Act
+        response = self.export("ndjson", reserved="true")
+
+        # Assert
+        rows = [
+            json.loads(line) for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual([row["seat_number"] for row in rows], [2, 5])
+        self.assertEqual({row["reserved_by_username"] for row in rows}, {"export_user"})
+
+    def test_export_requires_admin_and_known_format(self):
+        """관리자만 내보낼 수 있고, 알 수 없는 형식은 400을 반환하는지 테스트"""
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/seats/export/csv/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+        response = self.export("xlsx")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_rows_are_read_in_chunks(self):
+        """좌석을 청크 단위로 읽고, 청크마다 username을 한 번에 조회하는지 테스트"""
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            rows = export.iter_reservations(chunk_size=4)
+            first = next(rows)
+            queries_for_first_chunk = len(ctx.captured_queries)
+            rest = list(rows)
+
+        # Assert: 첫 행은 첫 청크만 읽고 돌려줍니다.
+        self.assertEqual(first["seat_number"], 1)
+        self.assertEqual(len(rest), 8)
+        user_queries = [q for q in ctx.captured_queries if 'FROM "auth_user"' in q["sql"]]
+        # 예약자가 있는 청크(1~4번, 5~8번)만 사용자를 조회합니다.
+        self.assertEqual(len(user_queries), 2)
+        # 좌석은 OFFSET 없이 이전 청크의 마지막 번호 다음부터 읽습니다. (1~4, 5~8, 9)
+        seat_queries = [q["sql"] for q in ctx.captured_queries if 'FROM "seats_seat"' in q["sql"]]
+        self.assertEqual(len(seat_queries), 3)
+        self.assertIn('"seat_number" > 8', seat_queries[2])
+        self.assertNotIn("OFFSET", " ".join(seat_queries))
+        self.assertLess(queries_for_first_chunk, len(ctx.captured_queries))
+
+    @override_settings(
+        SEAT_SHARDS=[
+            {"database": "shard_1", "first_seat": 1, "last_seat": 100},
+            {"database": "shard_2", "first_seat": 101, "last_seat": None},
+        ]
+    )
+    def test_command_merges_shards(self):
+        """명령이 모든 샤드의 좌석을 번호 순으로 합쳐 파일로 저장하는지 테스트"""
+        # Arrange
+        Seat.objects.create(seat_number=150, is_reserved=True, reserved_by=self.user)
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "reservations.ndjson"
+
+            # Act
+            call_command(
+                "export_reservations",
+                "--format",
+                "ndjson",
+                "--reserved-only",
+                "--output",
+                str(output),
+                stdout=StringIO(),
+            )
+
+            # Assert
+            rows = [json.loads(line) for line in output.read_text().splitlines()]
+        self.assertEqual([row["seat_number"] for row in rows], [150])
+        self.assertEqual(rows[0]["reserved_by_username"], "export_user")
+
+
+class SeatAdminTests(APITestCase):
+    """좌석 관리자 화면 테스트"""
+
+    user: User
+    admin_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="admin_page_user", password="password123")
+        cls.admin_user = User.objects.create_superuser(
+            username="admin_page_admin", password="password123"
+        )
+        Seat.objects.filter(seat_number__in=[1, 2]).update(is_reserved=True, reserved_by=cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.admin_user)
+
+    def run_action(self, action, seat_numbers):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post(
+                "/admin/seats/seat/",
+                {
+                    "action": action,
+                    "_selected_action": [str(n) for n in seat_numbers],
+                },
+            )
+
+    def test_changelist_has_no_per_row_user_queries(self):
+        """예약자를 함께 조회하여 행 수와 관계없이 쿼리 수가 같은지 테스트"""
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/admin/seats/seat/")
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "admin_page_user")
+        user_queries = [
+            q
+            for q in ctx.captured_queries
+            if q["sql"].startswith('SELECT "auth_user"') and '"auth_user"."id" = ' in q["sql"]
+        ]
+        # 로그인한 관리자를 조회하는 쿼리 하나뿐입니다.
+        self.assertEqual(len(user_queries), 1)
+
+    def test_unfiltered_count_uses_estimate(self):
+        """필터가 없을 때만 DB 통계의 추정치를 전체 개수로 쓰는지 테스트"""
+        with mock.patch("seats.admin.estimate_row_count", return_value=1_000_000):
+            unfiltered = EstimatedCountPaginator(Seat.objects.order_by("pk"), 100)
+            filtered = EstimatedCountPaginator(
+                Seat.objects.filter(is_reserved=True).order_by("pk"), 100
+            )
+
+            self.assertEqual(unfiltered.count, 1_000_000)
+            self.assertEqual(filtered.count, 2)
+
+    def test_bulk_release_is_single_update(self):
+        """일괄 해제가 UPDATE 한 번으로 처리되고 카운터와 시그널을 반영하는지 테스트"""
+        # Arrange
+        ReservationQuota.objects.create(user=self.user, reserved_count=2)
+        received = []
+        signals.seats_released.connect(
+            lambda sender, **kw: received.append(kw), weak=False, dispatch_uid="t"
+        )
+        self.addCleanup(signals.seats_released.disconnect, dispatch_uid="t")
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.run_action("release", [1, 2, 3])
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(Seat.objects.filter(is_reserved=True).exists())
+        seat_updates = [
+            q for q in ctx.captured_queries if q["sql"].startswith('UPDATE "seats_seat"')
+        ]
+        self.assertEqual(len(seat_updates), 1)
+        self.assertEqual(ReservationQuota.objects.get(user=self.user).reserved_count, 0)
+        self.assertEqual(received[0]["seat_numbers"], [1, 2])
+
+    def test_bulk_reserve_for_admin(self):
+        """선택한 빈 좌석만 관리자 이름으로 한 번에 예약하는지 테스트"""
+        # Act
+        response = self.run_action("reserve_for_me", [2, 3, 4])
+
+        # Assert
+        self.assertEqual(response.status_code, 302)
+        reserved = dict(
+            Seat.objects.filter(is_reserved=True).values_list("seat_number", "reserved_by_id")
+        )
+        self.assertEqual(
+            reserved,
+            {
+                1: self.user.pk,
+                2: self.user.pk,
+                3: self.admin_user.pk,
+                4: self.admin_user.pk,
+            },
+        )
+        self.assertEqual(ReservationQuota.objects.get(user=self.admin_user).reserved_count, 2)
+
+
+class ReservationTimeSeriesTests(APITestCase):
+    """초당 예약 시계열 테스트"""
+
+    user: User
+    admin_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="series_user", password="password123")
+        cls.admin_user = User.objects.create_superuser(
+            username="series_admin", password="password123"
+        )
+
+    def setUp(self):
+        timeseries.reset()
+        caches["metrics"].clear()
+        self.addCleanup(timeseries.reset)
+
+    def test_ring_buffer_overwrites_oldest_second(self):
+        """칸 수가 고정되어 있고, 창을 벗어난 초는 덮어쓰는지 테스트"""
+        # Arrange
+        buffer = timeseries.RingBuffer(window=3)
+
+        # Act
+        for second in (100, 101, 102, 103):
+            buffer.add("reserved", second - 99, now=second + 0.5)
+
+        # Assert
+        snapshot = buffer.snapshot(now=103.9)
+        self.assertEqual(sorted(snapshot), [101, 102, 103])
+        self.assertEqual(snapshot[103]["reserved"], 4)
+        self.assertEqual(len(buffer._seconds), 3)
+
+    def test_merges_workers_through_shared_cache(self):
+        """워커별 링 버퍼를 공유 캐시에서 초별로 합치는지 테스트"""
+        # Arrange: 같은 캐시를 쓰는 두 워커
+        now = [1000.2]
+        workers = [
+            timeseries.TimeSeries(
+                window=10, cache_alias="metrics", worker_id=name, clock=lambda: now[0]
+            )
+            for name in ("a", "b")
+        ]
+
+        # Act
+        workers[0].record("reserved")
+        workers[1].record("reserved", 2)
+        workers[1].record("conflicts")
+        now[0] = 1001.5
+        workers[0].record("failures")
+        merged = workers[1].merged(seconds=3)
+
+        # Assert
+        self.assertEqual(merged["start"], 999)
+        self.assertEqual(merged["workers"], 2)
+        self.assertEqual(merged["series"]["reserved"], [0, 3, 0])
+        self.assertEqual(merged["series"]["conflicts"], [0, 1, 0])
+        self.assertEqual(merged["series"]["failures"], [0, 0, 1])
+
+    def test_endpoint_reports_reservations(self):
+        """예약/충돌이 관리자 시계열 API에 반영되는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            self.client.post("/api/seats/reserve/", {"seat_number": 1}, format="json")
+            self.client.post("/api/seats/reserve/", {"seat_number": 1}, format="json")
+
+        # Act
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get("/api/seats/metrics/timeseries/", {"seconds": 30})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["series"]["reserved"]), 30)
+        self.assertEqual(sum(response.data["series"]["reserved"]), 1)
+        self.assertEqual(sum(response.data["series"]["conflicts"]), 1)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.get("/api/seats/metrics/timeseries/")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class LoadSheddingTests(APITestCase):
+    """적응형 부하 차단 미들웨어 테스트"""
+
+    def test_lower_priority_is_shed_first(self):
+        """혼잡할수록 낮은 등급부터 거절되고 예약 등급은 limit까지 처리되는지 테스트"""
+        # Arrange
+        limiter = load_shedding.AdaptiveLimiter(max_in_flight=10, min_in_flight=1)
+
+        # Act: 등급마다 거절될 때까지 요청을 받아 둡니다.
+        admitted = {}
+        for priority in ("low", "normal", "critical"):
+            while limiter.try_acquire(priority):
+                admitted[priority] = admitted.get(priority, 0) + 1
+
+        # Assert: low는 limit의 50%, normal은 80%, critical은 100%까지
+        self.assertEqual(admitted, {"low": 5, "normal": 3, "critical": 2})
+        self.assertEqual(limiter.in_flight, 10)
+        self.assertEqual(limiter.snapshot()["shed"], {"critical": 1, "normal": 1, "low": 1})
+
+    def test_limit_adapts_to_queueing_delay(self):
+        """대기 시간이 목표를 넘으면 limit이 줄고, 목표 안으로 돌아오면 다시 늘어나는지 테스트"""
+        # Arrange
+        now = [0.0]
+        limiter = load_shedding.AdaptiveLimiter(
+            max_in_flight=10, min_in_flight=2, target_delay=0.1, clock=lambda: now[0]
+        )
+
+        # Act: 느린 요청이 이어지는 동안
+        for _ in range(30):
+            now[0] += 1
+            limiter.try_acquire("critical")
+            limiter.release("critical", delay=0.5)
+        shrunk = limiter.limit
+
+        # Act: 다시 빨라지면
+        for _ in range(200):
+            limiter.try_acquire("critical")
+            limiter.release("critical", delay=0.01)
+
+        # Assert
+        self.assertEqual(shrunk, 2)
+        self.assertEqual(limiter.limit, 10)
+        self.assertEqual(limiter.in_flight, 0)
+
+    @override_settings(LOAD_SHEDDING_MAX_IN_FLIGHT=2, LOAD_SHEDDING_MIN_IN_FLIGHT=1)
+    def test_rejects_with_retry_after_while_reserve_is_admitted(self):
+        """처리 중인 요청이 있을 때 회원가입은 503으로 거절하고 예약은 처리하는지 테스트"""
+        # Arrange: 바깥 회원가입 요청이 처리되는 동안 다른 요청들이 들어옵니다.
+        factory = RequestFactory()
+        inner = {}
+
+        def get_response(request):
+            if request.path == "/api/users/signup/" and not inner:
+                inner["signup"] = middleware(factory.post("/api/users/signup/"))
+                inner["reserve"] = middleware(factory.post("/api/seats/reserve/"))
+                inner["changes"] = middleware(factory.get("/api/seats/changes/"))
+            return HttpResponse("ok")
+
+        middleware = load_shedding.LoadSheddingMiddleware(get_response)
+
+        # Act
+        outer = middleware(factory.post("/api/users/signup/"))
+
+        # Assert
+        self.assertEqual(outer.status_code, 200)
+        self.assertEqual(inner["signup"].status_code, 503)
+        self.assertIn("error", json.loads(inner["signup"].content))
+        self.assertGreaterEqual(int(inner["signup"]["Retry-After"]), 1)
+        self.assertEqual(inner["reserve"].status_code, 200)
+        # 롱 폴링은 처리 중인 요청 수와 관계없이 통과합니다.
+        self.assertEqual(inner["changes"].status_code, 200)
+        self.assertEqual(middleware.limiter.in_flight, 0)
+
+    def test_request_start_header_needs_opt_in(self):
+        """X-Request-Start 헤더는 설정으로 켠 경우에만 혼잡 신호로 쓰는지 테스트"""
+        # Arrange: 아주 오래 기다린 것처럼 보이는 헤더
+        factory = RequestFactory()
+
+        def send(middleware):
+            middleware(factory.get("/api/seats/", HTTP_X_REQUEST_START="t=1"))
+            return middleware.limiter.limit
+
+        # Act
+        untrusted = send(load_shedding.LoadSheddingMiddleware(lambda r: HttpResponse()))
+        with override_settings(LOAD_SHEDDING_TRUST_REQUEST_START=True):
+            trusted = send(load_shedding.LoadSheddingMiddleware(lambda r: HttpResponse()))
+
+        # Assert
+        self.assertEqual(untrusted, load_shedding.DEFAULT_MAX_IN_FLIGHT)
+        self.assertLess(trusted, load_shedding.DEFAULT_MAX_IN_FLIGHT)
+
+    def test_metrics_include_limiter_state(self):
+        """metrics API가 현재 워커의 부하 차단 상태를 함께 반환하는지 테스트"""
+        admin = User.objects.create_superuser(username="shedding_admin", password="password123")
+        self.client.force_authenticate(user=admin)
+
+        response = self.client.get("/api/seats/metrics/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(set(response.data["load_shedding"]), {"limit", "in_flight", "shed"})
+        self.assertEqual(response.data["load_shedding"]["in_flight"]["normal"], 1)
+
+    def test_queue_delay_from_proxy_header(self):
+        """X-Request-Start 헤더의 초/밀리초/마이크로초 단위를 모두 해석하는지 테스트"""
+        now = 1_700_000_000.5
+        self.assertAlmostEqual(load_shedding.queue_delay("t=1700000000.25", now), 0.25)
+        self.assertAlmostEqual(load_shedding.queue_delay("1700000000250", now), 0.25)
+        self.assertAlmostEqual(load_shedding.queue_delay("t=1700000000250000", now), 0.25)
+        self.assertIsNone(load_shedding.queue_delay("garbage", now))
+        self.assertIsNone(load_shedding.queue_delay(None, now))
+
+
+class RequestCaptureReplayTests(APITestCase):
+    """요청 샘플 기록 미들웨어와 replay_requests 명령 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="capture_user", password="password123")
+        Seat.objects.create(seat_number=90)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        settings_override = override_settings(
+            REQUEST_CAPTURE_SAMPLE_RATE=1.0, REQUEST_CAPTURE_DIR=self.directory
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+    def read_records(self) -> list[dict]:
+        capture.get_writer().close()
+        return capture.read_capture(sorted(self.directory.glob("requests-*.jsonl")))
+
+    def start_server(self, status_code: int = 200) -> str:
+        """요청마다 status_code로 응답하는 재현 대상 서버"""
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def respond(self):
+                self.received.append((self.path, self.headers.get("Authorization")))
+                length = int(self.headers.get("Content-Length") or 0)
+                self.rfile.read(length)
+                self.send_response(status_code)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"{}")
+
+            do_GET = do_POST = respond
+
+            def log_message(self, *args):
+                pass
+
+        Handler.received = self.received = []
+
+        server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    def test_captures_anonymized_requests(self):
+        """요청을 익명화한 사용자와 가린 비밀번호로 기록하는지 테스트"""
+        # Arrange
+        self.client.force_authenticate(user=self.user)
+
+        # Act
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            self.client.post("/api/seats/reserve/", {"seat_number": 90}, format="json")
+        self.client.force_authenticate(user=None)
+        self.client.post(
+            "/api/users/login/",
+            {"username": "capture_user", "password": "password123"},
+            format="json",
+        )
+        self.client.get("/admin/login/")
+
+        # Assert: /api/ 요청만 기록합니다.
+        reserve, login = self.read_records()
+        self.assertEqual(reserve["method"], "POST")
+        self.assertEqual(reserve["path"], "/api/seats/reserve/")
+        self.assertEqual(reserve["body"], {"seat_number": 90})
+        self.assertEqual(reserve["status"], 200)
+        self.assertEqual(reserve["user"], capture.anonymize_user(self.user.pk))
+        self.assertGreater(reserve["duration_ms"], 0)
+        self.assertEqual(login["body"]["password"], capture.REDACTED)
+        self.assertIsNone(login["user"])
+
+    @override_settings(REQUEST_CAPTURE_SAMPLE_RATE=0.0)
+    def test_sampling_disabled(self):
+        """샘플 비율이 0이면 기록 파일을 만들지 않는지 테스트"""
+        self.client.get("/api/seats/")
+
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+    def test_replay_reports_latency_by_endpoint(self):
+        """기록한 요청을 재현하여 엔드포인트별로 처리 시간과 상태 불일치를 집계하는지 테스트"""
+        # Arrange
+        records = [
+            {
+                "ts": 100.0,
+                "method": "GET",
+                "path": "/api/seats/",
+                "query": "",
+                "body": None,
+                "user": None,
+                "status": 200,
+                "duration_ms": 4.0,
+            },
+            {
+                "ts": 100.1,
+                "method": "POST",
+                "path": "/api/seats/reserve/",
+                "query": "",
+                "body": {"seat_number": 90},
+                "user": "u",
+                "status": 409,
+                "duration_ms": 10.0,
+            },
+        ]
+        base_url = self.start_server()
+
+        # Act
+        results = replay.replay(records, base_url, speed=10, concurrency=2)
+        rows = {row["endpoint"]: row for row in replay.summarize(results)}
+
+        # Assert
+        self.assertEqual(set(rows), {"GET seat-list", "POST seat-reserve"})
+        self.assertEqual(rows["GET seat-list"]["status_mismatches"], 0)
+        self.assertEqual(rows["POST seat-reserve"]["status_mismatches"], 1)
+        self.assertEqual(rows["POST seat-reserve"]["captured_p50"], 10.0)
+        self.assertEqual(sum(row["errors"] for row in rows.values()), 0)
+
+    def test_replay_command(self):
+        """replay_requests 명령이 기록 파일을 재현하고 엔드포인트별 표를 출력하는지 테스트"""
+        # Arrange
+        self.client.get("/api/seats/")
+        self.client.get("/api/seats/")
+        paths = [str(path) for path in self.directory.glob("requests-*.jsonl")]
+        self.read_records()
+        base_url = self.start_server()
+        output = StringIO()
+
+        # Act
+        call_command("replay_requests", *paths, base_url=base_url, speed=0, stdout=output)
+
+        # Assert
+        lines = output.getvalue().splitlines()
+        self.assertIn("요청 2개", lines[0])
+        row = next(line for line in lines if line.startswith("GET seat-list"))
+        self.assertEqual(row.split()[2], "2")
+
+    def test_replay_skips_auth_and_maps_users_to_tokens(self):
+        """인증 요청은 건너뛰고, 기록의 사용자마다 토큰 파일의 토큰을 하나씩 붙이는지 테스트"""
+        # Arrange
+        records = [
+            {
+                "ts": 100.0 + index,
+                "method": method,
+                "path": path,
+                "query": "",
+                "body": None,
+                "user": user,
+                "status": 200,
+                "duration_ms": 1.0,
+            }
+            for index, (method, path, user) in enumerate(
+                [
+                    ("POST", "/api/users/login/", None),
+                    ("GET", "/api/users/me/reservations/", "a"),
+                    ("GET", "/api/users/me/reservations/?page=2", "b"),
+                    ("GET", "/api/seats/", "a"),
+                    ("GET", "/api/seats/layout/", None),
+                ]
+            )
+        ]
+        capture_path = self.directory / "capture.jsonl"
+        capture_path.write_text("".join(json.dumps(record) + "\n" for record in records))
+        tokens_path = self.directory / "tokens.jsonl"
+        tokens_path.write_text(
+            '{"username": "u1", "access": "token-1"}\n{"username": "u2", "access": "token-2"}\n'
+        )
+        base_url = self.start_server()
+        output = StringIO()
+
+        # Act
+        call_command(
+            "replay_requests",
+            str(capture_path),
+            base_url=base_url,
+            speed=0,
+            concurrency=1,
+            tokens=tokens_path,
+            stdout=output,
+        )
+
+        # Assert
+        self.assertIn("인증 요청 1개", output.getvalue())
+        self.assertEqual(
+            sorted(self.received),
+            [
+                ("/api/seats/", "Bearer token-1"),
+                ("/api/seats/layout/", None),
+                ("/api/users/me/reservations/", "Bearer token-1"),
+                ("/api/users/me/reservations/?page=2", "Bearer token-2"),
+            ],
+        )
+
+    async def test_async_capture_writes_off_event_loop(self):
+        """비동기 요청의 기록 파일 쓰기가 이벤트 루프 스레드 밖에서 실행되는지 테스트"""
+        # Arrange
+        loop_thread = threading.current_thread()
+        write_threads = []
+        write = capture.CaptureWriter.write
+
+        def recording_write(writer, record):
+            write_threads.append(threading.current_thread())
+            write(writer, record)
+
+        # Act
+        with mock.patch.object(capture.CaptureWriter, "write", recording_write):
+            await self.async_client.get("/api/seats/layout/")
+
+        # Assert
+        self.assertEqual(len(write_threads), 1)
+        self.assertIsNot(write_threads[0], loop_thread)
+
+
+class SQLiteProfileTests(APITestCase):
+    """SQLite 동시성 프로필 테스트"""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_profile_options(self):
+        """WAL, synchronous, BEGIN IMMEDIATE, busy timeout을 Django 옵션으로 만드는지 테스트"""
+        database = sqlite.sqlite_database("db.sqlite3", busy_timeout=3, synchronous="full")
+
+        self.assertEqual(database["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+        self.assertEqual(database["OPTIONS"]["timeout"], 3)
+        self.assertIn("PRAGMA journal_mode=WAL", database["OPTIONS"]["init_command"])
+        self.assertIn("PRAGMA synchronous=FULL", database["OPTIONS"]["init_command"])
+        with self.assertRaises(ValueError):
+            sqlite.sqlite_options(synchronous="sometimes")
+
+    def test_concurrent_reservations_without_lock_errors(self):
+        """프로필을 적용하면 동시 예약이 잠금 오류 없이 모두 처리되는지 테스트"""
+        # Act
+        result = sqlite_benchmark.benchmark_reservations(
+            self.directory / "tuned.sqlite3",
+            sqlite_benchmark.profile_options("tuned"),
+            threads=4,
+            reservations=200,
+            seats=300,
+        )
+
+        # Assert
+        self.assertEqual(result["locked"], 0)
+        self.assertEqual(result["reserved"] + result["conflicts"], 200)
+        self.assertGreater(result["throughput"], 0)
+
+    def test_benchmark_command(self):
+        """benchmark_sqlite 명령이 프로필별 결과 표를 출력하는지 테스트"""
+        output = StringIO()
+
+        call_command(
+            "benchmark_sqlite",
+            profile="tuned",
+            threads=2,
+            reservations=20,
+            seats=50,
+            stdout=output,
+        )
+
+        header, row = output.getvalue().splitlines()
+        self.assertTrue(header.startswith("profile"))
+        self.assertEqual(row.split()[0], "tuned")
+        self.assertEqual(row.split()[3], "0")
@@ -0,0 +1,181 @@
+# seats/timeseries.py
+
+"""
+초당 예약/충돌/실패/취소 횟수 시계열 (워커별 링 버퍼 + 공유 캐시)
+
+metrics.increment()로 기록되는 예약/취소 결과를 초 단위 칸에 더합니다.
+칸은 SEAT_TIMESERIES_WINDOW개로 고정되어 있어 (칸 수 x 시계열 수)만큼의 메모리만 사용하며,
+오래된 초의 칸은 새 초가 들어올 때 덮어씁니다.
+
+워커마다 자신의 링 버퍼를 SEAT_TIMESERIES_PUBLISH_INTERVAL마다 SEAT_TIMESERIES_CACHE 캐시에
+올려 두고, 조회할 때 모든 워커의 값을 초별로 합칩니다. 워커 간에 합치려면 이 캐시가
+워커들이 함께 쓰는 백엔드(기본값 redis)여야 합니다. (locmem이면 현재 워커만 보입니다)
+
+워커별 링 버퍼는 그 워커만 쓰므로 경쟁이 없지만, 워커 목록은 읽고-고쳐-쓰기로 갱신하므로
+두 워커가 동시에 등록하면 한쪽이 빠질 수 있습니다. 빠진 워커는 다음 publish 때 다시 등록되므로
+조회 결과에서 최대 SEAT_TIMESERIES_PUBLISH_INTERVAL 동안만 누락됩니다.
+"""
+
+import os
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+
+DEFAULT_WINDOW = 300
+DEFAULT_PUBLISH_INTERVAL = 1.0
+DEFAULT_CACHE = "default"
+KEY_PREFIX = "seat_timeseries"
+
+# metrics 카운터 이름 -> 시계열 이름
+METRIC_SERIES = {
+    "reserve.success": "reserved",
+    "reserve.already_reserved": "conflicts",
+    "reserve.version_conflict": "conflicts",
+    "cancel.version_conflict": "conflicts",
+    "reserve.failure": "failures",
+    "cancel.success": "cancelled",
+}
+SERIES = ("reserved", "conflicts", "failures", "cancelled")
+
+
+class RingBuffer:
+    """최근 window초의 시계열별 초당 횟수"""
+
+    def __init__(self, window: int = DEFAULT_WINDOW):
+        self.window = window
+        # 각 칸이 어느 초(epoch)의 값인지 기록합니다.
+        self._seconds = [-1] * window
+        self._counts = {name: [0] * window for name in SERIES}
+        self._lock = threading.Lock()
+
+    def add(self, series: str, amount: int, now: float) -> None:
+        second = int(now)
+        slot = second % self.window
+        with self._lock:
+            if self._seconds[slot] != second:
+                self._seconds[slot] = second
+                for counts in self._counts.values():
+                    counts[slot] = 0
+            self._counts[series][slot] += amount
+
+    def snapshot(self, now: float) -> dict[int, dict[str, int]]:
+        """{초: {시계열: 횟수}} (최근 window초 중 값이 있는 초만)"""
+        oldest = int(now) - self.window + 1
+        with self._lock:
+            return {
+                second: {name: counts[slot] for name, counts in self._counts.items()}
+                for slot, second in enumerate(self._seconds)
+                if second >= oldest
+            }
+
+
+class TimeSeries:
+    def __init__(
+        self,
+        window: int = DEFAULT_WINDOW,
+        publish_interval: float = DEFAULT_PUBLISH_INTERVAL,
+        cache_alias: str = DEFAULT_CACHE,
+        worker_id: str | None = None,
+        clock=time.time,
+    ):
+        self.buffer = RingBuffer(window)
+        self.publish_interval = publish_interval
+        self.cache_alias = cache_alias
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.clock = clock
+        self._published_at = 0.0
+
+    @property
+    def window(self) -> int:
+        return self.buffer.window
+
+    def record(self, series: str, amount: int = 1) -> None:
+        now = self.clock()
+        self.buffer.add(series, amount, now)
+        if now - self._published_at >= self.publish_interval:
+            self.publish(now)
+
+    def publish(self, now: float | None = None) -> None:
+        """이 워커의 링 버퍼를 공유 캐시에 올리고 워커 목록에 등록합니다."""
+        now = self.clock() if now is None else now
+        self._published_at = now
+        cache = caches[self.cache_alias]
+        cache.set(self._worker_key(), self.buffer.snapshot(now), self.window)
+
+        workers = cache.get(self._workers_key()) or {}
+        oldest = now - self.window
+        if self.worker_id not in workers or workers[self.worker_id] < now - 1:
+            workers = {w: seen for w, seen in workers.items() if seen >= oldest}
+            workers[self.worker_id] = now
+            cache.set(self._workers_key(), workers, self.window)
+
+    def merged(self, seconds: int) -> dict:
+        """
+        모든 워커의 최근 seconds초 시계열을 합칩니다.
+        series의 각 목록은 start초부터 1초 간격의 값입니다.
+        """
+        now = self.clock()
+        self.publish(now)
+        seconds = max(1, min(seconds, self.window))
+        end = int(now)
+        start = end - seconds + 1
+
+        cache = caches[self.cache_alias]
+        workers = cache.get(self._workers_key()) or {}
+        snapshots = cache.get_many([self._worker_key(w) for w in workers]).values()
+
+        series = {name: [0] * seconds for name in SERIES}
+        for snapshot in snapshots:
+            for second, counts in snapshot.items():
+                if start <= second <= end:
+                    for name, count in counts.items():
+                        series[name][second - start] += count
+        return {
+            "start": start,
+            "interval": 1,
+            "workers": len(snapshots),
+            "series": series,
+        }
+
+    def _workers_key(self) -> str:
+        return f"{KEY_PREFIX}:workers"
+
+    def _worker_key(self, worker_id: str | None = None) -> str:
+        return f"{KEY_PREFIX}:worker:{worker_id or self.worker_id}"
+
+
+_series: TimeSeries | None = None
+_series_lock = threading.Lock()
+
+
+def get_series() -> TimeSeries:
+    global _series
+    if _series is None:
+        with _series_lock:
+            if _series is None:
+                _series = TimeSeries(
+                    window=getattr(settings, "SEAT_TIMESERIES_WINDOW", DEFAULT_WINDOW),
+                    publish_interval=getattr(
+                        settings,
+                        "SEAT_TIMESERIES_PUBLISH_INTERVAL",
+                        DEFAULT_PUBLISH_INTERVAL,
+                    ),
+                    cache_alias=getattr(settings, "SEAT_TIMESERIES_CACHE", DEFAULT_CACHE),
+                )
+    return _series
+
+
+def record_metric(name: str, amount: int = 1) -> None:
+    """metrics 카운터 중 시계열로 보는 항목만 기록합니다."""
+    series = METRIC_SERIES.get(name)
+    if series is not None:
+        get_series().record(series, amount)
+
+
+def reset() -> None:
+    global _series
+    with _series_lock:
+        _series = None
@@ -3,15 +3,61 @@
 from django.urls import path
 
 from .views import (
+    AnySeatReserveView,
+    BestAvailableReserveView,
+    FaultInjectionView,
     ReserveSeatView,
+    SeatAvailabilityView,
     SeatCancelView,
+    SeatChangesView,
+    SeatExportView,
+    SeatLayoutContentView,
+    SeatLayoutView,
     SeatListView,
+    SeatMetricsView,
+    SeatResetJobStatusView,
     SeatResetView,
+    SeatTimeSeriesView,
 )
 
 urlpatterns = [
     path("seats/", SeatListView.as_view(), name="seat-list"),
+    path("seats/changes/", SeatChangesView.as_view(), name="seat-changes"),
+    path("seats/layout/", SeatLayoutView.as_view(), name="seat-layout"),
+    path(
+        "seats/layout/<str:layout_hash>/",
+        SeatLayoutContentView.as_view(),
+        name="seat-layout-content",
+    ),
+    path(
+        "seats/availability/",
+        SeatAvailabilityView.as_view(),
+        name="seat-availability",
+    ),
     path("seats/reserve/", ReserveSeatView.as_view(), name="seat-reserve"),
+    path(
+        "seats/reserve/best-available/",
+        BestAvailableReserveView.as_view(),
+        name="seat-reserve-best-available",
+    ),
+    path("seats/reserve/any/", AnySeatReserveView.as_view(), name="seat-reserve-any"),
+    path("seats/metrics/", SeatMetricsView.as_view(), name="seat-metrics"),
+    path(
+        "seats/metrics/timeseries/",
+        SeatTimeSeriesView.as_view(),
+        name="seat-metrics-timeseries",
+    ),
+    path("seats/faults/", FaultInjectionView.as_view(), name="seat-faults"),
+    path(
+        "seats/export/<str:export_format>/",
+        SeatExportView.as_view(),
+        name="seat-export",
+    ),
     path("seats/reset/", SeatResetView.as_view(), name="seat-reset"),
-    path("seats/<str:seat_number>/cancel/", SeatCancelView.as_view(), name="seat-cancel"),
+    path(
+        "seats/reset/jobs/<int:job_id>/",
+        SeatResetJobStatusView.as_view(),
+        name="seat-reset-job",
+    ),
+    path("seats/<int:seat_number>/cancel/", SeatCancelView.as_view(), name="seat-cancel"),
 ]
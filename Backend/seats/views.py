@@ -1,35 +1,176 @@
 # reservations/views.py
 
-import random
+import time
 
-from django.db import transaction
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
-from drf_spectacular.utils import extend_schema
+from django.urls import reverse
+from django.views import View
 from rest_framework import generics, status
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from .models import Seat
+from config import load_shedding
+from config.db_router import ReplicaReadMixin, pin_to_primary
+from config.schema import extend_schema
+
+from . import (
+    allocation,
+    batching,
+    export,
+    faults,
+    history,
+    layout,
+    metrics,
+    quotas,
+    reset_jobs,
+    seatmap,
+    sequencer,
+    sharding,
+    signals,
+    timeseries,
+)
+from .concurrency import VersionConflict, retry_on_conflict, update_seat_if_unchanged
+from .models import Seat, SeatResetJob
 from .permissions import IsOwnerOrAdmin
-from .serializers import ReservationSerializer, SeatSerializer
+from .serializers import (
+    BestAvailableSerializer,
+    FaultConfigSerializer,
+    ReservationSerializer,
+    SeatResetJobSerializer,
+    SeatSerializer,
+)
+
+
+def _quota_exceeded_response():
+    metrics.increment("reserve.quota_exceeded")
+    return Response(
+        {"error": "한 사용자가 예약할 수 있는 최대 좌석 수를 넘었습니다."},
+        status=status.HTTP_409_CONFLICT,
+    )
 
 
 # 1. 좌석 목록 조회 API
-class SeatListView(generics.ListAPIView):
+class SeatListView(ReplicaReadMixin, generics.ListAPIView):
     """
     모든 좌석의 목록과 예약 상태를 반환합니다.
+    - 읽기 전용 API이므로 복제본이 설정되어 있으면 복제본에서 조회합니다.
+    - 좌석 배치도가 바뀔 때만 스냅샷을 새로 만들고, 미리 압축해 둔 본문을 그대로 응답합니다.
     """
 
     queryset = Seat.objects.all().order_by("seat_number")
     serializer_class = SeatSerializer
 
+    def list(self, request, *args, **kwargs):
+        snapshot = seatmap.get_snapshot()
+        if request.accepted_renderer.format != "json":
+            # 브라우저블 API 등 JSON이 아닌 렌더러는 기존 방식대로 렌더링합니다.
+            return Response(snapshot.data)
+        return seatmap.SnapshotResponse(snapshot, request)
+
+
+class SeatChangesView(View):
+    """
+    좌석 배치도가 바뀔 때까지 기다렸다가 새 버전과 변경분을 반환합니다. (롱 폴링)
+    - version: 클라이언트가 가진 배치도 버전 (X-Seat-Map-Version 또는 이전 응답의 version)
+    - timeout: 최대 대기 시간(초). 그동안 바뀌지 않으면 같은 버전과 빈 변경분을 반환합니다.
+    - 비동기 뷰이므로 ASGI에서는 기다리는 동안 워커 스레드를 점유하지 않습니다.
+    """
+
+    async def get(self, request, *args, **kwargs):
+        max_timeout = getattr(settings, "SEAT_MAP_LONG_POLL_MAX_TIMEOUT", 60.0)
+        try:
+            since = int(request.GET["version"])
+            timeout = float(
+                request.GET.get("timeout", getattr(settings, "SEAT_MAP_LONG_POLL_TIMEOUT", 25.0))
+            )
+        except (KeyError, ValueError):
+            since, timeout = -1, -1.0
+        if since < 0 or not 0 <= timeout <= max_timeout:
+            return JsonResponse(
+                {"error": f"version(0 이상의 정수)과 timeout(0~{max_timeout:g}초)을 확인해주세요."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # 다른 워커의 변경은 알림이 오지 않으므로 SEAT_MAP_MAX_AGE마다 공유 버전을 다시 확인합니다.
+        recheck = max(getattr(settings, "SEAT_MAP_MAX_AGE", 5.0), 0.1)
+        deadline = time.monotonic() + timeout
+        while True:
+            snapshot = await sync_to_async(seatmap.get_latest_snapshot)()
+            remaining = deadline - time.monotonic()
+            if snapshot.version != since or remaining <= 0:
+                break
+            await seatmap.wait_for_change(snapshot.version, min(remaining, recheck))
+
+        response = JsonResponse(seatmap.changes_since(snapshot, since))
+        response[seatmap.VERSION_HEADER] = str(snapshot.version)
+        response["Cache-Control"] = "no-store"
+        return response
+
+
+class SeatLayoutView(ReplicaReadMixin, APIView):
+    """
+    현재 좌석 배치의 해시와 배치를 받을 URL을 반환합니다.
+    - 배치 본문은 URL에 해시가 들어 있어 영구 캐시할 수 있으므로, 클라이언트는 해시가 바뀔 때만
+      배치를 다시 받으면 됩니다.
+    """
+
+    @extend_schema(summary="Seat Layout Version")
+    def get(self, request, *args, **kwargs):
+        digest = layout.get_layout(seatmap.get_snapshot()).digest
+        response = Response(
+            {
+                "hash": digest,
+                "url": reverse("seat-layout-content", kwargs={"layout_hash": digest}),
+            }
+        )
+        response["Cache-Control"] = "no-cache"
+        return response
+
+
+class SeatLayoutContentView(ReplicaReadMixin, APIView):
+    """
+    좌석 배치(구역, 행, 좌표, 이름)를 반환합니다.
+    - 내용이 바뀌지 않는 URL이므로 immutable 캐시 헤더로 응답합니다.
+    - 현재 배치의 해시가 아니면 404를 반환합니다. (SeatLayoutView에서 새 URL을 받습니다)
+    """
+
+    @extend_schema(summary="Seat Layout", responses={200: None})
+    def get(self, request, layout_hash, *args, **kwargs):
+        current = layout.get_layout(seatmap.get_snapshot())
+        if layout_hash != current.digest:
+            return Response(
+                {"error": "좌석 배치가 바뀌었습니다. 새 배치 주소를 받아주세요."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        return current.body.response(request, layout.IMMUTABLE_CACHE_CONTROL)
+
+
+class SeatAvailabilityView(ReplicaReadMixin, APIView):
+    """
+    예약된 좌석 번호 목록만 반환합니다. (배치 정보 없음)
+    - layout은 이 상태가 기준으로 한 배치의 해시입니다. 가진 배치와 다르면 배치를 다시 받습니다.
+    """
+
+    @extend_schema(summary="Seat Availability", responses={200: None})
+    def get(self, request, *args, **kwargs):
+        snapshot = seatmap.get_snapshot()
+        response = layout.get_availability(snapshot).response(request)
+        response[seatmap.VERSION_HEADER] = str(snapshot.version)
+        return response
+
 
 # 2. 좌석 예약 요청 API
 class ReserveSeatView(APIView):
     """
     특정 좌석을 예약합니다.
-    - 99% 확률로 성공, 1% 확률로 실패합니다.
+    - SEAT_FAULT_RULES의 reserve 규칙에 따라 일부 요청을 실패시킵니다. (기본 1%)
+    - 좌석을 읽은 뒤 다른 요청이 먼저 좌석을 바꿨다면(version 불일치) 잠시 후 다시 시도합니다.
+    - SEAT_RESERVATION_BATCHING이 켜져 있으면 동시 요청들을 모아 한 번에 커밋합니다.
+    - SEAT_RESERVATION_SEQUENCER가 켜져 있으면 좌석 파티션의 단일 writer가 순서대로 씁니다.
     """
 
     permission_classes = [IsAuthenticated]  # 인증된 사용자만 예약 가능
@@ -41,48 +182,206 @@ class ReserveSeatView(APIView):
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
         seat_number = serializer.validated_data["seat_number"]
+        # 좌석을 소유한 샤드에서 조회/갱신합니다.
+        shard = sharding.shard_for_seat(seat_number)
+
+        if sequencer.is_enabled():
+            return self._reserve_queued(request, shard, seat_number, sequencer.reserve)
+        if batching.is_enabled():
+            return self._reserve_queued(request, shard, seat_number, batching.reserve)
 
         try:
-            # 트랜잭션 시작: 블록 내의 모든 DB 작업이 하나의 단위로 처리됨
-            with transaction.atomic():
-                seat = Seat.objects.get(seat_number=seat_number)
-
-                if seat.is_reserved:
-                    return Response(
-                        {"error": "이미 예약된 좌석입니다."},
-                        status=status.HTTP_409_CONFLICT,  # 409 Conflict: 리소스의 현재 상태와 충돌
-                    )
-
-                # 1% 확률로 의도적 실패 처리
-                if random.random() < 0.01:
-                    return Response(
-                        {
-                            "error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."
-                        },
-                        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                    )
-
-                # 예약 성공 처리
-                seat.is_reserved = True
-                seat.reserved_by = request.user
-                seat.save()
+            return retry_on_conflict(
+                lambda: self._reserve(request, shard, seat_number), operation="reserve"
+            )
+        except VersionConflict:
+            return Response(
+                {"error": "다른 요청과 충돌하여 예약하지 못했습니다. 다시 시도해주세요."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        except Seat.DoesNotExist:
+            return Response(
+                {"error": "존재하지 않는 좌석입니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        except quotas.QuotaExceeded:
+            return _quota_exceeded_response()
+
+    def _reserve_queued(self, request, shard, seat_number, submit):
+        """
+        그룹 커밋/시퀀서 모드: 요청을 큐에 넘기고(submit) 처리된 결과를 응답으로 바꿉니다.
+        """
+        # 장애 주입: 의도적 실패 처리 (큐에 넣기 전에 판정합니다)
+        if faults.inject("reserve"):
+            metrics.increment("reserve.failure")
+            return Response(
+                {"error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        result = submit(shard, seat_number, request.user)
+        if result == batching.RESERVED:
+            metrics.increment("reserve.success")
+            pin_to_primary(request.user)
+            return Response(
+                {"message": f"좌석 {seat_number}번이 성공적으로 예약되었습니다."},
+                status=status.HTTP_200_OK,
+            )
+        if result == batching.ALREADY_RESERVED:
+            metrics.increment("reserve.already_reserved")
+            return Response({"error": "이미 예약된 좌석입니다."}, status=status.HTTP_409_CONFLICT)
+        if result == batching.NOT_FOUND:
+            return Response(
+                {"error": "존재하지 않는 좌석입니다."}, status=status.HTTP_404_NOT_FOUND
+            )
+        if result == batching.QUOTA_EXCEEDED:
+            return _quota_exceeded_response()
 
+        metrics.increment("reserve.failure")
+        return Response(
+            {"error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    def _reserve(self, request, shard, seat_number):
+        # 트랜잭션 시작: 좌석(shard)과 예약 카운터(primary) 변경이 하나의 단위로 처리됨
+        with quotas.atomic(shard):
+            seat = Seat.objects.using(shard).get(seat_number=seat_number)
+
+            if seat.is_reserved:
+                metrics.increment("reserve.already_reserved")
                 return Response(
-                    {
-                        "message": f"좌석 {seat.seat_number}번이 성공적으로 예약되었습니다."
-                    },
-                    status=status.HTTP_200_OK,
+                    {"error": "이미 예약된 좌석입니다."},
+                    status=status.HTTP_409_CONFLICT,  # 409 Conflict: 리소스의 현재 상태와 충돌
                 )
 
-        except Seat.DoesNotExist:
+            # 장애 주입: 의도적 실패 처리 (기본 1%)
+            if faults.inject("reserve"):
+                metrics.increment("reserve.failure")
+                return Response(
+                    {"error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."},
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
+
+            # 예약 성공 처리: 읽은 뒤 좌석이 바뀌지 않았을 때만 반영됩니다.
+            update_seat_if_unchanged(seat, is_reserved=True, reserved_by=request.user)
+            # 상한을 넘으면 QuotaExceeded로 좌석 변경까지 되돌립니다.
+            quotas.acquire(request.user.pk)
+            history.record(history.RESERVED, {request.user.pk: [seat.seat_number]})
+            signals.send_on_commit(
+                signals.seats_reserved,
+                using=shard,
+                seat_numbers=[seat.seat_number],
+                user_id=request.user.pk,
+            )
+
+        metrics.increment("reserve.success")
+        # 방금 예약한 좌석이 내 예약 목록에 바로 보이도록 primary에 고정합니다.
+        pin_to_primary(request.user)
+
+        return Response(
+            {"message": f"좌석 {seat.seat_number}번이 성공적으로 예약되었습니다."},
+            status=status.HTTP_200_OK,
+        )
+
+
+class BestAvailableReserveView(APIView):
+    """
+    연속된 빈 좌석 N개를 자동으로 골라 한 번에 예약합니다.
+    - 앞 행을 우선하고, 같은 행에서는 가운데에 가까운 블록을 배정합니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=BestAvailableSerializer,
+        summary="Reserve Best Available Seats",
+        description="요청한 수만큼의 연속된 빈 좌석 중 가장 좋은 블록을 원자적으로 예약합니다.",
+    )
+    def post(self, request, *args, **kwargs):
+        serializer = BestAvailableSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        if faults.inject("reserve_best_available"):
             return Response(
-                {"error": "존재하지 않는 좌석입니다."}, status=status.HTTP_404_NOT_FOUND
+                {"error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        try:
+            seat_numbers = allocation.reserve_best_available(
+                request.user, serializer.validated_data["count"]
+            )
+        except quotas.QuotaExceeded:
+            return _quota_exceeded_response()
+        if seat_numbers is None:
+            return Response(
+                {"error": "요청한 수만큼 연속된 빈 좌석이 없습니다."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        pin_to_primary(request.user)
+        seat_labels = ", ".join(map(str, seat_numbers))
+        return Response(
+            {
+                "message": f"좌석 {seat_labels}번이 성공적으로 예약되었습니다.",
+                "seat_numbers": seat_numbers,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class AnySeatReserveView(APIView):
+    """
+    좌석을 지정하지 않고 아무 빈 좌석 하나를 예약합니다. (자유석 판매용)
+    - 다른 구매자가 잠근 좌석은 기다리지 않고 건너뜁니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=None,
+        summary="Reserve Any Available Seat",
+        description="빈 좌석 중 하나를 자동으로 골라 예약합니다.",
+    )
+    def post(self, request, *args, **kwargs):
+        if faults.inject("reserve_any"):
+            return Response(
+                {"error": "서버 오류로 예약에 실패했습니다. 다시 시도해주세요."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
+        try:
+            seat_number = allocation.reserve_any_available(request.user)
+        except quotas.QuotaExceeded:
+            return _quota_exceeded_response()
+        except VersionConflict:
+            # 빈 좌석은 남아 있지만 매번 다른 요청이 먼저 가져갔습니다. (매진이 아님)
+            return Response(
+                {"error": "다른 요청과 충돌하여 예약하지 못했습니다. 다시 시도해주세요."},
+                status=status.HTTP_409_CONFLICT,
+            )
+        if seat_number is None:
+            return Response(
+                {"error": "예약 가능한 좌석이 없습니다."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        pin_to_primary(request.user)
+        return Response(
+            {
+                "message": f"좌석 {seat_number}번이 성공적으로 예약되었습니다.",
+                "seat_number": seat_number,
+            },
+            status=status.HTTP_200_OK,
+        )
+
 
 class SeatResetView(APIView):
     """
     모든 좌석의 예약 상태를 초기화합니다. (관리자 전용)
+    - 좌석 번호 범위 단위로 나누어 청크마다 커밋하므로, 초기화 중에도 예약 요청이 멈추지 않습니다.
+    - 중단된 작업이 있으면 새 작업을 만들지 않고 마지막 커밋 지점부터 재개합니다.
     """
 
     # 이 API는 관리자 권한을 가진 유저만 접근할 수 있습니다.
@@ -90,21 +389,64 @@ class SeatResetView(APIView):
 
     @extend_schema(
         summary="Reset All Seats",
-        description="모든 좌석의 'is_reserved' 상태를 false, 'reserved_by'를 null로 초기화.",
+        description=(
+            "모든 좌석의 'is_reserved' 상태를 false, 'reserved_by'를 null로 "
+            "초기화하는 작업을 시작합니다. 백그라운드로 실행되면 202와 작업 정보를 반환합니다."
+        ),
+        responses={200: SeatResetJobSerializer, 202: SeatResetJobSerializer},
     )
     def post(self, request, *args, **kwargs):
         """
-        모든 좌석의 예약 상태를 초기화합니다.
+        좌석 초기화 작업을 생성(또는 재개)하고 실행합니다.
         """
-        # .update()는 여러 객체를 한 번의 쿼리로 효율적으로 업데이트합니다.
-        updated_count = Seat.objects.all().update(is_reserved=False, reserved_by=None)
+        job, _ = reset_jobs.get_or_create_job(request.user)
+        job = reset_jobs.dispatch_job(job)
+
+        if job.is_active:
+            return Response(
+                {
+                    "message": "좌석 초기화 작업을 시작했습니다.",
+                    "job": SeatResetJobSerializer(job).data,
+                },
+                status=status.HTTP_202_ACCEPTED,
+            )
+
+        if job.status == SeatResetJob.Status.FAILED:
+            return Response(
+                {
+                    "error": "좌석 초기화 작업이 실패했습니다.",
+                    "job": SeatResetJobSerializer(job).data,
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
 
         return Response(
-            {"message": f"성공적으로 {updated_count}개의 좌석을 초기화했습니다."},
+            {
+                "message": f"성공적으로 {job.reset_count}개의 좌석을 초기화했습니다.",
+                "job": SeatResetJobSerializer(job).data,
+            },
             status=status.HTTP_200_OK,
         )
 
 
+class SeatResetJobStatusView(generics.RetrieveAPIView):
+    """
+    좌석 초기화 작업의 진행 상태를 반환합니다. (관리자 전용)
+    """
+
+    queryset = SeatResetJob.objects.all()
+    serializer_class = SeatResetJobSerializer
+    permission_classes = [IsAdminUser]
+    lookup_url_kwarg = "job_id"
+
+    @extend_schema(
+        summary="Seat Reset Job Status",
+        description="좌석 초기화 작업의 상태와 진행률을 조회합니다.",
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+
 class SeatCancelView(APIView):
     """
     특정 좌석의 예약을 취소합니다.
@@ -122,8 +464,26 @@ class SeatCancelView(APIView):
         """
         URL로 전달받은 seat_number의 좌석 예약을 취소합니다.
         """
+        if faults.inject("cancel"):
+            return Response(
+                {"error": "서버 오류로 취소에 실패했습니다. 다시 시도해주세요."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+        shard = sharding.shard_for_seat(seat_number)
+        try:
+            return retry_on_conflict(
+                lambda: self._cancel(request, shard, seat_number), operation="cancel"
+            )
+        except VersionConflict:
+            return Response(
+                {"error": "다른 요청과 충돌하여 취소하지 못했습니다. 다시 시도해주세요."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+    def _cancel(self, request, shard, seat_number):
         # 1. 좌석 번호로 객체를 찾습니다. 없으면 404 에러를 반환합니다.
-        seat = get_object_or_404(Seat, seat_number=seat_number)
+        seat = get_object_or_404(Seat.objects.using(shard), seat_number=seat_number)
 
         # 2. DRF가 이 객체(seat)를 IsOwnerOrAdmin 권한 클래스에 전달하여 자동으로 권한을 확인합니다.
         #    권한이 없으면 여기서 403 Forbidden 에러가 발생하며 코드가 중단됩니다.
@@ -136,14 +496,135 @@ class SeatCancelView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        # 4. 예약 취소 처리
-        seat.is_reserved = False
-        seat.reserved_by = None
-        seat.save()
+        # 4. 예약 취소 처리: 읽은 뒤 좌석이 바뀌지 않았을 때만 반영됩니다.
+        #    예약자의 예약 카운터도 같은 트랜잭션에서 줄입니다.
+        reserved_by_id = seat.reserved_by_id
+        with quotas.atomic(shard):
+            update_seat_if_unchanged(seat, is_reserved=False, reserved_by=None)
+            quotas.release(reserved_by_id)
+            history.record(history.RELEASED, {reserved_by_id: [seat.seat_number]})
+            signals.send_on_commit(
+                signals.seats_released,
+                using=shard,
+                seat_numbers=[seat.seat_number],
+                user_id=reserved_by_id,
+            )
+        metrics.increment("cancel.success")
+        pin_to_primary(request.user)
 
         return Response(
-            {
-                "message": f"좌석 {seat.seat_number}번의 예약이 성공적으로 취소되었습니다."
-            },
+            {"message": f"좌석 {seat.seat_number}번의 예약이 성공적으로 취소되었습니다."},
             status=status.HTTP_200_OK,
         )
+
+
+class SeatMetricsView(APIView):
+    """
+    예약/취소 결과별 카운터와 부하 차단 상태를 반환합니다. (관리자 전용, 현재 워커 기준)
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Reservation Metrics",
+        description=(
+            "예약 성공, 이미 예약됨, 버전 충돌 등 결과별 누적 횟수와 "
+            "부하 차단의 현재 limit, 등급별 처리 중/거절 요청 수를 조회합니다."
+        ),
+    )
+    def get(self, request, *args, **kwargs):
+        return Response({"counters": metrics.snapshot(), "load_shedding": load_shedding.snapshot()})
+
+
+class SeatExportView(ReplicaReadMixin, APIView):
+    """
+    좌석별 예약 현황(예약자 username 포함)을 CSV 또는 NDJSON으로 내려받습니다. (관리자 전용)
+    - 좌석을 청크 단위로 읽어 바로 스트리밍하므로 좌석 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Export Reservations",
+        description=(
+            "export_format은 csv 또는 ndjson입니다. reserved=true이면 예약된 좌석만 내보냅니다."
+        ),
+        responses={200: None},
+    )
+    def get(self, request, export_format, *args, **kwargs):
+        if export_format not in export.CONTENT_TYPES:
+            return Response(
+                {"error": "지원하지 않는 형식입니다. (csv, ndjson)"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        databases, user_database = export.get_read_databases()
+        rows = export.iter_reservations(
+            reserved_only=request.query_params.get("reserved") == "true",
+            databases=databases,
+            user_database=user_database,
+        )
+        response = StreamingHttpResponse(
+            export.render(rows, export_format),
+            content_type=export.CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="reservations.{export_format}"'
+        return response
+
+
+class SeatTimeSeriesView(APIView):
+    """
+    최근 초당 예약/충돌/실패/취소 횟수를 반환합니다. (관리자 전용, 모든 워커 합계)
+
+    워커 합계는 SEAT_TIMESERIES_CACHE가 워커들이 함께 쓰는 캐시(기본값 redis)일 때만 맞습니다.
+    locmem이면 이 요청을 받은 워커의 값만 반환합니다. 응답의 workers가 합친 워커 수입니다.
+    워커 목록 갱신은 원자적이지 않아, 막 시작한 워커가 다음 publish 전까지 빠질 수 있습니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Reservation Rate Time Series",
+        description=(
+            "seconds(기본 60초, 최대 SEAT_TIMESERIES_WINDOW초) 동안의 초당 횟수를 "
+            "시계열별 목록으로 반환합니다."
+        ),
+    )
+    def get(self, request, *args, **kwargs):
+        try:
+            seconds = int(request.query_params.get("seconds", 60))
+        except ValueError:
+            return Response(
+                {"error": "seconds는 정수여야 합니다."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(timeseries.get_series().merged(seconds))
+
+
+class FaultInjectionView(APIView):
+    """
+    장애 주입 설정을 조회/변경합니다. (관리자 전용, 현재 워커 기준)
+    - 설정을 바꾸면 장애 구간의 기준 시각과 시드 난수열이 처음부터 다시 시작됩니다.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    @extend_schema(
+        summary="Fault Injection Settings",
+        description="주입 지점별 실패 확률, 지연, 장애 구간과 시드를 조회합니다.",
+    )
+    def get(self, request, *args, **kwargs):
+        return Response(faults.get_config())
+
+    @extend_schema(
+        request=FaultConfigSerializer,
+        summary="Update Fault Injection Settings",
+        description="장애 주입 설정을 통째로 바꿉니다. enabled가 false이면 주입을 끕니다.",
+    )
+    def put(self, request, *args, **kwargs):
+        serializer = FaultConfigSerializer(data=request.data)
+        if not serializer.is_valid():
+            return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+        faults.configure(**serializer.validated_data)
+        return Response(faults.get_config())
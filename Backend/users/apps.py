@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "users"
+
+    def ready(self):
+        # 내 예약 목록 캐시의 무효화 시그널 수신자를 등록합니다.
+        from . import reservation_cache  # noqa: F401
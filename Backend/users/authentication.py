@@ -0,0 +1,16 @@
+# users/authentication.py
+
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from . import revocation
+
+
+class RevocableJWTAuthentication(JWTAuthentication):
+    """로그아웃으로 폐기된 토큰을 거부하는 JWT 인증 (users/revocation.py 참고)"""
+
+    def get_validated_token(self, raw_token):
+        token = super().get_validated_token(raw_token)
+        if revocation.is_revoked(token):
+            raise InvalidToken("Token has been revoked")
+        return token
@@ -0,0 +1,176 @@
+# users/management/commands/provision_users.py
+
+import csv
+import json
+from datetime import timedelta
+from itertools import islice
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework_simplejwt.tokens import AccessToken
+
+
+class Command(BaseCommand):
+    help = (
+        "CSV 또는 JSONL 파일의 사용자들을 배치 단위로 한 번에 생성합니다. "
+        "각 행은 username과 password(평문) 또는 password_hash(Django 해시 형식)를 가집니다."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=Path, help="사용자 목록 파일 (.csv 또는 .jsonl)")
+        parser.add_argument(
+            "--format",
+            choices=["csv", "jsonl"],
+            help="파일 형식 (기본값: 확장자로 판단)",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000, help="한 번에 INSERT할 사용자 수"
+        )
+        parser.add_argument(
+            "--skip-existing",
+            action="store_true",
+            help="이미 있는 username은 오류 대신 건너뜁니다.",
+        )
+        parser.add_argument(
+            "--hasher",
+            help="평문 비밀번호를 해싱할 PASSWORD_HASHERS의 알고리즘 이름 (기본값: 첫 번째 해셔)",
+        )
+        parser.add_argument(
+            "--tokens-out",
+            type=Path,
+            help=(
+                "이번 실행에서 생성한 사용자의 JWT access 토큰을 JSONL로 저장할 파일 "
+                "(DEBUG 환경에서만 허용, --skip-existing으로 건너뛴 사용자는 제외)"
+            ),
+        )
+        parser.add_argument(
+            "--token-lifetime",
+            type=int,
+            default=60,
+            help="발급할 access 토큰의 유효 시간(분)",
+        )
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        if not path.exists():
+            raise CommandError(f"파일을 찾을 수 없습니다: {path}")
+        if options["tokens_out"] and not settings.DEBUG:
+            raise CommandError("토큰 파일은 DEBUG 환경(테스트/부하 테스트)에서만 만들 수 있습니다.")
+        if options["hasher"]:
+            try:
+                get_hasher(options["hasher"])
+            except ValueError as exc:
+                raise CommandError(str(exc)) from exc
+
+        file_format = options["format"] or ("csv" if path.suffix == ".csv" else "jsonl")
+        batch_size = options["batch_size"]
+        lifetime = timedelta(minutes=options["token_lifetime"])
+
+        before = User.objects.count()
+        token_count = 0
+        token_file = options["tokens_out"].open("w") if options["tokens_out"] else None
+        try:
+            with path.open(newline="") as source:
+                rows = read_rows(source, file_format)
+                line_number = 1
+                while batch := list(islice(rows, batch_size)):
+                    users = [
+                        build_user(row, line_number + offset, options["hasher"])
+                        for offset, row in enumerate(batch)
+                    ]
+                    line_number += len(batch)
+                    created_users = self.create_batch(users, options["skip_existing"])
+                    if token_file is not None:
+                        token_count += write_tokens(token_file, created_users, lifetime)
+        finally:
+            if token_file is not None:
+                token_file.close()
+
+        created = User.objects.count() - before
+        self.stdout.write(f"사용자 {created}명을 생성했습니다.")
+        if token_file is not None:
+            self.stdout.write(
+                f"access 토큰 {token_count}개를 저장했습니다: {options['tokens_out']}"
+            )
+
+    def create_batch(self, users: list[User], skip_existing: bool) -> list[User]:
+        """배치를 한 번에 INSERT하고, 이번에 실제로 생성한 사용자 목록을 반환합니다."""
+        try:
+            with transaction.atomic():
+                created = exclude_existing(users) if skip_existing else users
+                # 충돌을 무시하면 어떤 행이 들어갔는지 알 수 없으므로, 건너뛸 사용자는 미리 빼고
+                # 그 사이 다른 곳에서 만든 username은 오류로 처리합니다.
+                User.objects.bulk_create(created)
+        except Exception as exc:
+            raise CommandError(
+                f"사용자 생성에 실패했습니다 ({users[0].username} 부터 {len(users)}명): {exc}"
+            ) from exc
+        return created
+
+
+def read_rows(source, file_format: str):
+    if file_format == "csv":
+        yield from csv.DictReader(source)
+        return
+    for line in source:
+        if line.strip():
+            yield json.loads(line)
+
+
+def build_user(row: dict, line_number: int, hasher: str | None) -> User:
+    username = (row.get("username") or "").strip()
+    if not username:
+        raise CommandError(f"{line_number}번째 사용자에 username이 없습니다.")
+
+    password_hash = row.get("password_hash")
+    if password_hash:
+        # 미리 해싱된 비밀번호는 형식만 확인하고 그대로 저장합니다.
+        try:
+            identify_hasher(password_hash)
+        except ValueError as exc:
+            raise CommandError(
+                f"{line_number}번째 사용자({username})의 password_hash 형식을 알 수 없습니다."
+            ) from exc
+    else:
+        # 비밀번호가 없으면 로그인할 수 없는 사용자로 만듭니다.
+        password_hash = make_password(row.get("password") or None, hasher=hasher or "default")
+
+    return User(
+        username=username,
+        email=row.get("email") or "",
+        password=password_hash,
+        is_active=True,
+    )
+
+
+def exclude_existing(users: list[User]) -> list[User]:
+    """이미 있는 username과 배치 안에서 중복된 username(첫 번째만 남김)을 뺍니다."""
+    existing = set(
+        User.objects.filter(username__in=[user.username for user in users]).values_list(
+            "username", flat=True
+        )
+    )
+    new_users: dict[str, User] = {}
+    for user in users:
+        if user.username not in existing:
+            new_users.setdefault(user.username, user)
+    return list(new_users.values())
+
+
+def write_tokens(token_file, users: list[User], lifetime: timedelta) -> int:
+    """이번에 생성한 사용자들의 ID를 한 번에 조회해 access 토큰을 JSONL로 기록합니다."""
+    # bulk_create가 PK를 채워 주지 않는 DB(MySQL)도 있으므로 username으로 다시 조회합니다.
+    ids = list(
+        User.objects.filter(username__in=[user.username for user in users]).values_list(
+            "username", "pk"
+        )
+    )
+    for username, pk in ids:
+        token = AccessToken.for_user(User(pk=pk, username=username))
+        token.set_exp(lifetime=lifetime)
+        token_file.write(json.dumps({"username": username, "access": str(token)}) + "\n")
+    return len(ids)
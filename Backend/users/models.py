@@ -1 +1,16 @@
-# Create your models here.
+from django.db import models
+
+
+class RevokedToken(models.Model):
+    """
+    로그아웃 등으로 폐기된 JWT의 jti.
+    토큰이 만료되면 더 이상 검사할 필요가 없으므로 expires_at이 지난 행은 정리합니다.
+    """
+
+    jti: str = models.CharField(max_length=64, primary_key=True)
+    expires_at = models.DateTimeField(db_index=True)
+    # 워커들이 이 시각 이후에 폐기된 토큰만 가져와 메모리 필터에 반영합니다.
+    revoked_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    def __str__(self) -> str:
+        return f"RevokedToken {self.jti}"
@@ -0,0 +1,84 @@
+# users/reservation_cache.py
+
+"""
+내 예약 목록 캐시 (MY_RESERVATIONS_CACHE)
+
+MyReservationsView의 응답을 사용자별로 Django 캐시에 보관하여, 예약이 바뀌지 않는 동안의
+반복 조회는 좌석 테이블을 조회하지 않습니다.
+
+- 예약/취소/초기화 시그널(seats_reserved, seats_released)이 커밋되면 해당 사용자의
+  세대(generation) 값을 새로 바꿉니다. 목록은 "사용자 + 세대" 키에 저장되므로 이전 세대의
+  목록은 더 이상 읽히지 않습니다.
+- 조회 전에 세대를 먼저 읽어 두므로, 조회 도중 무효화가 일어나도 오래된 목록은
+  이전 세대 키에 저장되어 다음 요청에 쓰이지 않습니다.
+- 복제본에서 읽은 목록은 복제 지연만큼 오래되었을 수 있으므로 REPLICA_MAX_LAG_SECONDS만 보관합니다.
+"""
+
+import uuid
+from collections.abc import Callable
+
+from django.conf import settings
+from django.core.cache import caches
+from django.dispatch import receiver
+
+from config.db_router import PRIMARY_DATABASE
+from seats import signals
+
+DEFAULT_CACHE = "default"
+DEFAULT_TIMEOUT = 60.0
+KEY_PREFIX = "my_reservations"
+
+
+def get_cache():
+    return caches[getattr(settings, "MY_RESERVATIONS_CACHE", DEFAULT_CACHE)]
+
+
+def get_or_load(user_id: int, load: Callable[[], list[dict]], database: str):
+    """
+    user_id의 예약 목록을 캐시에서 꺼냅니다. 없으면 load()로 조회한 뒤 저장합니다.
+    database는 load()가 읽는 DB로, 복제본이면 짧게만 보관합니다.
+    """
+    cache = get_cache()
+    key = _data_key(user_id, _generation(cache, user_id))
+    reservations = cache.get(key)
+    if reservations is None:
+        reservations = load()
+        cache.set(key, reservations, _timeout(database))
+    return reservations
+
+
+def invalidate(user_id: int | None) -> None:
+    """user_id의 예약 목록 캐시를 무효화합니다."""
+    if user_id is not None:
+        get_cache().set(_generation_key(user_id), uuid.uuid4().hex, None)
+
+
+def _generation(cache, user_id: int) -> str:
+    key = _generation_key(user_id)
+    generation = cache.get(key)
+    if generation is None:
+        # 다른 요청이 먼저 만든 세대가 있으면 그 값을 사용합니다.
+        cache.add(key, uuid.uuid4().hex, None)
+        generation = cache.get(key)
+    return generation
+
+
+def _timeout(database: str) -> float:
+    timeout = getattr(settings, "MY_RESERVATIONS_CACHE_TIMEOUT", DEFAULT_TIMEOUT)
+    if database != PRIMARY_DATABASE:
+        timeout = min(timeout, getattr(settings, "REPLICA_MAX_LAG_SECONDS", 2.0))
+    return timeout
+
+
+def _generation_key(user_id: int) -> str:
+    return f"{KEY_PREFIX}:{user_id}:generation"
+
+
+def _data_key(user_id: int, generation: str) -> str:
+    return f"{KEY_PREFIX}:{user_id}:{generation}"
+
+
+@receiver(signals.seats_reserved, dispatch_uid="users.reservation_cache.reserved")
+@receiver(signals.seats_released, dispatch_uid="users.reservation_cache.released")
+def _on_seats_changed(sender, user_id=None, **kwargs):
+    invalidate(user_id)
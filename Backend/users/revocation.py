@@ -0,0 +1,197 @@
+# users/revocation.py
+
+"""
+JWT 폐기(로그아웃) 목록
+
+폐기한 토큰의 jti는 RevokedToken 테이블에 토큰 만료 시각까지 보관합니다.
+인증할 때마다 이 테이블을 조회하지 않도록, 워커마다 폐기된 jti의 블룸 필터를 메모리에 둡니다.
+
+- 필터에 없는 jti는 폐기되지 않은 것이 확실하므로 DB를 조회하지 않습니다. (대부분의 요청)
+- 필터에 있다고 나온 jti만 DB에서 정확히 확인합니다. (폐기된 토큰 또는 드문 오탐)
+- 다른 워커에서 폐기한 토큰은 TOKEN_REVOCATION_SYNC_INTERVAL마다 새로 추가된 행만 가져와 반영합니다.
+  따라서 다른 워커에서는 폐기가 최대 이 시간만큼 늦게 적용됩니다.
+- 블룸 필터는 항목을 지울 수 없으므로 TOKEN_REVOCATION_REBUILD_INTERVAL마다 만료된 행을 정리하고
+  남은 jti로 필터를 다시 만듭니다.
+"""
+
+import hashlib
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from config.db_router import PRIMARY_DATABASE
+
+from .models import RevokedToken
+
+DEFAULT_CAPACITY = 100_000
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+DEFAULT_SYNC_INTERVAL = 1.0
+DEFAULT_REBUILD_INTERVAL = 3600.0
+# 커밋이 늦게 끝난 행을 놓치지 않도록 동기화 구간을 이만큼 겹쳐서 조회합니다.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+
+class BloomFilter:
+    """
+    capacity개의 항목을 false_positive_rate 이하의 오탐률로 담는 블룸 필터.
+    해시 한 번(blake2b)의 결과를 두 값으로 나누어 k개의 위치를 만듭니다. (double hashing)
+    """
+
+    def __init__(self, capacity: int, false_positive_rate: float):
+        capacity = max(capacity, 1)
+        self.size = max(
+            8,
+            math.ceil(-capacity * math.log(false_positive_rate) / math.log(2) ** 2),
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item)
+        )
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+
+class RevocationFilter:
+    """워커별 폐기 토큰 필터. 주기적으로 DB의 새 폐기 목록을 반영합니다."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        rebuild_interval: float = DEFAULT_REBUILD_INTERVAL,
+    ):
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.sync_interval = sync_interval
+        self.rebuild_interval = rebuild_interval
+        self._bloom: BloomFilter | None = None
+        self._synced_at = 0.0
+        self._built_at = 0.0
+        self._cursor: datetime | None = None
+        self._lock = threading.Lock()
+
+    def is_revoked(self, jti: str) -> bool:
+        self._refresh()
+        if jti not in self._bloom:
+            return False
+        return RevokedToken.objects.using(PRIMARY_DATABASE).filter(jti=jti).exists()
+
+    def add(self, jti: str) -> None:
+        """이 워커에서 폐기한 토큰을 동기화를 기다리지 않고 바로 반영합니다."""
+        if self._bloom is not None:
+            self._bloom.add(jti)
+
+    def _refresh(self) -> None:
+        now = time.monotonic()
+        if self._bloom is not None and now - self._synced_at < self.sync_interval:
+            return
+        with self._lock:
+            if self._bloom is None or now - self._built_at >= self.rebuild_interval:
+                self._rebuild()
+            elif now - self._synced_at >= self.sync_interval:
+                self._sync()
+            self._synced_at = now
+
+    def _rebuild(self) -> None:
+        revoked = RevokedToken.objects.using(PRIMARY_DATABASE)
+        now = timezone.now()
+        revoked.filter(expires_at__lte=now).delete()
+        live = revoked.filter(expires_at__gt=now)
+        bloom = BloomFilter(max(self.capacity, live.count() * 2), self.false_positive_rate)
+        for jti in live.values_list("jti", flat=True).iterator(chunk_size=5000):
+            bloom.add(jti)
+        self._bloom = bloom
+        self._cursor = now
+        self._built_at = time.monotonic()
+
+    def _sync(self) -> None:
+        now = timezone.now()
+        recent = RevokedToken.objects.using(PRIMARY_DATABASE).filter(
+            revoked_at__gte=self._cursor - SYNC_OVERLAP
+        )
+        for jti in recent.values_list("jti", flat=True):
+            self._bloom.add(jti)
+        self._cursor = now
+
+
+def revoke(jti: str, expires_at: datetime) -> None:
+    """토큰을 폐기합니다. 이미 만료된 토큰은 기록하지 않습니다."""
+    if expires_at <= timezone.now():
+        return
+    RevokedToken.objects.using(PRIMARY_DATABASE).get_or_create(
+        jti=jti, defaults={"expires_at": expires_at}
+    )
+    get_filter().add(jti)
+
+
+def revoke_token(token) -> None:
+    """simplejwt 토큰(AccessToken, RefreshToken)을 폐기합니다."""
+    revoke(token[api_settings.JTI_CLAIM], datetime_from_epoch(token["exp"]))
+
+
+def is_revoked(token) -> bool:
+    jti = token.get(api_settings.JTI_CLAIM)
+    return jti is not None and get_filter().is_revoked(jti)
+
+
+_filter: RevocationFilter | None = None
+_filter_lock = threading.Lock()
+
+
+def get_filter() -> RevocationFilter:
+    global _filter
+    if _filter is None:
+        with _filter_lock:
+            if _filter is None:
+                _filter = RevocationFilter(
+                    capacity=getattr(settings, "TOKEN_REVOCATION_CAPACITY", DEFAULT_CAPACITY),
+                    false_positive_rate=getattr(
+                        settings,
+                        "TOKEN_REVOCATION_FALSE_POSITIVE_RATE",
+                        DEFAULT_FALSE_POSITIVE_RATE,
+                    ),
+                    sync_interval=getattr(
+                        settings,
+                        "TOKEN_REVOCATION_SYNC_INTERVAL",
+                        DEFAULT_SYNC_INTERVAL,
+                    ),
+                    rebuild_interval=getattr(
+                        settings,
+                        "TOKEN_REVOCATION_REBUILD_INTERVAL",
+                        DEFAULT_REBUILD_INTERVAL,
+                    ),
+                )
+    return _filter
+
+
+def reset() -> None:
+    global _filter
+    with _filter_lock:
+        _filter = None
+
+
+@receiver(setting_changed, dispatch_uid="users.revocation.setting_changed")
+def _on_setting_changed(sender, setting, **kwargs):
+    if setting.startswith("TOKEN_REVOCATION"):
+        reset()
@@ -1,8 +1,29 @@
 # users/tests.py
 
+import json
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from seats import reset_jobs, signals
+from seats.models import ReservationEvent, Seat, SeatResetJob
+
+from . import reservation_cache, revocation
+from .models import RevokedToken
 
 
 class UserAuthAPITests(APITestCase):
@@ -65,3 +86,427 @@ class UserAuthAPITests(APITestCase):
 
         # Assert
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class ProvisionUsersCommandTests(APITestCase):
+    """사용자 일괄 생성 명령 테스트"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp = Path(tmp.name)
+
+    def test_csv_with_plain_and_prehashed_passwords(self):
+        """평문/미리 해싱된 비밀번호를 모두 받아 배치로 생성하는지 테스트"""
+        # Arrange
+        source = self.tmp / "users.csv"
+        source.write_text(
+            "username,password,password_hash\n"
+            "load_1,password123,\n"
+            f"load_2,,{make_password('hashed-pass')}\n"
+            "load_3,password123,\n"
+        )
+
+        # Act
+        out = StringIO()
+        call_command("provision_users", str(source), "--batch-size", "2", stdout=out)
+
+        # Assert
+        self.assertIn("사용자 3명", out.getvalue())
+        self.assertTrue(User.objects.get(username="load_1").check_password("password123"))
+        self.assertTrue(User.objects.get(username="load_2").check_password("hashed-pass"))
+
+    @override_settings(DEBUG=True)
+    def test_jsonl_with_tokens(self):
+        """JSONL 입력으로 생성하고, 로그인 없이 쓸 수 있는 access 토큰을 저장하는지 테스트"""
+        # Arrange
+        source = self.tmp / "users.jsonl"
+        source.write_text(
+            '{"username": "token_1", "password": "password123"}\n'
+            '{"username": "token_2", "password": "password123"}\n'
+        )
+        tokens = self.tmp / "tokens.jsonl"
+
+        # Act
+        call_command(
+            "provision_users",
+            str(source),
+            "--tokens-out",
+            str(tokens),
+            stdout=StringIO(),
+        )
+
+        # Assert: 저장된 토큰으로 바로 인증된 API를 호출할 수 있습니다.
+        lines = [json.loads(line) for line in tokens.read_text().splitlines()]
+        self.assertEqual(sorted(line["username"] for line in lines), ["token_1", "token_2"])
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {lines[0]['access']}")
+        response = self.client.get("/api/users/me/reservations/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(DEBUG=True)
+    def test_skip_existing_writes_tokens_only_for_created_users(self):
+        """--skip-existing으로 건너뛴 기존 사용자의 토큰은 저장하지 않는지 테스트"""
+        # Arrange
+        User.objects.create_user(username="existing_1", password="password123")
+        source = self.tmp / "users.jsonl"
+        source.write_text(
+            '{"username": "existing_1", "password": "x"}\n'
+            '{"username": "new_1", "password": "password123"}\n'
+            '{"username": "new_1", "password": "duplicate"}\n'
+        )
+        tokens = self.tmp / "tokens.jsonl"
+
+        # Act
+        out = StringIO()
+        call_command(
+            "provision_users",
+            str(source),
+            "--skip-existing",
+            "--tokens-out",
+            str(tokens),
+            stdout=out,
+        )
+
+        # Assert
+        lines = [json.loads(line) for line in tokens.read_text().splitlines()]
+        self.assertEqual([line["username"] for line in lines], ["new_1"])
+        self.assertIn("사용자 1명", out.getvalue())
+        self.assertTrue(User.objects.get(username="new_1").check_password("password123"))
+
+    def test_rejects_invalid_input(self):
+        """중복 username, 알 수 없는 해시 형식, DEBUG가 아닌 토큰 발급을 거부하는지 테스트"""
+        User.objects.create_user(username="exists", password="password123")
+        source = self.tmp / "users.jsonl"
+
+        source.write_text('{"username": "exists", "password": "x"}\n')
+        with self.assertRaises(CommandError):
+            call_command("provision_users", str(source), stdout=StringIO())
+        call_command("provision_users", str(source), "--skip-existing", stdout=StringIO())
+        self.assertEqual(User.objects.filter(username="exists").count(), 1)
+
+        source.write_text('{"username": "bad_hash", "password_hash": "not-a-hash"}\n')
+        with self.assertRaises(CommandError):
+            call_command("provision_users", str(source), stdout=StringIO())
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "provision_users",
+                str(source),
+                "--tokens-out",
+                str(self.tmp / "tokens.jsonl"),
+                stdout=StringIO(),
+            )
+        self.assertFalse(User.objects.filter(username="bad_hash").exists())
+
+
+@override_settings(MY_RESERVATIONS_CACHE_TIMEOUT=60)
+class MyReservationsCacheTests(APITestCase):
+    """내 예약 목록 캐시 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="cache_user", password="password123")
+
+    def setUp(self):
+        reservation_cache.get_cache().clear()
+        self.client.force_authenticate(user=self.user)
+        patcher = mock.patch("seats.views.faults.inject", return_value=False)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def my_seat_numbers(self):
+        response = self.client.get("/api/users/me/reservations/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [seat["seat_number"] for seat in response.data]
+
+    def test_repeat_reads_cost_no_queries(self):
+        """예약이 바뀌지 않으면 두 번째 조회부터 DB를 조회하지 않는지 테스트"""
+        # Arrange
+        Seat.objects.filter(seat_number=1).update(is_reserved=True, reserved_by=self.user)
+        self.assertEqual(self.my_seat_numbers(), [1])
+
+        # Act & Assert
+        with self.assertNumQueries(0):
+            self.assertEqual(self.my_seat_numbers(), [1])
+
+    def test_reserve_and_cancel_invalidate(self):
+        """예약/취소가 커밋되면 다음 조회에 바로 반영되는지 테스트"""
+        # Arrange: 빈 목록을 캐시에 채워 둡니다.
+        self.assertEqual(self.my_seat_numbers(), [])
+
+        # Act & Assert
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/seats/reserve/", {"seat_number": 2}, format="json")
+        self.assertEqual(self.my_seat_numbers(), [2])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete("/api/seats/2/cancel/")
+        self.assertEqual(self.my_seat_numbers(), [])
+
+    def test_reset_invalidates(self):
+        """좌석 초기화가 예약했던 사용자의 캐시를 무효화하는지 테스트"""
+        # Arrange
+        Seat.objects.filter(seat_number__in=[3, 4]).update(is_reserved=True, reserved_by=self.user)
+        self.assertEqual(self.my_seat_numbers(), [3, 4])
+        job = SeatResetJob.objects.create(chunk_size=5, max_seat_number=9)
+
+        # Act
+        with self.captureOnCommitCallbacks(execute=True):
+            reset_jobs.run_job(job.pk)
+
+        # Assert
+        self.assertEqual(self.my_seat_numbers(), [])
+
+    def test_stale_load_is_not_served_after_invalidation(self):
+        """조회 도중 무효화되면 그 조회 결과를 다음 요청에 쓰지 않는지 테스트"""
+
+        # Arrange: 조회하는 사이에 다른 요청이 예약을 바꾼 상황을 흉내 냅니다.
+        def load():
+            reservation_cache.invalidate(self.user.pk)
+            return [{"seat_number": 99}]
+
+        # Act
+        stale = reservation_cache.get_or_load(self.user.pk, load, "default")
+
+        # Assert
+        self.assertEqual(stale, [{"seat_number": 99}])
+        self.assertEqual(self.my_seat_numbers(), [])
+
+    def test_file_backend(self):
+        """파일 기반 캐시에서도 저장과 무효화가 동작하는지 테스트"""
+        with tempfile.TemporaryDirectory() as location:
+            caches = {
+                "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"},
+                "reservations": {
+                    "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+                    "LOCATION": location,
+                },
+            }
+            with override_settings(CACHES=caches):
+                Seat.objects.filter(seat_number=5).update(is_reserved=True, reserved_by=self.user)
+                self.assertEqual(self.my_seat_numbers(), [5])
+                with self.assertNumQueries(0):
+                    self.assertEqual(self.my_seat_numbers(), [5])
+
+                Seat.objects.filter(seat_number=5).update(is_reserved=False, reserved_by=None)
+                reservation_cache.invalidate(self.user.pk)
+                self.assertEqual(self.my_seat_numbers(), [])
+
+
+class LogoutTests(APITestCase):
+    """로그아웃(토큰 폐기) 테스트"""
+
+    user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="logout_user", password="password123")
+
+    def setUp(self):
+        revocation.reset()
+        response = self.client.post(
+            "/api/users/login/",
+            {"username": "logout_user", "password": "password123"},
+            format="json",
+        )
+        self.access = response.data["access"]
+        self.refresh = response.data["refresh"]
+
+    def authenticate(self, access):
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {access}")
+
+    def test_logout_revokes_access_token(self):
+        """로그아웃한 access 토큰으로는 더 이상 인증되지 않는지 테스트"""
+        # Arrange
+        self.authenticate(self.access)
+        self.assertEqual(
+            self.client.get("/api/users/me/reservations/").status_code,
+            status.HTTP_200_OK,
+        )
+
+        # Act
+        response = self.client.post("/api/users/logout/", {"refresh": self.refresh}, format="json")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(RevokedToken.objects.count(), 2)
+        self.assertEqual(
+            self.client.get("/api/users/me/reservations/").status_code,
+            status.HTTP_401_UNAUTHORIZED,
+        )
+
+    def test_valid_token_skips_revocation_table(self):
+        """폐기되지 않은 토큰은 폐기 테이블을 조회하지 않고 인증되는지 테스트"""
+        # Arrange: 필터를 만든 뒤에는 동기화 주기 전까지 DB를 조회하지 않습니다.
+        self.authenticate(self.access)
+        self.client.get("/api/users/me/reservations/")
+
+        # Act
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get("/api/users/me/reservations/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in ctx.captured_queries if "users_revokedtoken" in q["sql"]])
+
+    @override_settings(TOKEN_REVOCATION_SYNC_INTERVAL=0)
+    def test_revocation_from_other_worker_is_synced(self):
+        """다른 워커에서 폐기한 토큰이 동기화 후 거부되는지 테스트"""
+        # Arrange: 이 워커의 필터를 만든 뒤, 다른 워커가 DB에만 폐기를 기록한 상황입니다.
+        self.authenticate(self.access)
+        self.client.get("/api/users/me/reservations/")
+        token = AccessToken(self.access)
+        RevokedToken.objects.create(
+            jti=token["jti"], expires_at=timezone.now() + timedelta(minutes=5)
+        )
+
+        # Act
+        response = self.client.get("/api/users/me/reservations/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_rejects_refresh_token_of_another_user(self):
+        """다른 사용자의 refresh 토큰은 폐기하지 않는지 테스트"""
+        other = User.objects.create_user(username="logout_other", password="x")
+        self.authenticate(self.access)
+
+        response = self.client.post(
+            "/api/users/logout/",
+            {"refresh": str(RefreshToken.for_user(other))},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(RevokedToken.objects.exists())
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        """블룸 필터가 추가한 항목을 모두 포함하고, 오탐률이 설정 수준인지 테스트"""
+        bloom = revocation.BloomFilter(capacity=1000, false_positive_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"revoked-{i}")
+
+        self.assertTrue(all(f"revoked-{i}" in bloom for i in range(1000)))
+        false_positives = sum(f"valid-{i}" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+class ReservationHistoryTests(APITestCase):
+    """사용자별 예약 이력(키셋 페이지네이션) 테스트"""
+
+    user: User
+    other_user: User
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="history_user", password="password123")
+        cls.other_user = User.objects.create_user(username="history_other", password="password123")
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+
+    def create_events(self, count: int, user: User | None = None):
+        """created_at이 모두 같은 이력을 만들어 id로 순서를 정하는 경우도 확인합니다."""
+        ReservationEvent.objects.bulk_create(
+            ReservationEvent(
+                user=user or self.user,
+                seat_number=seat_number,
+                action=ReservationEvent.Action.RESERVED,
+            )
+            for seat_number in range(1, count + 1)
+        )
+        ReservationEvent.objects.update(created_at=timezone.now())
+
+    def test_records_reserve_and_cancel(self):
+        """예약과 취소가 좌석 변경과 같은 트랜잭션에서 최신순 이력으로 남는지 테스트"""
+        # Arrange: 커밋 후 콜백을 실행하지 않아도 이력은 이미 기록되어 있어야 합니다.
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            self.client.post("/api/seats/reserve/", {"seat_number": 3}, format="json")
+            self.client.delete("/api/seats/3/cancel/")
+
+        # Act
+        response = self.client.get("/api/users/me/reservations/history/")
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIsNone(response.data["next"])
+        self.assertEqual(
+            [(event["seat_number"], event["action"]) for event in response.data["results"]],
+            [(3, "released"), (3, "reserved")],
+        )
+        self.assertEqual(set(response.data["results"][0]), {"seat_number", "action", "created_at"})
+
+    @override_settings(SEAT_MAX_PER_USER=0)
+    def test_rolled_back_reservation_not_recorded(self):
+        """예약 상한으로 되돌려진 예약은 이력에도 남지 않는지 테스트"""
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            response = self.client.post("/api/seats/reserve/", {"seat_number": 3}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(ReservationEvent.objects.exists())
+
+    def test_failing_receiver_does_not_fail_reservation(self):
+        """커밋 후 시그널 수신자가 실패해도 예약은 성공으로 응답하고 이력이 남는지 테스트"""
+
+        # Arrange
+        def broken_receiver(sender, **kwargs):
+            raise RuntimeError("receiver failed")
+
+        signals.seats_reserved.connect(broken_receiver, dispatch_uid="broken")
+        self.addCleanup(signals.seats_reserved.disconnect, dispatch_uid="broken")
+
+        # Act
+        with mock.patch("seats.views.faults.inject", return_value=False):
+            with self.assertLogs("seats.signals", level="ERROR"):
+                with self.captureOnCommitCallbacks(execute=True):
+                    response = self.client.post(
+                        "/api/seats/reserve/", {"seat_number": 3}, format="json"
+                    )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(Seat.objects.get(seat_number=3).is_reserved)
+        self.assertEqual(
+            list(ReservationEvent.objects.values_list("seat_number", "action")),
+            [(3, "reserved")],
+        )
+
+    def test_cursor_pages_through_history(self):
+        """커서로 모든 이력을 중복/누락 없이 최신순으로 읽고, 페이지마다 쿼리 한 번인지 테스트"""
+        # Arrange
+        self.create_events(5)
+        self.create_events(3, user=self.other_user)
+
+        # Act
+        seat_numbers = []
+        url = "/api/users/me/reservations/history/?limit=2"
+        pages = 0
+        while url:
+            with self.assertNumQueries(1):
+                response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            seat_numbers += [event["seat_number"] for event in response.data["results"]]
+            url = response.data["next"]
+            pages += 1
+
+        # Assert: created_at이 같으면 id가 큰(나중에 만든) 이력이 먼저입니다.
+        self.assertEqual(seat_numbers, [5, 4, 3, 2, 1])
+        self.assertEqual(pages, 3)
+
+    def test_invalid_cursor(self):
+        """잘못된 커서는 404를 반환하는지 테스트"""
+        response = self.client.get(
+            "/api/users/me/reservations/history/", {"cursor": "not-a-cursor"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_requires_authentication(self):
+        """로그인하지 않으면 이력을 조회할 수 없는지 테스트"""
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get("/api/users/me/reservations/history/")
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
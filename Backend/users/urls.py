@@ -2,10 +2,22 @@
 
 from django.urls import path
 
-from .views import LoginView, MyReservationsView, SignupView
+from .views import (
+    LoginView,
+    LogoutView,
+    MyReservationHistoryView,
+    MyReservationsView,
+    SignupView,
+)
 
 urlpatterns = [
     path("signup/", SignupView.as_view(), name="signup"),
     path("login/", LoginView.as_view(), name="login"),
+    path("logout/", LogoutView.as_view(), name="logout"),
     path("me/reservations/", MyReservationsView.as_view(), name="my-reservations"),
+    path(
+        "me/reservations/history/",
+        MyReservationHistoryView.as_view(),
+        name="my-reservation-history",
+    ),
 ]
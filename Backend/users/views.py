@@ -2,16 +2,22 @@
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
-from drf_spectacular.utils import OpenApiExample, extend_schema
 from rest_framework import generics, status
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
-from seats.models import Seat
-from seats.serializers import SeatSerializer
+from config.db_router import PRIMARY_DATABASE, ReplicaReadMixin, get_read_database
+from config.schema import OpenApiExample, extend_schema
+from seats import sharding
+from seats.models import ReservationEvent, Seat
+from seats.serializers import ReservationEventSerializer, SeatSerializer
 
+from . import reservation_cache, revocation
+from .pagination import KeysetPagination
 from .serializers import UserSerializer
 
 
@@ -92,9 +98,48 @@ class LoginView(APIView):
             return Response({"error": "Invalid credentials"}, status=status.HTTP_401_UNAUTHORIZED)
 
 
-class MyReservationsView(generics.ListAPIView):
+# 3. 로그아웃 View
+class LogoutView(APIView):
+    """
+    현재 access 토큰(과 함께 보낸 refresh 토큰)을 폐기합니다.
+    폐기된 토큰은 만료 시각까지 모든 인증 요청에서 거부됩니다.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    @extend_schema(
+        request=None,
+        summary="User Logout",
+        description="현재 access 토큰과 body의 refresh 토큰(선택)을 폐기합니다.",
+    )
+    def post(self, request):
+        refresh = None
+        if request.data.get("refresh"):
+            try:
+                refresh = RefreshToken(request.data["refresh"])
+            except TokenError:
+                return Response(
+                    {"error": "Invalid refresh token"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            # simplejwt 버전에 따라 사용자 ID가 문자열로 들어 있으므로 문자열로 비교합니다.
+            if str(refresh.get(api_settings.USER_ID_CLAIM)) != str(request.user.pk):
+                return Response(
+                    {"error": "Refresh token belongs to another user"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+        revocation.revoke_token(request.auth)
+        if refresh is not None:
+            revocation.revoke_token(refresh)
+        return Response({"message": "Logout successful"})
+
+
+class MyReservationsView(ReplicaReadMixin, generics.ListAPIView):
     """
     현재 로그인된 사용자의 예매 좌석 목록을 반환합니다.
+    - 복제본에서 조회하되, 방금 예약/취소한 사용자는 primary에서 조회합니다.
+    - 조회 결과는 사용자별로 캐시하고, 예약이 바뀌면 무효화합니다. (reservation_cache 참고)
     """
 
     # 응답 데이터를 어떻게 직렬화할지 지정합니다. (SeatSerializer 재사용)
@@ -115,3 +160,45 @@ class MyReservationsView(generics.ListAPIView):
         user = self.request.user
         assert isinstance(user, User)
         return Seat.objects.filter(reserved_by=user).order_by("seat_number")
+
+    def list(self, request, *args, **kwargs):
+        reservations = reservation_cache.get_or_load(
+            request.user.pk,
+            self.load_reservations,
+            get_read_database() or PRIMARY_DATABASE,
+        )
+        return Response(reservations)
+
+    def load_reservations(self):
+        # 좌석은 여러 샤드에 나뉘어 있으므로 모든 샤드에서 조회하여 합칩니다.
+        seats = sharding.merge_by_seat_number(self.get_queryset())
+        serializer = self.get_serializer(seats, many=True)
+        # 캐시에 저장할 수 있도록 serializer를 참조하지 않는 dict 목록으로 바꿉니다.
+        return [dict(seat) for seat in serializer.data]
+
+
+class MyReservationHistoryView(ReplicaReadMixin, generics.ListAPIView):
+    """
+    현재 로그인된 사용자의 예약/해제 이력을 최신순으로 반환합니다.
+    - (user, created_at, id) 인덱스를 따라 커서로 다음 페이지를 읽습니다. (limit 최대 200)
+    - 응답의 next가 null이면 마지막 페이지입니다.
+    """
+
+    serializer_class = ReservationEventSerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = KeysetPagination
+
+    @extend_schema(
+        summary="My Reservation History",
+        description=(
+            "현재 인증된 사용자의 좌석 예약/해제 이력을 최신순으로 조회합니다. "
+            "다음 페이지는 응답의 next(cursor 파라미터)로 요청합니다."
+        ),
+    )
+    def get(self, request, *args, **kwargs):
+        return super().get(request, *args, **kwargs)
+
+    def get_queryset(self):
+        return ReservationEvent.objects.filter(user=self.request.user).only(
+            "seat_number", "action", "created_at"
+        )